@@ -3,13 +3,14 @@ Check Budget Skill - Verifies department budget availability
 """
 import sys
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from backend.skill_base import BaseSkill, SkillInput, SkillOutput, SkillStatus
+from backend.skill_base import BaseSkill, SkillInput, SkillOutput, SkillStatus, get_shared_skill
 from backend.security.audit_logger import get_audit_logger, AuditEventType
+from backend.budget_ledger import BudgetLedger, from_cents, to_cents, get_budget_ledger
 from pydantic import Field, ValidationError
 
 
@@ -17,22 +18,20 @@ class CheckBudgetSkill(BaseSkill):
     """
     Checks if a department has sufficient budget for a requested amount.
     
-    Input: department_id (str), amount (float)
-    Output: approved (bool), remaining_budget (float)
+    Input: department_id (str), amount (float), reserve (bool, default False),
+        ttl_seconds (number, optional), reservation_id (str, optional)
+    Output: approved (bool), remaining_budget (float); with reserve, the
+        approved amount is held in the budget ledger and reservation_id /
+        expires_at identify the reservation to commit or release
+    
+    execute_many() checks a whole batch of lines with running totals per
+    department in arrival order (see BudgetLedger.check_many()).
     """
     
-    def __init__(self):
+    def __init__(self, ledger: Optional[BudgetLedger] = None):
         super().__init__("check_budget")
         self.audit_logger = get_audit_logger()
-        
-        # Mock budget data
-        self.budgets = {
-            "IT": 50000,
-            "HR": 10000,
-            "Marketing": 20000,
-            "Operations": 35000,
-            "Finance": 25000
-        }
+        self.ledger = ledger or get_budget_ledger()
     
     def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """Validate required fields: department_id, amount"""
@@ -50,6 +49,13 @@ class CheckBudgetSkill(BaseSkill):
         if not isinstance(input_data["amount"], (int, float)):
             raise ValueError("amount must be a number")
         
+        if input_data.get("reserve"):
+            if input_data["amount"] <= 0:
+                raise ValueError("amount must be positive to reserve it")
+            ttl = input_data.get("ttl_seconds")
+            if ttl is not None and (not isinstance(ttl, (int, float)) or ttl <= 0):
+                raise ValueError("ttl_seconds must be a positive number")
+        
         return True
     
     def _execute_logic(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -57,18 +63,23 @@ class CheckBudgetSkill(BaseSkill):
         department_id = input_data["department_id"]
         amount = input_data["amount"]
         
-        # Get current budget
-        current_budget = self.budgets.get(department_id, 0)
+        if not self.ledger.has_account(department_id):
+            return self._unknown_department(department_id)
         
-        if current_budget == 0:
-            return {
-                "approved": False,
-                "remaining_budget": 0,
-                "error": f"Department {department_id} not found or has no budget"
-            }
-        
-        approved = current_budget >= amount
-        remaining = current_budget - amount if approved else current_budget
+        reservation = None
+        if input_data.get("reserve"):
+            # Hold the money so a concurrent request cannot pass against it too
+            reservation = self.ledger.reserve(
+                department_id, amount,
+                ttl_seconds=input_data.get("ttl_seconds"),
+                reservation_id=input_data.get("reservation_id")
+            )
+            approved = reservation is not None
+            remaining = self.ledger.balance(department_id)["available"]
+        else:
+            available = self.ledger.balance(department_id)["available"]
+            approved = available >= amount
+            remaining = available - amount if approved else available
         
         # Log to audit
         try:
@@ -77,23 +88,158 @@ class CheckBudgetSkill(BaseSkill):
                 user_id="system",
                 resource_type="budget",
                 resource_id=department_id,
-                action="check",
+                action="reserve" if input_data.get("reserve") else "check",
                 details={
                     "department": department_id,
                     "requested_amount": amount,
                     "approved": approved,
-                    "remaining_budget": remaining
+                    "remaining_budget": remaining,
+                    "reservation_id": reservation.id if reservation is not None else None
                 }
             )
         except Exception as e:
             self.logger.warning(f"Failed to log budget check: {str(e)}")
         
-        return {
+        result = {
             "approved": approved,
             "remaining_budget": remaining,
             "department_id": department_id,
             "requested_amount": amount
         }
+        if reservation is not None:
+            result["reservation_id"] = reservation.id
+            result["expires_at"] = reservation.expires_at
+        return result
+    
+    def _execute_batch(self, inputs: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Check a batch of lines (e.g. month-end reconciliation or an import)
+        
+        Lines count against their department's balance in arrival order: a
+        line fits if the department can afford it together with every
+        earlier line that fit. Runs of check lines are vectorized; a line
+        that asks for a reservation splits the batch there and is held in
+        the ledger before the lines after it are checked. One summarized
+        audit event covers the whole batch.
+        """
+        results: List[Any] = [None] * len(inputs)
+        # Cents taken per department by earlier check lines that fit
+        spent: Dict[str, int] = {}
+        summary: Dict[str, Dict[str, Any]] = {}
+        unknown = set()
+        reservations = []
+        segment: List[int] = []
+        
+        def record(index: int, result: Dict[str, Any]):
+            results[index] = result
+            department_id = inputs[index]["department_id"]
+            if "error" in result:
+                unknown.add(department_id)
+                return
+            amount = result["requested_amount"]
+            totals = summary.setdefault(
+                department_id, {"lines": 0, "approved": 0, "requested_amount": 0, "approved_amount": 0}
+            )
+            totals["lines"] += 1
+            totals["requested_amount"] += amount
+            if result["approved"]:
+                totals["approved"] += 1
+                totals["approved_amount"] += amount
+            totals["remaining_budget"] = result["remaining_budget"]
+        
+        def check_segment():
+            if not segment:
+                return
+            departments = [inputs[index]["department_id"] for index in segment]
+            amounts = [inputs[index]["amount"] for index in segment]
+            known, fits, remaining = (
+                array.tolist() for array in self.ledger.check_many(departments, amounts, spent)
+            )
+            for position, index in enumerate(segment):
+                department_id, amount = departments[position], amounts[position]
+                if not known[position]:
+                    record(index, self._unknown_department(department_id))
+                    continue
+                if fits[position]:
+                    spent[department_id] = spent.get(department_id, 0) + to_cents(amount)
+                record(index, {
+                    "approved": fits[position],
+                    "remaining_budget": from_cents(remaining[position]),
+                    "department_id": department_id,
+                    "requested_amount": amount
+                })
+            segment.clear()
+        
+        for index, input_data in enumerate(inputs):
+            if not input_data.get("reserve"):
+                segment.append(index)
+                continue
+            check_segment()
+            department_id = input_data["department_id"]
+            if not self.ledger.has_account(department_id):
+                record(index, self._unknown_department(department_id))
+                continue
+            held = spent.get(department_id, 0)
+            reservation = None
+            # Earlier check lines that fit come first, so the reservation must leave room for them
+            if to_cents(self.ledger.balance(department_id)["available"]) - held >= to_cents(input_data["amount"]):
+                try:
+                    reservation = self.ledger.reserve(
+                        department_id, input_data["amount"],
+                        ttl_seconds=input_data.get("ttl_seconds"),
+                        reservation_id=input_data.get("reservation_id")
+                    )
+                except Exception as e:
+                    results[index] = e
+                    continue
+            result = {
+                "approved": reservation is not None,
+                "remaining_budget": from_cents(to_cents(self.ledger.balance(department_id)["available"]) - held),
+                "department_id": department_id,
+                "requested_amount": input_data["amount"]
+            }
+            if reservation is not None:
+                result["reservation_id"] = reservation.id
+                result["expires_at"] = reservation.expires_at
+                reservations.append(reservation.id)
+            record(index, result)
+        check_segment()
+        
+        for totals in summary.values():
+            totals["requested_amount"] = round(totals["requested_amount"], 2)
+            totals["approved_amount"] = round(totals["approved_amount"], 2)
+        
+        # Log to audit: one event for the whole batch
+        try:
+            lines = [result for result in results if isinstance(result, dict)]
+            approved_lines = sum(1 for result in lines if result["approved"])
+            self.audit_logger.log_event(
+                event_type=AuditEventType.BUDGET_CHECKED,
+                user_id="system",
+                resource_type="budget",
+                resource_id="batch",
+                action="check_batch",
+                details={
+                    "lines": len(lines),
+                    "approved": approved_lines,
+                    "rejected": len(lines) - approved_lines,
+                    "unknown_departments": sorted(unknown),
+                    "reservation_ids": reservations,
+                    "departments": summary
+                }
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to log budget batch check: {str(e)}")
+        
+        return results
+    
+    @staticmethod
+    def _unknown_department(department_id: str) -> Dict[str, Any]:
+        return {
+            "approved": False,
+            "remaining_budget": 0,
+            "error": f"Department {department_id} not found or has no budget"
+        }
 
 
 # Backward compatibility wrapper
@@ -108,7 +254,7 @@ def check_budget(department_id: str, amount: float) -> Dict[str, Any]:
     Returns:
         Dictionary with approved status and remaining budget
     """
-    skill = CheckBudgetSkill()
+    skill = get_shared_skill("check_budget", CheckBudgetSkill)
     try:
         output = skill.execute({"department_id": department_id, "amount": amount})
         return output.dict() if hasattr(output, 'dict') else output
@@ -9,7 +9,7 @@ from typing import Dict, Any
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from backend.skill_base import BaseSkill, SkillInput, SkillOutput, SkillStatus
+from backend.skill_base import BaseSkill, SkillInput, SkillOutput, SkillStatus, get_shared_skill
 from backend.security.audit_logger import get_audit_logger, AuditEventType
 
 
@@ -21,6 +21,10 @@ class ExtractContractDataSkill(BaseSkill):
     Output: extracted_data (dict with vendor_name, tax_id, effective_date, etc.)
     """
     
+    # Regex scans over whole contracts: run on the executor's process pool
+    execution_profile = "cpu"
+    memoize = True
+    
     def __init__(self):
         super().__init__("extract_contract_data")
         self.audit_logger = get_audit_logger()
@@ -94,7 +98,18 @@ class ExtractContractDataSkill(BaseSkill):
         else:
             overall_confidence = 0
         
-        # Log to audit
+        result = {
+            "extracted_data": extracted_data,
+            "extraction_confidence": extraction_confidence,
+            "overall_confidence": overall_confidence,
+            "fields_count": len(extracted_data),
+            "success": len(extracted_data) > 0
+        }
+        self._audit_result(input_data, result)
+        return result
+    
+    def _audit_result(self, input_data: Dict[str, Any], result: Dict[str, Any], cache_hit: bool = False):
+        """Log the extraction to audit"""
         try:
             self.audit_logger.log_event(
                 event_type=AuditEventType.CONTRACT_DATA_EXTRACTED,
@@ -103,21 +118,14 @@ class ExtractContractDataSkill(BaseSkill):
                 resource_id="contract_data",
                 action="extract",
                 details={
-                    "fields_extracted": len(extracted_data),
-                    "overall_confidence": overall_confidence,
-                    "extracted_fields": list(extracted_data.keys())
+                    "fields_extracted": result["fields_count"],
+                    "overall_confidence": result["overall_confidence"],
+                    "extracted_fields": list(result["extracted_data"].keys()),
+                    "cache_hit": cache_hit
                 }
             )
         except Exception as e:
             self.logger.warning(f"Failed to log contract extraction: {str(e)}")
-        
-        return {
-            "extracted_data": extracted_data,
-            "extraction_confidence": extraction_confidence,
-            "overall_confidence": overall_confidence,
-            "fields_count": len(extracted_data),
-            "success": len(extracted_data) > 0
-        }
 
 
 # Backward compatibility wrapper
@@ -131,7 +139,7 @@ def extract_contract_data(contract_text: str) -> Dict[str, Any]:
     Returns:
         Dictionary with extracted data fields
     """
-    skill = ExtractContractDataSkill()
+    skill = get_shared_skill("extract_contract_data", ExtractContractDataSkill)
     try:
         output = skill.execute({"contract_text": contract_text})
         result_dict = output.dict() if hasattr(output, 'dict') else output
@@ -8,8 +8,9 @@ from typing import Dict, Any, List
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from backend.skill_base import BaseSkill, SkillInput, SkillOutput, SkillStatus
+from backend.skill_base import BaseSkill, SkillInput, SkillOutput, SkillStatus, get_shared_skill
 from backend.security.audit_logger import get_audit_logger, AuditEventType
+from backend.cache import stable_hash
 
 
 class PolicyCheckSkill(BaseSkill):
@@ -20,6 +21,8 @@ class PolicyCheckSkill(BaseSkill):
     Output: compliant (bool), violations (list)
     """
     
+    memoize = True
+    
     def __init__(self):
         super().__init__("policy_check")
         self.audit_logger = get_audit_logger()
@@ -28,6 +31,10 @@ class PolicyCheckSkill(BaseSkill):
         self.max_transaction_limit = 5000
         self.approved_vendors_only = True
     
+    def data_version(self) -> str:
+        """Policy thresholds version; changing a threshold invalidates memoized checks"""
+        return stable_hash([self.max_transaction_limit, self.approved_vendors_only])
+    
     def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """Validate required field: request_data"""
         if not input_data:
@@ -83,7 +90,20 @@ class PolicyCheckSkill(BaseSkill):
         
         compliant = len(violations) == 0
         
-        # Log to audit
+        result = {
+            "compliant": compliant,
+            "violations": violations,
+            "violations_count": len(violations),
+            "request_data_summary": {
+                "amount": amount,
+                "vendor_status": vendor_status
+            }
+        }
+        self._audit_result(input_data, result)
+        return result
+    
+    def _audit_result(self, input_data: Dict[str, Any], result: Dict[str, Any], cache_hit: bool = False):
+        """Log the policy check to audit"""
         try:
             self.audit_logger.log_event(
                 event_type=AuditEventType.POLICY_CHECKED,
@@ -92,24 +112,23 @@ class PolicyCheckSkill(BaseSkill):
                 resource_id="procurement_policy",
                 action="validate",
                 details={
-                    "compliant": compliant,
-                    "violations_count": len(violations),
-                    "violations": violations,
-                    "request_amount": amount
+                    "compliant": result["compliant"],
+                    "violations_count": result["violations_count"],
+                    "violations": result["violations"],
+                    "request_amount": result["request_data_summary"]["amount"],
+                    "cache_hit": cache_hit
                 }
             )
         except Exception as e:
             self.logger.warning(f"Failed to log policy check: {str(e)}")
+    
+    def _execute_batch(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Policy-check a batch of requests (e.g. an import) in one call
         
-        return {
-            "compliant": compliant,
-            "violations": violations,
-            "violations_count": len(violations),
-            "request_data_summary": {
-                "amount": amount,
-                "vendor_status": vendor_status
-            }
-        }
+        Audit events are buffered by execute_many() and written once.
+        """
+        return [self._execute_logic(input_data) for input_data in inputs]
 
 
 # Backward compatibility wrapper
@@ -123,7 +142,7 @@ def check_policy(request_data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dictionary with compliance status and violations list
     """
-    skill = PolicyCheckSkill()
+    skill = get_shared_skill("policy_check", PolicyCheckSkill)
     try:
         output = skill.execute({"request_data": request_data})
         return output.dict() if hasattr(output, 'dict') else output
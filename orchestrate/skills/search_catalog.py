@@ -3,37 +3,56 @@ Search Catalog Skill - Searches product catalog for items
 """
 import sys
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from backend.skill_base import BaseSkill, SkillInput, SkillOutput, SkillStatus
+from backend.skill_base import BaseSkill, SkillInput, SkillOutput, SkillStatus, get_shared_skill
 from backend.security.audit_logger import get_audit_logger, AuditEventType
+from backend.catalog_index import CatalogIndex, LiveCatalogIndex, get_catalog_index
 
 
 class SearchCatalogSkill(BaseSkill):
     """
     Searches the product catalog for items matching a query.
     
-    Input: query (str)
-    Output: results (list of matching items)
+    Input: query (str), operator ("and" | "or", default "and"), limit (int, default 20),
+        min_price / max_price (number, optional), category (str, optional)
+    Output: results (top matching items, best first), total_matches
+    
+    The catalog takes upserts and deletes while it serves searches
+    (upsert_items() / delete_items()); see LiveCatalogIndex.
     """
     
-    def __init__(self):
+    memoize = True
+    
+    def __init__(self, index: Optional[CatalogIndex] = None):
         super().__init__("search_catalog")
         self.audit_logger = get_audit_logger()
-        
-        # Mock catalog data
-        self.catalog = [
-            {"id": "1", "name": "Laptop", "price": 1200, "category": "Electronics"},
-            {"id": "2", "name": "Monitor", "price": 300, "category": "Electronics"},
-            {"id": "3", "name": "Keyboard", "price": 50, "category": "Accessories"},
-            {"id": "4", "name": "Mouse", "price": 25, "category": "Accessories"},
-            {"id": "5", "name": "Printer", "price": 400, "category": "Equipment"},
-            {"id": "6", "name": "Desk", "price": 150, "category": "Furniture"},
-            {"id": "7", "name": "Chair", "price": 200, "category": "Furniture"},
-        ]
+        index = index if index is not None else get_catalog_index()
+        self.index = index if isinstance(index, LiveCatalogIndex) else LiveCatalogIndex(index)
+    
+    @property
+    def catalog(self) -> List[Dict[str, Any]]:
+        """Indexed catalog items"""
+        return self.index.items
+    
+    def data_version(self) -> str:
+        """Catalog version; any catalog change invalidates memoized searches"""
+        return self.index.version
+    
+    def set_catalog(self, items: List[Dict[str, Any]]):
+        """Replace the catalog with a freshly indexed one"""
+        self.index = LiveCatalogIndex(CatalogIndex(items))
+    
+    def upsert_items(self, items: List[Dict[str, Any]]):
+        """Add items, or update the items with the same ids, without reindexing the catalog"""
+        self.index.upsert(items)
+    
+    def delete_items(self, item_ids: List[str]):
+        """Remove items by id"""
+        self.index.delete(item_ids)
     
     def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """Validate required field: query"""
@@ -49,6 +68,20 @@ class SearchCatalogSkill(BaseSkill):
         if len(input_data["query"].strip()) == 0:
             raise ValueError("query cannot be empty")
         
+        if input_data.get("operator", "and") not in ("and", "or"):
+            raise ValueError("operator must be 'and' or 'or'")
+        
+        limit = input_data.get("limit", 20)
+        if not isinstance(limit, int) or limit < 1:
+            raise ValueError("limit must be a positive integer")
+        
+        for field in ("min_price", "max_price"):
+            if input_data.get(field) is not None and not isinstance(input_data[field], (int, float)):
+                raise ValueError(f"{field} must be a number")
+        
+        if input_data.get("category") is not None and not isinstance(input_data["category"], str):
+            raise ValueError("category must be a string")
+        
         return True
     
     def _execute_logic(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -56,12 +89,28 @@ class SearchCatalogSkill(BaseSkill):
         query = input_data["query"].lower().strip()
         
         # Search catalog
-        results = [
-            item for item in self.catalog 
-            if query in item['name'].lower() or query in item['category'].lower()
-        ]
+        found = self.index.search(
+            query,
+            input_data.get("operator", "and"),
+            input_data.get("limit", 20),
+            min_price=input_data.get("min_price"),
+            max_price=input_data.get("max_price"),
+            category=input_data.get("category")
+        )
+        results = found["items"]
         
-        # Log to audit
+        result = {
+            "query": query,
+            "results_count": len(results),
+            "total_matches": found["total_matches"],
+            "results": results,
+            "success": len(results) > 0
+        }
+        self._audit_result(input_data, result)
+        return result
+    
+    def _audit_result(self, input_data: Dict[str, Any], result: Dict[str, Any], cache_hit: bool = False):
+        """Log the search to audit"""
         try:
             self.audit_logger.log_event(
                 event_type=AuditEventType.CATALOG_SEARCHED,
@@ -70,20 +119,15 @@ class SearchCatalogSkill(BaseSkill):
                 resource_id="catalog_main",
                 action="search",
                 details={
-                    "query": query,
-                    "results_count": len(results),
-                    "results": results
+                    "query": result["query"],
+                    "results_count": result["results_count"],
+                    "total_matches": result["total_matches"],
+                    "results": result["results"],
+                    "cache_hit": cache_hit
                 }
             )
         except Exception as e:
             self.logger.warning(f"Failed to log catalog search: {str(e)}")
-        
-        return {
-            "query": query,
-            "results_count": len(results),
-            "results": results,
-            "success": len(results) > 0
-        }
 
 
 # Backward compatibility wrapper
@@ -97,7 +141,7 @@ def search_catalog(query: str) -> List[Dict[str, Any]]:
     Returns:
         List of matching catalog items
     """
-    skill = SearchCatalogSkill()
+    skill = get_shared_skill("search_catalog", SearchCatalogSkill)
     try:
         output = skill.execute({"query": query})
         result_dict = output.dict() if hasattr(output, 'dict') else output
@@ -3,12 +3,13 @@ Send Notification Skill - Sends notifications to recipients
 """
 import sys
 import os
+import itertools
 from typing import Dict, Any
 
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from backend.skill_base import BaseSkill, SkillInput, SkillOutput, SkillStatus
+from backend.skill_base import BaseSkill, SkillInput, SkillOutput, SkillStatus, get_shared_skill
 from backend.security.audit_logger import get_audit_logger, AuditEventType
 
 
@@ -23,7 +24,8 @@ class SendNotificationSkill(BaseSkill):
     def __init__(self):
         super().__init__("send_notification")
         self.audit_logger = get_audit_logger()
-        self.notification_counter = 0
+        # Shared instance: itertools.count hands out unique ids across threads
+        self.notification_ids = itertools.count(1)
     
     def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """Validate required fields: recipient, message"""
@@ -59,8 +61,7 @@ class SendNotificationSkill(BaseSkill):
         priority = input_data.get("priority", "normal")
         
         # Generate notification ID
-        self.notification_counter += 1
-        notification_id = f"NOTIF-{notification_counter:05d}"
+        notification_id = f"NOTIF-{next(self.notification_ids):05d}"
         
         # Simulate sending notification
         try:
@@ -148,7 +149,7 @@ def send_notification(recipient: str, message: str,
     Returns:
         Dictionary with status and notification_id
     """
-    skill = SendNotificationSkill()
+    skill = get_shared_skill("send_notification", SendNotificationSkill)
     try:
         output = skill.execute({
             "recipient": recipient,
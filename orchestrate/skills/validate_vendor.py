@@ -3,9 +3,9 @@ Vendor Validation Skill
 Validates vendor information with formal input/output contracts
 """
 
-import uuid
+import hashlib
 import re
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
 import sys
 import os
@@ -13,9 +13,12 @@ import os
 # Add backend to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
-from backend.skill_base import BaseSkill, SkillOutput, SkillStatus
+from backend.skill_base import BaseSkill, SkillOutput, SkillStatus, get_shared_skill
 from backend.security.audit_logger import get_audit_logger, AuditEventType
 
+# Vendor names that fail the basic compliance check
+BLOCKED_NAME = re.compile(r"bad|blocked", re.IGNORECASE)
+
 
 class ValidateVendorSkill(BaseSkill):
     """
@@ -26,6 +29,8 @@ class ValidateVendorSkill(BaseSkill):
     Error Handling: 3-level fallback strategy
     """
     
+    memoize = True
+    
     def __init__(self):
         super().__init__("validate_vendor")
         self.audit_logger = get_audit_logger()
@@ -67,7 +72,8 @@ class ValidateVendorSkill(BaseSkill):
         vendor_name = input_data.get("vendor_name")
         tax_id = input_data.get("tax_id")
         
-        vendor_id = f"v-{uuid.uuid4().hex[:12]}"
+        # Stable per vendor name (same scheme as the vendor agent) so results can be memoized
+        vendor_id = "v-" + hashlib.md5(vendor_name.encode()).hexdigest()[:12]
         
         results = {
             "vendor_id": vendor_id,
@@ -80,7 +86,7 @@ class ValidateVendorSkill(BaseSkill):
         results["validation_checks"]["tax_id_format"] = "PASSED"
         
         # Check 2: Basic compliance check
-        if "bad" in vendor_name.lower() or "blocked" in vendor_name.lower():
+        if BLOCKED_NAME.search(vendor_name):
             results["validation_checks"]["compliance"] = "FAILED"
             results["validation_score"] = 0.2
             results["validation_status"] = "rejected"
@@ -91,19 +97,31 @@ class ValidateVendorSkill(BaseSkill):
             results["validation_status"] = "approved"
             results["risk_level"] = "low"
         
-        # Log audit event
+        self._audit_result(input_data, results)
+        return results
+    
+    def _audit_result(self, input_data: Dict[str, Any], result: Dict[str, Any], cache_hit: bool = False):
+        """Log audit event"""
         self.audit_logger.log_event(
             event_type=AuditEventType.VENDOR_VALIDATED,
             user_id="system",
-            resource_id=vendor_id,
+            resource_id=result["vendor_id"],
             action="validate",
             details={
-                "vendor_name": vendor_name,
-                "validation_score": results["validation_score"]
+                "vendor_name": result["vendor_name"],
+                "validation_score": result["validation_score"],
+                "cache_hit": cache_hit
             }
         )
+    
+    def _execute_batch(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Validate many vendors in one call (bulk onboarding imports)
         
-        return results
+        Skips the per-item executor dispatch and deadline setup; audit events
+        are buffered by execute_many() and written once.
+        """
+        return [self._execute_logic(input_data) for input_data in inputs]
 
 
 # Legacy function wrapper for backward compatibility
@@ -118,7 +136,7 @@ def validate_vendor(vendor_data: dict) -> dict:
     Returns:
         Dictionary with validation result
     """
-    skill = ValidateVendorSkill()
+    skill = get_shared_skill("validate_vendor", ValidateVendorSkill)
     output = skill.execute(vendor_data)
     return output.dict()
 
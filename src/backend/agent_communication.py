@@ -6,11 +6,13 @@ Standardized message format and inter-agent communication
 from pydantic import BaseModel, Field
 from typing import Dict, Any, Optional, Callable
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timedelta
 import uuid
 import logging
 import time
-from threading import Lock
+from threading import Lock, Condition
+
+from backend.deadline import DeadlineExceeded, current_deadline, remaining_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -102,7 +104,8 @@ class AgentCommunicationBus:
         self.pending_responses = {}  # request_id -> response
         self.callback_registry = {}  # request_id -> callback_function
         self.lock = Lock()  # Thread safety
-    
+        self.response_ready = Condition(self.lock)  # Wakes sync waiters
+
     def send_message(self, message: AgentMessage) -> str:
         """
         Send message from one agent to another
@@ -134,6 +137,10 @@ class AgentCommunicationBus:
         """
         Send synchronous request and wait for response
         
+        The wait is capped by the current request deadline; the message
+        carries expires_at so the receiver can skip stale work, and an
+        abandoned request is withdrawn from the queue.
+        
         Args:
             from_agent: Requesting agent
             to_agent: Target agent
@@ -146,6 +153,20 @@ class AgentCommunicationBus:
             AgentResponse with result or error
         """
         request_id = str(uuid.uuid4())
+        deadline = current_deadline()
+        
+        try:
+            timeout_seconds = remaining_timeout(timeout_seconds)
+        except DeadlineExceeded as e:
+            # Caller already gave up - do not enqueue work nobody will read
+            return AgentResponse(
+                in_reply_to=request_id,
+                from_agent=to_agent,
+                to_agent=from_agent,
+                status="timeout",
+                error_code="DEADLINE_EXCEEDED",
+                error_message=str(e)
+            )
         
         # Create and send message
         message = AgentMessage(
@@ -155,30 +176,45 @@ class AgentCommunicationBus:
             request_id=request_id,
             subject=subject,
             payload=payload,
-            priority=priority
+            priority=priority,
+            expires_at=datetime.utcnow() + timedelta(seconds=timeout_seconds)
         )
         
         self.send_message(message)
         
-        # Wait for response
-        start = time.time()
-        while time.time() - start < timeout_seconds:
-            with self.lock:
-                if request_id in self.pending_responses:
-                    return self.pending_responses.pop(request_id)
-            time.sleep(0.1)
+        # Wait for response (woken by handle_response; re-checks cancellation every 100ms)
+        end = time.monotonic() + timeout_seconds
+        with self.response_ready:
+            while request_id not in self.pending_responses:
+                remaining = end - time.monotonic()
+                if remaining <= 0 or (deadline is not None and deadline.cancelled):
+                    break
+                self.response_ready.wait(min(remaining, 0.1))
+            else:
+                return self.pending_responses.pop(request_id)
+            # Withdraw the abandoned request
+            self.message_queue.pop(message.message_id, None)
         
         # Timeout
         logger.warning(
             f"Request {request_id} from {from_agent} to {to_agent} timed out"
         )
+        if deadline is not None and deadline.expired():
+            return AgentResponse(
+                in_reply_to=message.message_id,
+                from_agent=to_agent,
+                to_agent=from_agent,
+                status="timeout",
+                error_code="DEADLINE_EXCEEDED",
+                error_message="Caller deadline passed or request was cancelled"
+            )
         return AgentResponse(
             in_reply_to=message.message_id,
             from_agent=to_agent,
             to_agent=from_agent,
             status="timeout",
             error_code="TIMEOUT",
-            error_message=f"No response within {timeout_seconds} seconds"
+            error_message=f"No response within {timeout_seconds:g} seconds"
         )
     
     def send_async_request(
@@ -241,6 +277,8 @@ class AgentCommunicationBus:
             # Store response for sync waiters
             self.pending_responses[request_id] = response
             
+            self.response_ready.notify_all()
+            
             # Trigger callback if registered (async mode)
             if request_id in self.callback_registry:
                 callback = self.callback_registry.pop(request_id)
@@ -341,13 +379,15 @@ class AgentCommunicationBus:
         return None
     
     def clear_expired_messages(self, max_age_seconds: int = 3600):
-        """Clean up old messages to prevent memory leak"""
-        cutoff = datetime.utcnow().timestamp() - max_age_seconds
+        """Clean up old and past-deadline messages to prevent memory leak"""
+        now = datetime.utcnow()
+        cutoff = now.timestamp() - max_age_seconds
         
         with self.lock:
             expired_ids = [
                 mid for mid, msg in self.message_queue.items()
                 if msg.created_at.timestamp() < cutoff
+                or (msg.expires_at is not None and msg.expires_at < now)
             ]
             for mid in expired_ids:
                 del self.message_queue[mid]
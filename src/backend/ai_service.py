@@ -3,6 +3,7 @@ from ibm_watson import NaturalLanguageUnderstandingV1
 from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
 from ibm_watson.natural_language_understanding_v1 import Features, EntitiesOptions, SentimentOptions
 from dotenv import load_dotenv
+from backend.deadline import check_deadline
 
 load_dotenv('src/config/cloud.env')
 
@@ -26,8 +27,11 @@ class AIService:
         """
         Analyzes text for entities and sentiment using IBM NLU.
         Falls back to simple mock analysis if NLU is not configured.
+        Raises DeadlineExceeded instead of calling NLU once the request's
+        deadline has passed.
         """
         if self.nlu_client:
+            check_deadline("NLU analysis")
             try:
                 response = self.nlu_client.analyze(
                     text=text,
@@ -42,6 +46,16 @@ class AIService:
         else:
             return self._mock_analysis(text)
 
+    def analyze_texts(self, texts):
+        """
+        Analyzes a batch of texts, preserving order.
+        The mock path skips per-call client checks and error handling.
+        """
+        if self.nlu_client:
+            # analyze_text checks the deadline before each call
+            return [self.analyze_text(text) for text in texts]
+        return [self._mock_analysis(text) for text in texts]
+
     def _mock_analysis(self, text):
         # Simple mock logic
         sentiment = "positive" if "good" in text.lower() or "great" in text.lower() else "neutral"
@@ -0,0 +1,463 @@
+"""
+Budget Ledger
+Department balances with two-phase spending
+
+Spending is reserve, then commit or release. reserve() takes the money out
+of the department's available balance at once, so two concurrent
+requisitions can never both pass a check against the same money. The
+reservation is then committed (spent) or released; one still open when its
+TTL runs out expires, and its money becomes available again.
+
+Every department has its own lock, so requests for different departments
+never wait on each other. Amounts are kept in integer cents.
+
+Budgets are per period (a calendar month by default): what a department
+spent in earlier periods no longer counts once a new one starts, while open
+reservations carry over.
+
+With a journal, each change is appended to a JSONL file before it is
+applied. On open the journal is replayed on top of the configured budgets,
+restoring what each department has spent this period and its open
+reservations. The global ledger is journaled only when BUDGET_LEDGER_PATH
+is set; otherwise it lives in memory.
+
+check_many() answers "does each of these lines fit?" for thousands of
+(department, amount) lines at once: lines are grouped by department and
+running totals taken in arrival order with NumPy, against one balance
+snapshot per department. Only a department's lines after its first
+rejection are settled one by one.
+"""
+
+import heapq
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Tuple, Callable, Union, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Department budgets (mock data)
+DEFAULT_BUDGETS = {
+    "IT": 50000,
+    "HR": 10000,
+    "Marketing": 20000,
+    "Operations": 35000,
+    "Finance": 25000,
+    "General": 10000
+}
+
+# Account for requisitions whose department has no budget of its own
+GENERAL_ACCOUNT = "General"
+
+# How long a reservation holds its money unless committed or released
+RESERVATION_TTL_SECONDS = 15 * 60
+
+HELD, COMMITTED, RELEASED, EXPIRED = "held", "committed", "released", "expired"
+
+Amount = Union[int, float]
+
+
+def monthly_period(timestamp: float) -> str:
+    """Budget period of a time: its UTC calendar month ("2025-11")"""
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m")
+
+
+def to_cents(amount: Amount) -> int:
+    return int(round(amount * 100))
+
+
+def from_cents(cents: int) -> Amount:
+    """Currency amount; whole amounts stay integers"""
+    return cents // 100 if cents % 100 == 0 else cents / 100
+
+
+class ReservationError(ValueError):
+    """A reservation that is unknown or no longer open"""
+
+
+class Reservation:
+    """Money set aside for one requisition"""
+
+    def __init__(self, reservation_id: str, department: str, cents: int, expires_at: float):
+        self.id = reservation_id
+        self.department = department
+        self.cents = cents
+        self.expires_at = expires_at
+        self.status = HELD
+
+    @property
+    def amount(self) -> Amount:
+        return from_cents(self.cents)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "reservation_id": self.id,
+            "department": self.department,
+            "amount": self.amount,
+            "expires_at": self.expires_at,
+            "status": self.status
+        }
+
+
+class _Account:
+    """One department's balance; every field is guarded by lock"""
+
+    def __init__(self, department: str, budget: int):
+        self.department = department
+        self.budget = budget
+        # Budget period that committed counts toward
+        self.period: Optional[str] = None
+        self.committed = 0
+        self.reserved = 0
+        self.held: Dict[str, Reservation] = {}
+        # (expires_at, reservation id), soonest first
+        self.expiry: List[Tuple[float, str]] = []
+        self.lock = threading.Lock()
+
+    @property
+    def available(self) -> int:
+        return self.budget - self.committed - self.reserved
+
+
+class BudgetLedger:
+    """
+    Department budgets with reservations, backed by an append-only journal
+    """
+
+    def __init__(
+        self,
+        budgets: Optional[Dict[str, Amount]] = None,
+        journal_path: Optional[str] = None,
+        fsync: bool = True,
+        ttl_seconds: float = RESERVATION_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+        period: Optional[Callable[[float], str]] = monthly_period
+    ):
+        """
+        Args:
+            budgets: Budget per department (default DEFAULT_BUDGETS)
+            journal_path: JSONL journal to replay and append to (None = in memory only)
+            fsync: fsync after every journal write (disable only for tests/benchmarks)
+            ttl_seconds: Default reservation lifetime
+            clock: Returns the current time in seconds, for reservation expiry
+            period: Maps a time to its budget period; spending resets when it
+                changes (None = budgets never reset)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.period = period
+        self.fsync = fsync
+        self._accounts = {
+            department: _Account(department, to_cents(budget))
+            for department, budget in (budgets if budgets is not None else DEFAULT_BUDGETS).items()
+        }
+        self._by_name = {department.lower(): department for department in self._accounts}
+        # Open reservation id -> department
+        self._open: Dict[str, str] = {}
+        self._journal_lock = threading.Lock()
+        self._journal = None
+        self.journal_path = journal_path
+        if journal_path:
+            self._recover(journal_path)
+            directory = os.path.dirname(journal_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._journal = open(journal_path, "a", encoding="utf-8")
+
+    def _recover(self, path: str):
+        if not os.path.exists(path):
+            return
+        replayed = 0
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final write from a crash - everything before it is intact
+                    logger.warning("Ignoring truncated budget journal record")
+                    break
+                self._replay(record)
+                replayed += 1
+        logger.info(f"Budget ledger recovered: {replayed} journal records, {len(self._open)} open reservations")
+
+    def _replay(self, record: Dict[str, Any]):
+        if record["op"] == "reserve":
+            account = self._accounts.get(record["department"])
+            if account is None:
+                logger.warning(f"Budget journal names unknown department {record['department']}; adding it")
+                account = self._accounts[record["department"]] = _Account(record["department"], 0)
+                self._by_name[record["department"].lower()] = record["department"]
+            self._hold(account, Reservation(record["id"], record["department"], record["cents"], record["expires_at"]))
+            return
+        department = self._open.get(record["id"])
+        if department is None:
+            return
+        account = self._accounts[department]
+        if self.period is not None:
+            self._roll(account, self.period(record["at"]))
+        self._close(account, account.held[record["id"]], COMMITTED if record["op"] == "commit" else RELEASED)
+
+    def _write(self, record: Dict[str, Any]):
+        """Append a record to the journal (callers hold the account's lock)"""
+        if self._journal is None:
+            return
+        with self._journal_lock:
+            self._journal.write(json.dumps(record) + "\n")
+            self._journal.flush()
+            if self.fsync:
+                os.fsync(self._journal.fileno())
+
+    def _hold(self, account: _Account, reservation: Reservation):
+        account.held[reservation.id] = reservation
+        account.reserved += reservation.cents
+        heapq.heappush(account.expiry, (reservation.expires_at, reservation.id))
+        self._open[reservation.id] = account.department
+
+    def _close(self, account: _Account, reservation: Reservation, status: str):
+        del account.held[reservation.id]
+        account.reserved -= reservation.cents
+        if status == COMMITTED:
+            account.committed += reservation.cents
+        reservation.status = status
+        self._open.pop(reservation.id, None)
+
+    @staticmethod
+    def _roll(account: _Account, period: str):
+        """Start a new budget period: earlier spending no longer counts"""
+        if account.period != period:
+            if account.period is not None and account.committed:
+                logger.info(f"Budget period {period} started for {account.department}")
+            account.period = period
+            account.committed = 0
+
+    def _refresh(self, account: _Account, now: float):
+        """Roll the account into the current period and expire lapsed reservations (callers hold its lock)"""
+        if self.period is not None:
+            self._roll(account, self.period(now))
+        self._expire(account, now)
+
+    def _expire(self, account: _Account, now: float):
+        """Return the money of lapsed reservations (callers hold the account's lock)"""
+        while account.expiry and account.expiry[0][0] <= now:
+            _, reservation_id = heapq.heappop(account.expiry)
+            reservation = account.held.get(reservation_id)
+            if reservation is not None and reservation.expires_at <= now:
+                self._close(account, reservation, EXPIRED)
+
+    def _account(self, department: str) -> _Account:
+        account = self._accounts.get(department)
+        if account is None:
+            raise ValueError(f"Unknown department: {department}")
+        return account
+
+    def has_account(self, department: str) -> bool:
+        return department in self._accounts
+
+    def account_for(self, department: Optional[str]) -> str:
+        """
+        Account a free-text department is charged to
+
+        Matches account names case-insensitively, falling back to GENERAL_ACCOUNT.
+        """
+        name = self._by_name.get(str(department or "").strip().lower())
+        if name is not None:
+            return name
+        if GENERAL_ACCOUNT not in self._accounts:
+            raise ValueError(f"Unknown department: {department}")
+        return GENERAL_ACCOUNT
+
+    def balance(self, department: str) -> Dict[str, Any]:
+        """
+        Current balance of a department
+
+        Returns:
+            Dict with budget, committed, reserved and available amounts
+        """
+        account = self._account(department)
+        with account.lock:
+            self._refresh(account, self.clock())
+            return {
+                "department": department,
+                "budget": from_cents(account.budget),
+                "committed": from_cents(account.committed),
+                "reserved": from_cents(account.reserved),
+                "available": from_cents(account.available)
+            }
+
+    def check_many(self, departments: Sequence[str], amounts: Sequence[Amount],
+                   spent: Optional[Dict[str, int]] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Check many lines against current balances without reserving anything
+
+        Lines count against their department in arrival order: a line fits
+        when the department can afford it on top of every earlier line that
+        fit. A line that does not fit takes nothing, so one oversized line
+        does not block smaller ones after it. Its remaining balance is what
+        is left after it when it fits, else what was left for it (as for a
+        single check); it never goes negative.
+
+        Args:
+            departments: Department of each line
+            amounts: Amount of each line
+            spent: Cents per department already taken by earlier lines of the
+                same batch, subtracted from the current balances
+
+        Returns:
+            (known, fits, remaining): per line, whether the department has an
+            account, whether the line fits, and the remaining balance in cents
+        """
+        names, groups = np.unique(np.asarray(departments, dtype=str), return_inverse=True)
+        cents = np.rint(np.asarray(amounts, dtype=np.float64) * 100).astype(np.int64)
+        known_names = np.array([self.has_account(name) for name in names], dtype=bool)
+        spent = spent or {}
+        available = np.array(
+            [
+                to_cents(self.balance(name)["available"]) - spent.get(name, 0) if known else 0
+                for name, known in zip(names, known_names)
+            ],
+            dtype=np.int64
+        )
+
+        # Group the lines by department, keeping arrival order within each group
+        order = np.argsort(groups, kind="stable")
+        sorted_groups = groups[order]
+        totals = np.cumsum(cents[order])
+        starts = np.searchsorted(sorted_groups, np.arange(len(names)))
+        # Running totals restart at each department's first line
+        offsets = np.concatenate(([0], totals))[starts]
+        running = np.empty_like(cents)
+        running[order] = totals - offsets[sorted_groups]
+
+        before = available[groups] - (running - cents)
+        known = known_names[groups]
+        fits = known & (running <= available[groups])
+        remaining = np.where(fits, before - cents, before)
+
+        # The running totals are exact up to a department's first rejection.
+        # After it the rejected line must not count, so the rest of that
+        # department's lines are settled one by one, stopping early once
+        # nothing left in the group is small enough to fit.
+        ends = np.append(starts[1:], len(order))
+        for group in np.unique(groups[known & ~fits]).tolist():
+            lines = order[starts[group]:ends[group]]
+            first = int(np.argmax(~fits[lines]))
+            tail = lines[first:]
+            smallest_after = np.minimum.accumulate(cents[tail][::-1])[::-1].tolist()
+            left = int(before[tail[0]])
+            for position, line in enumerate(tail.tolist()):
+                if left < smallest_after[position]:
+                    fits[tail[position:]] = False
+                    remaining[tail[position:]] = left
+                    break
+                amount = int(cents[line])
+                fits[line] = amount <= left
+                if fits[line]:
+                    left -= amount
+                remaining[line] = left
+        return known, fits, remaining
+
+    def reserve(self, department: str, amount: Amount, ttl_seconds: Optional[float] = None,
+                reservation_id: Optional[str] = None) -> Optional[Reservation]:
+        """
+        Set money aside if the department has it available
+
+        Args:
+            department: Account name
+            amount: Positive amount to reserve
+            ttl_seconds: Lifetime of the reservation (default ttl_seconds)
+            reservation_id: Id for the reservation, e.g. the requisition id (default a new UUID)
+
+        Returns:
+            The open Reservation, or None when the available balance is too low
+        """
+        cents = to_cents(amount)
+        if cents <= 0:
+            raise ValueError("amount must be positive")
+        account = self._account(department)
+        reservation_id = reservation_id or str(uuid.uuid4())
+        with account.lock:
+            now = self.clock()
+            self._refresh(account, now)
+            if reservation_id in self._open:
+                raise ReservationError(f"Reservation {reservation_id} already exists")
+            if cents > account.available:
+                return None
+            reservation = Reservation(
+                reservation_id, department, cents,
+                now + (ttl_seconds if ttl_seconds is not None else self.ttl_seconds)
+            )
+            self._write({
+                "op": "reserve",
+                "id": reservation_id,
+                "department": department,
+                "cents": cents,
+                "expires_at": reservation.expires_at,
+                "at": now
+            })
+            self._hold(account, reservation)
+            return reservation
+
+    def commit(self, reservation_id: str) -> Reservation:
+        """
+        Spend a reservation's money
+
+        Raises:
+            ReservationError: The reservation is unknown, or already committed, released or expired
+        """
+        return self._finish(reservation_id, "commit", COMMITTED)
+
+    def release(self, reservation_id: str) -> Reservation:
+        """
+        Return a reservation's money to the department
+
+        Raises:
+            ReservationError: The reservation is unknown, or already committed, released or expired
+        """
+        return self._finish(reservation_id, "release", RELEASED)
+
+    def _finish(self, reservation_id: str, op: str, status: str) -> Reservation:
+        department = self._open.get(reservation_id)
+        if department is None:
+            raise ReservationError(f"No open reservation {reservation_id}")
+        account = self._accounts[department]
+        with account.lock:
+            now = self.clock()
+            self._refresh(account, now)
+            reservation = account.held.get(reservation_id)
+            if reservation is None:
+                raise ReservationError(f"No open reservation {reservation_id}")
+            self._write({"op": op, "id": reservation_id, "at": now})
+            self._close(account, reservation, status)
+            return reservation
+
+    def close(self):
+        """Close the journal"""
+        with self._journal_lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+
+# Global budget ledger instance
+_budget_ledger = None
+_ledger_lock = threading.Lock()
+
+
+def get_budget_ledger() -> BudgetLedger:
+    """
+    Get global budget ledger (singleton)
+
+    Journaled to BUDGET_LEDGER_PATH when that is set, so balances survive
+    restarts; in memory otherwise.
+    """
+    global _budget_ledger
+    with _ledger_lock:
+        if _budget_ledger is None:
+            _budget_ledger = BudgetLedger(journal_path=os.getenv("BUDGET_LEDGER_PATH") or None)
+        return _budget_ledger
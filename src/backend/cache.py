@@ -0,0 +1,262 @@
+"""
+Result Cache
+Content-addressed caching for expensive, repeatable calls (LLM reasoning)
+
+Keys are SHA-256 digests of a canonical JSON encoding (sorted keys, no
+whitespace), so logically equal inputs hash the same regardless of dict
+ordering. Values live in an in-memory LRU tier backed by an optional
+on-disk tier; both tiers enforce a TTL and an entry limit. A hit in the disk
+tier is promoted to memory.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def canonical_json(value: Any) -> str:
+    """Deterministic JSON encoding used for hashing"""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def stable_hash(value: Any) -> str:
+    """SHA-256 hex digest of the canonical JSON encoding of value"""
+    return hashlib.sha256(canonical_json(value).encode("utf-8")).hexdigest()
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse runs of whitespace so formatting-only differences share a key"""
+    return " ".join(prompt.split())
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU cache with per-entry TTL"""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = 3600.0):
+        """
+        Args:
+            max_entries: Entries kept before least recently used ones are evicted
+            ttl_seconds: Entry lifetime (None = no expiry)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at and expires_at <= now:
+                del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl else 0.0
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
+
+
+class DiskCache:
+    """
+    On-disk cache tier: one JSON file per key, sharded by key prefix
+
+    Writes go to a temporary file and are renamed into place, so readers never
+    see partial entries. Expiry uses wall-clock time so it survives restarts.
+    """
+
+    def __init__(self, directory: str, max_entries: int = 10000, ttl_seconds: Optional[float] = 86400.0):
+        """
+        Args:
+            directory: Cache directory (created if missing)
+            max_entries: Entries kept before the oldest files are pruned
+            ttl_seconds: Entry lifetime (None = no expiry)
+        """
+        self.directory = directory
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._count = sum(len(files) for _, _, files in os.walk(directory))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return default
+        expires_at = entry.get("expires_at")
+        if expires_at and expires_at <= time.time():
+            self.delete(key)
+            return default
+        return entry.get("value", default)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        existed = os.path.exists(path)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"expires_at": time.time() + ttl if ttl else None, "value": value}, f, default=str)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Disk cache write failed for {key[:12]}: {str(e)}")
+            return
+        if not existed:
+            with self._lock:
+                self._count += 1
+                over_limit = self._count > self.max_entries
+            if over_limit:
+                self._prune()
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            return
+        with self._lock:
+            self._count -= 1
+
+    def _prune(self):
+        """Drop expired entries, then the oldest ones, down to 90% of the limit"""
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    files.append((os.path.getmtime(path), path))
+                except OSError:
+                    continue
+        files.sort()
+        target = int(self.max_entries * 0.9)
+        removed = 0
+        for _, path in files[:max(0, len(files) - target)]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                continue
+        with self._lock:
+            self._count = len(files) - removed
+        logger.info(f"Disk cache pruned {removed} entries")
+
+    def clear(self):
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                try:
+                    os.remove(os.path.join(root, name))
+                except OSError:
+                    continue
+        with self._lock:
+            self._count = 0
+
+
+class TieredCache:
+    """Memory LRU in front of an optional disk tier"""
+
+    def __init__(self, memory: LRUCache, disk: Optional[DiskCache] = None):
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: str) -> Tuple[Any, Optional[str]]:
+        """
+        Look up a key in memory, then on disk
+
+        Returns:
+            (value, tier) where tier is "memory" or "disk"; (None, None) on a miss
+        """
+        value = self.memory.get(key, _MISSING)
+        if value is not _MISSING:
+            return value, "memory"
+        if self.disk is not None:
+            value = self.disk.get(key, _MISSING)
+            if value is not _MISSING:
+                self.memory.set(key, value)
+                return value, "disk"
+        return None, None
+
+    def set(self, key: str, value: Any):
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+# Global LLM reasoning cache
+_llm_cache = None
+
+
+def get_llm_cache() -> TieredCache:
+    """
+    Get the global LLM reasoning cache (singleton)
+
+    Configured by LLM_CACHE_MAX_ENTRIES, LLM_CACHE_TTL_SECONDS and
+    LLM_CACHE_DIR (set LLM_CACHE_DIR to an empty string for memory only).
+    """
+    global _llm_cache
+    if _llm_cache is None:
+        ttl = float(os.getenv("LLM_CACHE_TTL_SECONDS", "3600"))
+        memory = LRUCache(max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024")), ttl_seconds=ttl)
+        directory = os.getenv("LLM_CACHE_DIR", os.path.join("logs", "llm_cache"))
+        disk = DiskCache(
+            directory,
+            max_entries=int(os.getenv("LLM_CACHE_DISK_MAX_ENTRIES", "10000")),
+            ttl_seconds=ttl
+        ) if directory else None
+        _llm_cache = TieredCache(memory, disk)
+    return _llm_cache
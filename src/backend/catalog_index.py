@@ -0,0 +1,837 @@
+"""
+Catalog Index
+Inverted-index search over the product catalog
+
+Items are tokenized over name, category and vendor into posting lists
+(token -> {item position: field weight}). A query is tokenized the same way;
+each term matches its token or, when there is no such token, up to
+MAX_PREFIX_EXPANSIONS tokens it is a prefix of ("lap" -> "laptop"). Terms
+are combined with AND (every term must match) or OR (any term) and scored by
+field weight x IDF. Posting lists are also kept best weight first, so the
+top k come off a heap after reading only the head of each list: a search
+touches the posting lists of its terms, never the whole catalog.
+
+Terms that match no token even as a prefix are treated as typos: a trigram
+index over the vocabulary proposes tokens sharing enough trigrams, and a
+bounded edit distance (optimal string alignment, so "chiar" -> "chair" is
+one edit) verifies them. Corrections count in proportion to their
+similarity. resolve() turns a free-text item description into one catalog
+item, breaking near-ties by vendor preference and then price.
+
+Searches can be narrowed by price range and category; those filters are
+vectorized scans over the catalog's columns (backend.catalog_store).
+
+CatalogIndex itself is immutable. LiveCatalogIndex layers updates on top:
+upserts and deletes land in a small delta segment searched alongside the
+base, and a background merge folds them into a new base that replaces the
+old one in a single reference swap.
+
+The catalog comes from CATALOG_PATH (a .json list or {"catalog": [...]}
+document such as local_db.json, .jsonl, .csv, or a memory-mapped .cat
+catalog store) or, without one, the built-in demo catalog.
+"""
+
+import bisect
+import csv
+import heapq
+import json
+import logging
+import math
+import os
+import re
+import threading
+from collections import Counter
+from typing import (
+    Dict, Any, Optional, List, Iterable, Iterator, NamedTuple, Set, Tuple, AbstractSet, Callable, FrozenSet
+)
+
+from backend.cache import stable_hash
+from backend.catalog_store import CatalogStore, STORE_EXTENSION
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Indexed fields and how much a match in each counts
+FIELD_WEIGHTS = {"name": 3.0, "category": 1.5, "vendor": 1.0}
+
+# Prefix matches count for less than whole-token matches
+PREFIX_WEIGHT = 0.5
+MAX_PREFIX_EXPANSIONS = 50
+
+# Typo correction: trigram candidates per term, verified by edit distance
+GRAM_SIZE = 3
+MAX_FUZZY_EXPANSIONS = 10
+
+# Delta segment changes that trigger a background merge into the base
+MERGE_THRESHOLD = 1000
+
+# How a query term matches a token
+EXACT, PREFIX, FUZZY = range(3)
+
+# resolve(): score multiplier for items from a preferred vendor
+VENDOR_PREFERENCE_BOOST = 1.2
+
+# resolve(): share of the description's terms an item's name must match when
+# not every term matched ("desk lamps" is not a Desk, "blue ergonomic chair"
+# is an Ergonomic Chair)
+MIN_NAME_COVERAGE = 0.6
+
+DEFAULT_CATALOG = [
+    {"id": "1", "name": "Laptop", "price": 1200, "category": "Electronics", "vendor": "TechGiant"},
+    {"id": "2", "name": "Monitor", "price": 300, "category": "Electronics", "vendor": "TechGiant"},
+    {"id": "3", "name": "Keyboard", "price": 50, "category": "Accessories", "vendor": "TechGiant"},
+    {"id": "4", "name": "Mouse", "price": 25, "category": "Accessories", "vendor": "TechGiant"},
+    {"id": "5", "name": "Printer", "price": 400, "category": "Equipment", "vendor": "OfficeMax"},
+    {"id": "6", "name": "Desk", "price": 150, "category": "Furniture", "vendor": "OfficeMax"},
+    {"id": "7", "name": "Chair", "price": 200, "category": "Furniture", "vendor": "OfficeMax"},
+]
+
+
+def tokenize(text: Any) -> List[str]:
+    """
+    Lowercase alphanumeric tokens with a trailing plural "s" dropped
+
+    "Laptops" and "laptop" share a token; "glass" keeps its "ss".
+    """
+    tokens = []
+    for token in TOKEN_PATTERN.findall(str(text or "").lower()):
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def max_typos(term: str) -> int:
+    """Edits tolerated in a term: none below 3 characters, one up to 5, then two"""
+    if len(term) < 3:
+        return 0
+    return 1 if len(term) <= 5 else 2
+
+
+def _grams(token: str) -> List[str]:
+    padded = " " * (GRAM_SIZE - 1) + token + " "
+    return [padded[i:i + GRAM_SIZE] for i in range(len(padded) - GRAM_SIZE + 1)]
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance, bounded
+
+    Insertions, deletions, substitutions and adjacent transpositions each
+    cost one edit.
+
+    Returns:
+        The distance, or max_distance + 1 as soon as it must exceed max_distance
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    before: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            distance = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (a[i - 1] != b[j - 1])
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                distance = min(distance, before[j - 2] + 1)
+            current[j] = distance
+        # Rows never get better by more than one per row, so this row decides
+        if min(current) > max_distance:
+            return max_distance + 1
+        before, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+class _Term(NamedTuple):
+    """A query term's posting list, scaled by scale (its IDF), and the tokens it matched"""
+    scale: float
+    impacts: List[Tuple[float, int]]
+    lookup: Dict[int, float]
+    tokens: Tuple[str, ...]
+
+
+# token -> (item count, items containing the token), for IDFs shared across segments
+_Stats = Callable[[str], Tuple[int, int]]
+
+
+class CatalogIndex:
+    """Immutable inverted index over a list of catalog items"""
+
+    def __init__(self, items: Iterable[Dict[str, Any]], field_weights: Optional[Dict[str, float]] = None,
+                 version: Optional[str] = None):
+        """
+        Args:
+            items: Catalog items (dicts with at least a name), or a CatalogStore,
+                which is indexed in place without holding its items in memory
+            field_weights: Indexed fields and their weights (default FIELD_WEIGHTS)
+            version: Known version of these items (default: the store version, or a hash of the items)
+        """
+        if isinstance(items, CatalogStore):
+            self.items = items
+            self.version = version or items.version
+            self._columns: Optional[CatalogStore] = items
+        else:
+            self.items = list(items)
+            self.version = version or stable_hash(self.items)
+            self._columns = None
+        self.field_weights = field_weights or FIELD_WEIGHTS
+        self.postings: Dict[str, Dict[int, float]] = {}
+
+        for position, item in enumerate(self.items):
+            for field, weight in self.field_weights.items():
+                for token in tokenize(item.get(field)):
+                    posting = self.postings.setdefault(token, {})
+                    if posting.get(position, 0.0) < weight:
+                        posting[position] = weight
+
+        # Sorted vocabulary for prefix lookups; impact-ordered lists are built per token on first use
+        self.vocabulary = sorted(self.postings)
+        self._impact_lists: Dict[str, List[Tuple[float, int]]] = {}
+        self._gram_index: Optional[Dict[str, List[str]]] = None
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def columns(self) -> CatalogStore:
+        """Columnar view of the catalog (the store itself, or a columnar copy of a list built on first use)"""
+        if self._columns is None:
+            self._columns = CatalogStore.from_items(self.items)
+        return self._columns
+
+    def _allowed(self, min_price: Optional[float], max_price: Optional[float],
+                 category: Optional[str]) -> Optional[Set[int]]:
+        """Positions passing the filters, or None when there are none"""
+        if min_price is None and max_price is None and category is None:
+            return None
+        rows = self.columns().filter(min_price, max_price, [category] if category is not None else None)
+        return set(rows.tolist())
+
+    def _idf(self, token: str, stats: Optional[_Stats] = None) -> float:
+        if stats is None:
+            count, frequency = len(self.items), len(self.postings[token])
+        else:
+            count, frequency = stats(token)
+        return math.log(1.0 + count / frequency)
+
+    def _impacts(self, token: str) -> List[Tuple[float, int]]:
+        """(weight, position) pairs of a token, best weight first, then catalog order"""
+        impacts = self._impact_lists.get(token)
+        if impacts is None:
+            impacts = sorted(
+                ((weight, position) for position, weight in self.postings[token].items()),
+                key=lambda pair: -pair[0]
+            )
+            self._impact_lists[token] = impacts
+        return impacts
+
+    def corrections(self, term: str) -> List[Tuple[str, int]]:
+        """
+        Vocabulary tokens within max_typos(term) edits of a term
+
+        Returns:
+            Up to MAX_FUZZY_EXPANSIONS (token, distance) pairs, closest first
+        """
+        max_distance = max_typos(term)
+        if not max_distance:
+            return []
+        if self._gram_index is None:
+            gram_index: Dict[str, List[str]] = {}
+            for token in self.vocabulary:
+                for gram in set(_grams(token)):
+                    gram_index.setdefault(gram, []).append(token)
+            self._gram_index = gram_index
+
+        shared = Counter()
+        for gram in set(_grams(term)):
+            shared.update(self._gram_index.get(gram, ()))
+        # Each edit destroys at most GRAM_SIZE + 1 trigrams (a transposition)
+        matches = []
+        for token, count in shared.items():
+            if count < len(max(term, token, key=len)) + 1 - max_distance * (GRAM_SIZE + 1):
+                continue
+            distance = edit_distance(term, token, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, -count, token))
+        return [(token, distance) for distance, _, token in heapq.nsmallest(MAX_FUZZY_EXPANSIONS, matches)]
+
+    def _level(self, term: str) -> int:
+        """How a term matches here: EXACT, PREFIX (some token starts with it) or FUZZY"""
+        if term in self.postings:
+            return EXACT
+        start = bisect.bisect_left(self.vocabulary, term)
+        if start < len(self.vocabulary) and self.vocabulary[start].startswith(term):
+            return PREFIX
+        return FUZZY
+
+    def _term(self, term: str, stats: Optional[_Stats] = None, level: Optional[int] = None) -> Optional[_Term]:
+        """
+        A query term's scored posting list: its exact token, else its prefix expansions, else its corrections
+
+        Args:
+            term: Query token
+            stats: Corpus statistics for the IDF when this index is one segment of several
+            level: Match only this way (see _level()), so segments agree on how a term matches
+        """
+        if level is None:
+            level = self._level(term)
+        if level == EXACT:
+            posting = self.postings.get(term)
+            if posting is None:
+                return None
+            return _Term(self._idf(term, stats), self._impacts(term), posting, (term,))
+
+        if level == PREFIX:
+            expansions = []
+            start = bisect.bisect_left(self.vocabulary, term)
+            for token in self.vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+                if not token.startswith(term):
+                    break
+                expansions.append((token, PREFIX_WEIGHT))
+        else:
+            expansions = [
+                (token, 1.0 - distance / max(len(term), len(token)))
+                for token, distance in self.corrections(term)
+            ]
+        if not expansions:
+            return None
+        if len(expansions) == 1:
+            token, similarity = expansions[0]
+            return _Term(self._idf(token, stats) * similarity, self._impacts(token), self.postings[token], (token,))
+
+        merged: Dict[int, float] = {}
+        for token, similarity in expansions:
+            posting = self.postings[token]
+            idf = self._idf(token, stats) * similarity
+            for position, weight in posting.items():
+                if weight * idf > merged.get(position, 0.0):
+                    merged[position] = weight * idf
+        impacts = sorted(((score, position) for position, score in merged.items()), key=lambda pair: -pair[0])
+        return _Term(1.0, impacts, merged, tuple(token for token, _ in expansions))
+
+    def search(self, query: str, operator: str = "and", limit: int = 20,
+               min_price: Optional[float] = None, max_price: Optional[float] = None,
+               category: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Search the catalog
+
+        Args:
+            query: Free-text query
+            operator: "and" (every term must match) or "or" (any term)
+            limit: Maximum items returned
+            min_price: Only items priced at least this much
+            max_price: Only items priced at most this much
+            category: Only items in this category (case-insensitive)
+
+        Returns:
+            Dict with the top "items" (best first, each with a "score") and
+            "total_matches" (all items that matched)
+        """
+        if operator not in ("and", "or"):
+            raise ValueError(f"Unknown operator: {operator}")
+        return self._search(self._terms(query), operator, limit, self._allowed(min_price, max_price, category))
+
+    def _terms(self, query: str) -> List[Optional[_Term]]:
+        """One entry per distinct query token; None where nothing matches it"""
+        return [self._term(term) for term in dict.fromkeys(tokenize(query))]
+
+    def _search(self, terms: List[Optional[_Term]], operator: str, limit: int,
+                allowed: Optional[Set[int]] = None) -> Dict[str, Any]:
+        top, total = self._top(terms, operator, limit, allowed)
+        return {
+            "items": [dict(self.items[position], score=round(score, 4)) for score, position in top],
+            "total_matches": total
+        }
+
+    def _top(self, terms: List[Optional[_Term]], operator: str, limit: int,
+             allowed: Optional[Set[int]] = None,
+             excluded: AbstractSet[int] = frozenset()) -> Tuple[List[Tuple[float, int]], int]:
+        """Best (score, position) pairs of matching items in allowed and not in excluded, and their count"""
+        if operator == "and" and None in terms:
+            return [], 0
+        terms = [term for term in terms if term is not None]
+        if not terms:
+            return [], 0
+        if operator == "and":
+            terms.sort(key=lambda term: len(term.lookup))
+            return self._top_all(terms, limit, allowed, excluded)
+        return self._top_any(terms, limit, allowed, excluded)
+
+    def resolve(self, text: str, preferred_vendors: Optional[Iterable[str]] = None,
+                candidates: int = 10) -> Optional[Dict[str, Any]]:
+        """
+        Catalog item for a free-text item description ("ergonomic chiar")
+
+        Searches with AND, then OR when nothing matches every term, and keeps
+        only items whose name matched (a category or vendor match alone is
+        not the item). OR candidates must also match at least
+        MIN_NAME_COVERAGE of the terms by name, so one shared word
+        ("printer paper" vs Printer) is not enough. The best candidates are
+        re-ranked by score, boosted for preferred vendors, then by price.
+
+        Args:
+            text: Item description
+            preferred_vendors: Vendors whose items are preferred
+            candidates: Top search results considered
+
+        Returns:
+            The catalog item (with its "score"), or None when nothing matches
+        """
+        terms = self._terms(text)
+        return _resolve(
+            lambda operator: self._search(terms, operator, candidates)["items"],
+            [set(term.tokens) if term is not None else set() for term in terms],
+            preferred_vendors
+        )
+
+    @staticmethod
+    def _push(heap: List[Tuple[float, int]], limit: int, score: float, position: int):
+        # (score, -position): the worst kept result (lowest score, latest item) sits on top
+        entry = (score, -position)
+        if len(heap) < limit:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    @staticmethod
+    def _ranked(heap: List[Tuple[float, int]]) -> List[Tuple[float, int]]:
+        return [(score, -position) for score, position in sorted(heap, reverse=True)]
+
+    def _top_all(self, terms: List[_Term], limit: int, allowed: Optional[Set[int]] = None,
+                 excluded: AbstractSet[int] = frozenset()) -> Tuple[List[Tuple[float, int]], int]:
+        """
+        Best (score, position) pairs of items matching every term (in allowed, not excluded), and their count
+
+        Walks the shortest list in impact order, probing the others. An item
+        further down cannot beat its own weight plus the best weights of the
+        other lists, so the walk stops once the k-th best score does.
+        """
+        driver, others = terms[0], terms[1:]
+        matched = driver.lookup.keys()
+        for other in others:
+            matched = matched & other.lookup.keys()
+        if allowed is not None:
+            matched = matched & allowed
+
+        others_best = sum(other.impacts[0][0] * other.scale for other in others)
+        heap: List[Tuple[float, int]] = []
+        for weight, position in driver.impacts:
+            score = weight * driver.scale
+            if len(heap) == limit:
+                bound = score + others_best
+                kth_score, kth_position = heap[0][0], -heap[0][1]
+                # Items still to come are later in the catalog, so they lose ties
+                if bound < kth_score or (bound == kth_score and position > kth_position):
+                    break
+            if (allowed is not None and position not in allowed) or position in excluded:
+                continue
+            for other in others:
+                other_weight = other.lookup.get(position)
+                if other_weight is None:
+                    break
+                score += other_weight * other.scale
+            else:
+                self._push(heap, limit, score, position)
+        return self._ranked(heap), len(matched) - sum(1 for position in excluded if position in matched)
+
+    def _top_any(self, terms: List[_Term], limit: int, allowed: Optional[Set[int]] = None,
+                 excluded: AbstractSet[int] = frozenset()) -> Tuple[List[Tuple[float, int]], int]:
+        """
+        Best (score, position) pairs of items matching any term (in allowed, not excluded), and their count
+
+        Items in several lists are found by intersecting the lists and scored
+        directly. Every other item scores by its one list alone, so those are
+        taken best first from a merge of the impact lists, stopping as soon
+        as the next one cannot make the top k.
+        """
+        shared = set()
+        for index, term in enumerate(terms):
+            for other in terms[index + 1:]:
+                shared |= term.lookup.keys() & other.lookup.keys()
+        if allowed is not None:
+            shared &= allowed
+
+        heap: List[Tuple[float, int]] = []
+        duplicates = 0
+        for position in shared:
+            score = 0.0
+            for term in terms:
+                weight = term.lookup.get(position)
+                if weight is not None:
+                    score += weight * term.scale
+                    duplicates += 1
+            duplicates -= 1
+            if position not in excluded:
+                self._push(heap, limit, score, position)
+
+        for negative_score, position in heapq.merge(*(_scored(term) for term in terms)):
+            if position in shared or position in excluded or (allowed is not None and position not in allowed):
+                continue
+            if len(heap) == limit and (-negative_score, -position) < heap[0]:
+                break
+            self._push(heap, limit, -negative_score, position)
+        if allowed is not None:
+            matched = set().union(*(term.lookup for term in terms)) & allowed
+            return self._ranked(heap), len(matched - excluded)
+        hidden = sum(1 for position in excluded if any(position in term.lookup for term in terms))
+        return self._ranked(heap), sum(len(term.lookup) for term in terms) - duplicates - hidden
+
+
+def _resolve(search: Callable[[str], List[Dict[str, Any]]], term_tokens: List[Set[str]],
+             preferred_vendors: Optional[Iterable[str]]) -> Optional[Dict[str, Any]]:
+    """
+    resolve() over search(operator) -> top items, for one index or several segments
+
+    term_tokens holds, per query term, the tokens it matched (empty if none).
+    """
+    if not term_tokens:
+        return None
+    preferred = {vendor.lower() for vendor in preferred_vendors or ()}
+    for operator in ("and", "or"):
+        found = []
+        for item in search(operator):
+            name = set(tokenize(item.get("name")))
+            matched = sum(1 for tokens in term_tokens if tokens & name)
+            if matched and (operator == "and" or matched / len(term_tokens) >= MIN_NAME_COVERAGE):
+                found.append(item)
+        if found:
+            return min(found, key=lambda item: (
+                -item["score"] * (VENDOR_PREFERENCE_BOOST if str(item.get("vendor", "")).lower() in preferred else 1.0),
+                item.get("price", math.inf)
+            ))
+    return None
+
+
+def _scored(term: _Term) -> Iterator[Tuple[float, int]]:
+    """A term's impact list as (-score, position), best first"""
+    for weight, position in term.impacts:
+        yield -weight * term.scale, position
+
+
+class _Segments(NamedTuple):
+    """One published state of a LiveCatalogIndex; never modified once published"""
+    base: CatalogIndex
+    base_ids: Dict[str, int]
+    # item id -> its upserted item, or None once deleted
+    changes: Dict[str, Optional[Dict[str, Any]]]
+    delta: CatalogIndex
+    # Base positions superseded or deleted by a change
+    dead: FrozenSet[int]
+    version: str
+
+    def stats(self, token: str) -> Tuple[int, int]:
+        """Corpus statistics over both segments, so their scores are comparable"""
+        count = len(self.base) - len(self.dead) + len(self.delta)
+        frequency = len(self.base.postings.get(token, ())) + len(self.delta.postings.get(token, ()))
+        return count, frequency
+
+
+class LiveCatalogIndex:
+    """
+    Catalog index that takes upserts and deletes without a rebuild
+
+    Changes go to a small delta segment (an index over the changed items)
+    and hide the base items they replace. Queries search both segments with
+    shared IDFs and merge the results. Once the delta holds MERGE_THRESHOLD
+    changes, a background thread compacts base and delta into a new base;
+    changes made meanwhile are carried over into the new delta.
+
+    Every change publishes a new immutable state by swapping one reference,
+    so readers never lock and never see a half-applied change.
+    """
+
+    def __init__(self, base: Optional[CatalogIndex] = None, merge_threshold: Optional[int] = None):
+        """
+        Args:
+            base: Initial base segment (default: an empty catalog)
+            merge_threshold: Delta changes that trigger a background merge (default MERGE_THRESHOLD)
+        """
+        self.merge_threshold = merge_threshold or MERGE_THRESHOLD
+        self._lock = threading.Lock()
+        self._sequence = 0
+        # Changes since the running merge took its snapshot (None when no merge is running)
+        self._merge_changes: Optional[Dict[str, Optional[Dict[str, Any]]]] = None
+        self._merge_thread: Optional[threading.Thread] = None
+        self._state = self._publish(base if base is not None else CatalogIndex([]), {})
+
+    def _publish(self, base: CatalogIndex, changes: Dict[str, Optional[Dict[str, Any]]],
+                 base_ids: Optional[Dict[str, int]] = None) -> _Segments:
+        if base_ids is None:
+            base_ids = _item_ids(base.items)
+        self._sequence += 1
+        state = _Segments(
+            base=base,
+            base_ids=base_ids,
+            changes=changes,
+            delta=CatalogIndex([item for item in changes.values() if item is not None], base.field_weights),
+            dead=frozenset(base_ids[item_id] for item_id in changes if item_id in base_ids),
+            version=f"{base.version}+{self._sequence}" if changes else base.version
+        )
+        self._state = state
+        return state
+
+    @property
+    def version(self) -> str:
+        """Changes with every upsert and delete"""
+        return self._state.version
+
+    @property
+    def items(self) -> List[Dict[str, Any]]:
+        """Current catalog items: base order, with new items last"""
+        return _merged_items(self._state)
+
+    @property
+    def base(self) -> CatalogIndex:
+        return self._state.base
+
+    @property
+    def pending_changes(self) -> int:
+        """Changes held in the delta segment"""
+        return len(self._state.changes)
+
+    def __len__(self) -> int:
+        state = self._state
+        return len(state.base) - len(state.dead) + len(state.delta)
+
+    def upsert(self, items: Iterable[Dict[str, Any]]):
+        """
+        Add items, or replace the items with the same ids
+
+        Items are normalized as load_catalog() does: string ids, "item" read
+        as "name" and numeric prices ("175" -> 175).
+
+        Args:
+            items: Catalog items, each with an "id" (or "sku")
+        """
+        updates = {}
+        for position, raw in enumerate(items):
+            if not (raw.get("id") or raw.get("sku")):
+                raise ValueError(f"Catalog item at position {position} has no id")
+            item = _normalize_item(raw, position)
+            updates[item["id"]] = item
+        self._apply(updates)
+
+    def delete(self, item_ids: Iterable[Any]):
+        """Remove items by id (unknown ids are ignored)"""
+        self._apply({str(item_id): None for item_id in item_ids})
+
+    def _apply(self, updates: Dict[str, Optional[Dict[str, Any]]]):
+        if not updates:
+            return
+        with self._lock:
+            state = self._state
+            changes = dict(state.changes)
+            for item_id, item in updates.items():
+                if item is None and item_id not in state.base_ids:
+                    # Deleting an item only the delta has leaves nothing to hide
+                    changes.pop(item_id, None)
+                else:
+                    changes[item_id] = item
+            if self._merge_changes is not None:
+                self._merge_changes.update(updates)
+            self._publish(state.base, changes, state.base_ids)
+            merge = len(changes) >= self.merge_threshold and self._merge_changes is None
+        if merge:
+            self.compact(wait=False)
+
+    def compact(self, wait: bool = True) -> Optional[threading.Thread]:
+        """
+        Merge the delta into a new base segment
+
+        The new base is built from a snapshot while queries and changes go on
+        against the current state; it is then swapped in with the changes
+        made since the snapshot as its delta.
+
+        Args:
+            wait: Merge in this thread; otherwise start a background thread
+
+        Returns:
+            The background merge thread (when not waiting)
+        """
+        with self._lock:
+            if self._merge_changes is not None:
+                # A merge is already running
+                return self._merge_thread
+            snapshot = self._state
+            if not snapshot.changes:
+                return None
+            self._merge_changes = {}
+        if wait:
+            self._merge(snapshot)
+            return None
+        thread = threading.Thread(target=self._merge, args=(snapshot,), name="catalog-merge", daemon=True)
+        self._merge_thread = thread
+        thread.start()
+        return thread
+
+    def _merge(self, snapshot: _Segments):
+        try:
+            items = _merged_items(snapshot)
+            if isinstance(snapshot.base.items, CatalogStore):
+                # Keep the base columnar
+                items = CatalogStore.from_items(items)
+            # Same items as the snapshot, so the same version (and no catalog-wide hash holding the GIL)
+            base = CatalogIndex(items, snapshot.base.field_weights, version=snapshot.version)
+            base_ids = _item_ids(base.items)
+            with self._lock:
+                # Deleting an item the new base does not have leaves nothing to hide
+                changes = {
+                    item_id: item for item_id, item in self._merge_changes.items()
+                    if item is not None or item_id in base_ids
+                }
+                self._publish(base, changes, base_ids)
+            logger.info(f"Catalog segments merged: {len(base)} items, {len(changes)} changes carried over")
+        except Exception as e:
+            logger.error(f"Catalog segment merge failed: {str(e)}")
+        finally:
+            with self._lock:
+                self._merge_changes = None
+
+    def search(self, query: str, operator: str = "and", limit: int = 20,
+               min_price: Optional[float] = None, max_price: Optional[float] = None,
+               category: Optional[str] = None) -> Dict[str, Any]:
+        """Search the current catalog (see CatalogIndex.search())"""
+        if operator not in ("and", "or"):
+            raise ValueError(f"Unknown operator: {operator}")
+        state = self._state
+        return self._search(state, self._terms(state, query), operator, limit, (min_price, max_price, category))
+
+    def resolve(self, text: str, preferred_vendors: Optional[Iterable[str]] = None,
+                candidates: int = 10) -> Optional[Dict[str, Any]]:
+        """Catalog item for a free-text item description (see CatalogIndex.resolve())"""
+        state = self._state
+        terms = self._terms(state, text)
+        return _resolve(
+            lambda operator: self._search(state, terms, operator, candidates)["items"],
+            [
+                {token for segment in terms if segment and segment[index] is not None
+                 for token in segment[index].tokens}
+                for index in range(len(terms[0]))
+            ],
+            preferred_vendors
+        )
+
+    @staticmethod
+    def _terms(state: _Segments, query: str) -> Tuple[List[Optional[_Term]], List[Optional[_Term]]]:
+        """Base and delta terms; a term matches the same way (exact, prefix or fuzzy) in both"""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not len(state.delta):
+            return [state.base._term(token, state.stats) for token in tokens], []
+        levels = [min(state.base._level(token), state.delta._level(token)) for token in tokens]
+        return tuple(
+            [segment._term(token, state.stats, level) for token, level in zip(tokens, levels)]
+            for segment in (state.base, state.delta)
+        )
+
+    @staticmethod
+    def _search(state: _Segments, terms: Tuple[List[Optional[_Term]], List[Optional[_Term]]],
+                operator: str, limit: int, filters: Tuple = (None, None, None)) -> Dict[str, Any]:
+        """Top items of both segments by score; base items win ties, as they come first in the catalog"""
+        base_terms, delta_terms = terms
+        base_top, base_total = state.base._top(
+            base_terms, operator, limit, state.base._allowed(*filters), state.dead
+        )
+        hits = [(-score, 0, position) for score, position in base_top]
+        total = base_total
+        if delta_terms:
+            delta_top, delta_total = state.delta._top(delta_terms, operator, limit, state.delta._allowed(*filters))
+            hits = sorted(hits + [(-score, 1, position) for score, position in delta_top])[:limit]
+            total += delta_total
+        segments = (state.base, state.delta)
+        return {
+            "items": [
+                dict(segments[segment].items[position], score=round(-negative_score, 4))
+                for negative_score, segment, position in hits
+            ],
+            "total_matches": total
+        }
+
+
+def _item_ids(items: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """item id -> position"""
+    if isinstance(items, CatalogStore):
+        return {items.item_id(row): row for row in range(len(items))}
+    return {str(item["id"]): position for position, item in enumerate(items)}
+
+
+def _merged_items(state: _Segments) -> List[Dict[str, Any]]:
+    """A state's items in one list: base order with changes applied, then new items"""
+    items = []
+    for position, item in enumerate(state.base.items):
+        if position not in state.dead:
+            items.append(item)
+            continue
+        replacement = state.changes[str(item["id"])]
+        if replacement is not None:
+            items.append(replacement)
+    items.extend(
+        item for item_id, item in state.changes.items()
+        if item is not None and item_id not in state.base_ids
+    )
+    return items
+
+
+def _normalize_item(raw: Dict[str, Any], position: int) -> Dict[str, Any]:
+    item = dict(raw)
+    # Seed data names items "item" rather than "name"
+    if "name" not in item and "item" in item:
+        item["name"] = item.pop("item")
+    item["id"] = str(item.get("id") or item.get("sku") or position + 1)
+    if item.get("price") not in (None, ""):
+        price = float(item["price"])
+        item["price"] = int(price) if price.is_integer() else price
+    return item
+
+
+def load_catalog(path: str) -> List[Dict[str, Any]]:
+    """
+    Read catalog items from a file
+
+    Args:
+        path: .json (a list, or a document with a "catalog" list), .jsonl or .csv file
+
+    Returns:
+        Items with string ids, a name and numeric prices
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if extension == ".csv":
+            rows = list(csv.DictReader(f))
+        elif extension == ".jsonl":
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = json.load(f)
+            if isinstance(rows, dict):
+                rows = rows.get("catalog", [])
+    return [_normalize_item(row, position) for position, row in enumerate(rows)]
+
+
+# Global catalog index
+_catalog_index = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog_index() -> LiveCatalogIndex:
+    """
+    Get the global catalog index (singleton)
+
+    Built on first use from CATALOG_PATH, falling back to the demo catalog
+    when the variable is unset or the file cannot be read. Catalog updates
+    are applied to it in place (upsert() / delete()).
+    """
+    global _catalog_index
+    with _catalog_lock:
+        if _catalog_index is None:
+            items = DEFAULT_CATALOG
+            path = os.getenv("CATALOG_PATH")
+            if path:
+                try:
+                    items = CatalogStore(path) if path.endswith(STORE_EXTENSION) else load_catalog(path)
+                except (OSError, ValueError) as e:
+                    logger.error(f"Failed to load catalog from {path}: {str(e)}")
+            _catalog_index = LiveCatalogIndex(CatalogIndex(items))
+            logger.info(f"Catalog index built: {len(_catalog_index)} items, {len(_catalog_index.base.vocabulary)} tokens")
+        return _catalog_index
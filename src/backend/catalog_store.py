@@ -0,0 +1,258 @@
+"""
+Catalog Store
+Compact columnar catalog file, memory-mapped read-only
+
+Layout (little-endian, sections 8-byte aligned):
+
+    MAGIC
+    price        float64[rows]   (NaN = no price)
+    category_id  uint32[rows]    index into the header's categories
+    vendor_id    uint32[rows]    index into the header's vendors
+    id, name and extra offsets   uint64[rows + 1] each, into the heap
+    heap         UTF-8 strings; extra holds any other item fields as JSON
+    header       JSON: rows, version, categories, vendors, section offsets
+    uint64 header length, MAGIC
+
+A row costs 40 bytes of columns plus its strings, against hundreds of bytes
+for a Python dict. CatalogStore maps the file read-only, so every worker
+process opening the same file shares its pages, and items are only decoded
+when read. Price, category and vendor filters are vectorized scans over the
+columns.
+"""
+
+import hashlib
+import io
+import json
+import math
+import mmap
+import os
+import struct
+from typing import Dict, Any, Optional, List, Iterable, Iterator
+
+import numpy as np
+
+MAGIC = b"SPCCAT01"
+STORE_EXTENSION = ".cat"
+
+# Fields kept in their own columns; anything else goes to "extra"
+_COLUMN_FIELDS = ("id", "name", "price", "category", "vendor")
+_STRING_COLUMNS = ("id", "name", "extra")
+_FOOTER = struct.Struct("<Q8s")
+
+
+def _align(stream: io.BytesIO):
+    stream.write(b"\0" * (-stream.tell() % 8))
+
+
+def encode_catalog(items: Iterable[Dict[str, Any]]) -> bytes:
+    """
+    Encode catalog items in the store format
+
+    Args:
+        items: Catalog items (id, name, price, category, vendor; other fields are kept as extra)
+
+    Returns:
+        The file contents
+    """
+    items = list(items)
+    categories = sorted({str(item.get("category") or "") for item in items} | {""})
+    vendors = sorted({str(item.get("vendor") or "") for item in items} | {""})
+    category_ids = {name: index for index, name in enumerate(categories)}
+    vendor_ids = {name: index for index, name in enumerate(vendors)}
+
+    price = np.array(
+        [float(item["price"]) if item.get("price") not in (None, "") else math.nan for item in items],
+        dtype="<f8"
+    )
+    category_id = np.array([category_ids[str(item.get("category") or "")] for item in items], dtype="<u4")
+    vendor_id = np.array([vendor_ids[str(item.get("vendor") or "")] for item in items], dtype="<u4")
+
+    # Each string column is contiguous in the heap; offsets[row]..offsets[row + 1] is one value
+    heap = io.BytesIO()
+    offsets = {}
+    for column in _STRING_COLUMNS:
+        offsets[column] = [heap.tell()]
+        for item in items:
+            if column == "extra":
+                extra = {k: v for k, v in item.items() if k not in _COLUMN_FIELDS}
+                value = json.dumps(extra, sort_keys=True, default=str) if extra else ""
+            else:
+                value = str(item.get(column, ""))
+            heap.write(value.encode("utf-8"))
+            offsets[column].append(heap.tell())
+
+    stream = io.BytesIO()
+    stream.write(MAGIC)
+    sections = {}
+    arrays = [("price", price), ("category_id", category_id), ("vendor_id", vendor_id)]
+    arrays += [(f"{column}_offsets", np.array(offsets[column], dtype="<u8")) for column in _STRING_COLUMNS]
+    for name, array in arrays:
+        _align(stream)
+        sections[name] = [stream.tell(), array.dtype.str, len(array)]
+        stream.write(array.tobytes())
+    _align(stream)
+    sections["heap"] = [stream.tell(), "|u1", heap.tell()]
+    stream.write(heap.getvalue())
+
+    body = stream.getvalue()
+    header = json.dumps({
+        "rows": len(items),
+        "version": hashlib.sha256(body).hexdigest(),
+        "categories": categories,
+        "vendors": vendors,
+        "sections": sections
+    }).encode("utf-8")
+    return body + header + _FOOTER.pack(len(header), MAGIC)
+
+
+def write_catalog_store(path: str, items: Iterable[Dict[str, Any]]) -> str:
+    """
+    Write a catalog store file (atomically: readers see the old or the new file)
+
+    Returns:
+        The store version
+    """
+    data = encode_catalog(items)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    return CatalogStore.from_bytes(data).version
+
+
+class CatalogStore:
+    """
+    Read-only columnar catalog
+
+    Behaves as a sequence of item dicts (decoded on access), so it can
+    stand in for a list of items, e.g. in CatalogIndex.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Store file written by write_catalog_store()
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            # The mapping stays valid after the file is closed
+            self._load(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CatalogStore":
+        """Store over in-memory file contents (see encode_catalog())"""
+        store = cls.__new__(cls)
+        store.path = None
+        store._load(data)
+        return store
+
+    @classmethod
+    def from_items(cls, items: Iterable[Dict[str, Any]]) -> "CatalogStore":
+        """Columnar copy of a list of items"""
+        return cls.from_bytes(encode_catalog(items))
+
+    def _load(self, buffer):
+        if len(buffer) < len(MAGIC) + _FOOTER.size or buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a catalog store file")
+        header_size, magic = _FOOTER.unpack(buffer[-_FOOTER.size:])
+        if magic != MAGIC:
+            raise ValueError("Truncated catalog store file")
+        end = len(buffer) - _FOOTER.size
+        header = json.loads(bytes(buffer[end - header_size:end]))
+
+        self._buffer = buffer
+        self.rows = header["rows"]
+        self.version = header["version"]
+        self.categories: List[str] = header["categories"]
+        self.vendors: List[str] = header["vendors"]
+        columns = {
+            name: np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+            for name, (offset, dtype, count) in header["sections"].items()
+        }
+        self.price = columns["price"]
+        self.category_id = columns["category_id"]
+        self.vendor_id = columns["vendor_id"]
+        self._offsets = {column: columns[f"{column}_offsets"] for column in _STRING_COLUMNS}
+        heap_offset = header["sections"]["heap"][0]
+        self._heap = memoryview(buffer)[heap_offset:heap_offset + header["sections"]["heap"][2]]
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def _string(self, column: str, row: int) -> str:
+        offsets = self._offsets[column]
+        return str(self._heap[int(offsets[row]):int(offsets[row + 1])], "utf-8")
+
+    def item_id(self, row: int) -> str:
+        return self._string("id", row)
+
+    def name(self, row: int) -> str:
+        return self._string("name", row)
+
+    def __getitem__(self, row: int) -> Dict[str, Any]:
+        if not -self.rows <= row < self.rows:
+            raise IndexError(f"Catalog row {row} out of range")
+        row %= self.rows
+        item = {"id": self.item_id(row), "name": self.name(row)}
+        price = float(self.price[row])
+        if not math.isnan(price):
+            item["price"] = int(price) if price.is_integer() else price
+        category = self.categories[self.category_id[row]]
+        if category:
+            item["category"] = category
+        vendor = self.vendors[self.vendor_id[row]]
+        if vendor:
+            item["vendor"] = vendor
+        extra = self._string("extra", row)
+        if extra:
+            item.update(json.loads(extra))
+        return item
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for row in range(self.rows):
+            yield self[row]
+
+    @staticmethod
+    def _ids(names: List[str], wanted: Iterable[str]) -> List[int]:
+        wanted = {value.lower() for value in wanted}
+        return [index for index, name in enumerate(names) if name and name.lower() in wanted]
+
+    def filter(self, min_price: Optional[float] = None, max_price: Optional[float] = None,
+               categories: Optional[Iterable[str]] = None,
+               vendors: Optional[Iterable[str]] = None) -> np.ndarray:
+        """
+        Rows passing every given filter, by vectorized scans over the columns
+
+        Args:
+            min_price: Lowest price (inclusive); unpriced items never pass a price filter
+            max_price: Highest price (inclusive)
+            categories: Category names to keep (case-insensitive)
+            vendors: Vendor names to keep (case-insensitive)
+
+        Returns:
+            Sorted row numbers
+        """
+        mask = np.ones(self.rows, dtype=bool)
+        if min_price is not None:
+            mask &= self.price >= min_price
+        if max_price is not None:
+            mask &= self.price <= max_price
+        if categories is not None:
+            mask &= np.isin(self.category_id, self._ids(self.categories, categories))
+        if vendors is not None:
+            mask &= np.isin(self.vendor_id, self._ids(self.vendors, vendors))
+        return np.flatnonzero(mask)
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from backend.catalog_index import load_catalog
+
+    # Convert a .json/.jsonl/.csv catalog: python catalog_store.py catalog.json catalog.cat
+    source, target = sys.argv[1], sys.argv[2]
+    version = write_catalog_store(target, load_catalog(source))
+    print(f"Wrote {target} (version {version[:12]})")
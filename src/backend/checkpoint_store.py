@@ -0,0 +1,252 @@
+"""
+Checkpoint Store
+Durable state for long-running workflow executions
+
+Checkpoints are appended to a JSONL log; the latest checkpoint of every
+execution is also kept as a compact per-execution record, which is written
+to a snapshot file when the log is compacted. On open the snapshot is loaded
+and the log tail replayed, so recovery reads each execution's state once.
+
+Appends go through a single writer thread that group-commits: everything
+queued while the previous batch was being written goes out in one write and
+one fsync. Callers that need durability before continuing (suspension,
+completion) wait for their batch; step checkpoints do not.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Dict, Any, Optional, List
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", os.path.join("logs", "checkpoints"))
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+class CheckpointWrite:
+    """Handle for a queued checkpoint; wait() returns once it is on disk"""
+
+    def __init__(self, record: Optional[Dict[str, Any]]):
+        # record is None for flush markers
+        self.record = record
+        self.event = threading.Event()
+        self.error: Optional[Exception] = None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        if not self.event.wait(timeout):
+            return False
+        if self.error is not None:
+            raise self.error
+        return True
+
+
+class CheckpointStore:
+    """
+    Append-only checkpoint log with a compact latest-state record per execution
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        fsync: bool = True,
+        max_batch: int = 512,
+        compact_after: int = 10000
+    ):
+        """
+        Args:
+            directory: Where checkpoints.log and executions.json live
+            fsync: fsync after every group commit (disable only for tests/benchmarks)
+            max_batch: Max records written per group commit
+            compact_after: Log records before the log is folded into the snapshot
+        """
+        self.directory = directory or DEFAULT_CHECKPOINT_DIR
+        os.makedirs(self.directory, exist_ok=True)
+        self.log_path = os.path.join(self.directory, "checkpoints.log")
+        self.snapshot_path = os.path.join(self.directory, "executions.json")
+        self.fsync = fsync
+        self.max_batch = max_batch
+        self.compact_after = compact_after
+
+        self.executions: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._log_records = self._recover()
+
+        self._queue: "queue.Queue[Optional[CheckpointWrite]]" = queue.Queue()
+        self._log = open(self.log_path, "a", encoding="utf-8")
+        self._closed = False
+        self.batches_written = 0
+        self._writer = threading.Thread(target=self._write_loop, name="checkpoint-writer", daemon=True)
+        self._writer.start()
+
+    def _recover(self) -> int:
+        """Load the snapshot, then replay the log tail on top of it"""
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                self.executions = json.load(f)
+
+        replayed = 0
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn final write from a crash - everything before it is intact
+                        logger.warning("Ignoring truncated checkpoint record")
+                        break
+                    self._apply(record)
+                    replayed += 1
+        if self.executions:
+            logger.info(
+                f"Recovered {len(self.executions)} executions "
+                f"({len(self.incomplete())} incomplete, {replayed} log records)"
+            )
+        return replayed
+
+    def _apply(self, record: Dict[str, Any]):
+        current = self.executions.get(record["execution_id"])
+        if current is None or record["seq"] >= current["seq"]:
+            self.executions[record["execution_id"]] = record
+
+    def save(
+        self,
+        execution_id: str,
+        workflow_id: str,
+        status: str,
+        state: Dict[str, Any],
+        seq: int
+    ) -> CheckpointWrite:
+        """
+        Queue a checkpoint; the compact record is updated immediately
+
+        Args:
+            execution_id: Workflow execution id
+            workflow_id: Workflow being executed
+            status: running, suspended, completed or failed
+            state: Engine state needed to resume the execution
+            seq: Monotonic checkpoint number within the execution
+
+        Returns:
+            CheckpointWrite; call wait() to block until it is durable
+        """
+        if self._closed:
+            raise RuntimeError("Checkpoint store is closed")
+        record = {
+            "execution_id": execution_id,
+            "workflow_id": workflow_id,
+            "status": status,
+            "seq": seq,
+            "saved_at": time.time(),
+            "state": state
+        }
+        with self._lock:
+            self._apply(record)
+        write = CheckpointWrite(record)
+        self._queue.put(write)
+        return write
+
+    def get(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """Latest checkpoint of an execution"""
+        with self._lock:
+            return self.executions.get(execution_id)
+
+    def incomplete(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Latest checkpoints of executions that have not finished
+
+        Args:
+            status: Only return executions in this status (e.g. "running")
+        """
+        with self._lock:
+            return [
+                record for record in self.executions.values()
+                if record["status"] not in TERMINAL_STATUSES
+                and (status is None or record["status"] == status)
+            ]
+
+    def _write_loop(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            error = None
+            try:
+                self._log.write("".join(
+                    json.dumps(w.record, default=str) + "\n" for w in batch if w.record is not None
+                ))
+                self._log.flush()
+                if self.fsync:
+                    os.fsync(self._log.fileno())
+                self.batches_written += 1
+                self._log_records += len(batch)
+            except Exception as e:
+                logger.error(f"Checkpoint write failed: {str(e)}")
+                error = e
+            for write in batch:
+                write.error = error
+                write.event.set()
+
+            if error is None and self._log_records >= self.compact_after:
+                self._compact()
+            if stop:
+                return
+
+    def _compact(self):
+        """Fold the log into the snapshot and start a fresh log (writer thread only)"""
+        with self._lock:
+            snapshot = json.dumps(self.executions, default=str)
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(snapshot)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        self._log.close()
+        self._log = open(self.log_path, "w", encoding="utf-8")
+        self._log_records = 0
+        logger.info(f"Checkpoint log compacted ({len(self.executions)} executions)")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything queued so far is durable"""
+        marker = CheckpointWrite(None)
+        self._queue.put(marker)
+        return marker.wait(timeout)
+
+    def close(self):
+        """Drain pending writes and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+        self._log.close()
+
+
+# Global checkpoint store instance
+_checkpoint_store = None
+
+
+def get_checkpoint_store() -> CheckpointStore:
+    """Get global checkpoint store in CHECKPOINT_DIR (singleton)"""
+    global _checkpoint_store
+    if _checkpoint_store is None:
+        _checkpoint_store = CheckpointStore()
+    return _checkpoint_store
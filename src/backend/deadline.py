@@ -0,0 +1,153 @@
+"""
+Request Deadlines & Cancellation
+One deadline per request, visible to everything the request calls
+
+A Deadline combines an absolute expiry (time.monotonic based) with an
+explicit cancel flag. The active deadline lives in a ContextVar, so it follows
+the request through function calls and into worker pools that run tasks with
+contextvars.copy_context() (as the orchestrator does). Nested scopes can only
+tighten a deadline; cancelling a parent cancels every child.
+
+Downstream code checks the deadline before starting work (check_deadline)
+and caps its own I/O timeouts with remaining_timeout(), so work stops once
+the caller has given up instead of running to completion for nobody.
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+_current_deadline: contextvars.ContextVar = contextvars.ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a request's deadline has passed or the request was cancelled"""
+
+
+class Deadline:
+    """Absolute request deadline with cooperative cancellation"""
+
+    def __init__(self, seconds: Optional[float] = None, parent: Optional["Deadline"] = None):
+        """
+        Args:
+            seconds: Time budget from now (None = no time limit)
+            parent: Enclosing deadline; the earlier expiry wins and
+                cancelling the parent cancels this deadline
+        """
+        self.parent = parent
+        expires_at = time.monotonic() + seconds if seconds is not None else None
+        if parent is not None and parent.expires_at is not None:
+            expires_at = parent.expires_at if expires_at is None else min(expires_at, parent.expires_at)
+        self.expires_at = expires_at
+        self._cancelled = threading.Event()
+        self.reason: Optional[str] = None
+
+    def cancel(self, reason: str = "cancelled by caller"):
+        """Signal that the caller has given up"""
+        self.reason = reason
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        deadline = self
+        while deadline is not None:
+            if deadline._cancelled.is_set():
+                return True
+            deadline = deadline.parent
+        return False
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None if there is no time limit"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """True once the deadline has passed or the request was cancelled"""
+        if self.cancelled:
+            return True
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def check(self, operation: str = "request"):
+        """Raise DeadlineExceeded if the caller has given up"""
+        if self.cancelled:
+            raise DeadlineExceeded(f"{operation} cancelled: {self._cancel_reason()}")
+        if self.expires_at is not None and time.monotonic() >= self.expires_at:
+            raise DeadlineExceeded(f"{operation} exceeded its deadline")
+
+    def timeout(self, default: Optional[float] = None) -> Optional[float]:
+        """
+        Timeout for a blocking call: the smaller of default and the time left
+
+        Raises:
+            DeadlineExceeded: if no time is left
+        """
+        self.check()
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        return remaining if default is None else min(default, remaining)
+
+    def _cancel_reason(self) -> str:
+        deadline = self
+        while deadline is not None:
+            if deadline._cancelled.is_set():
+                return deadline.reason or "cancelled"
+            deadline = deadline.parent
+        return "cancelled"
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The deadline of the request being processed, if any"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float] = None, deadline: Optional[Deadline] = None):
+    """
+    Run a block under a deadline nested inside the current one
+
+    Args:
+        seconds: Time budget for the block (None = inherit only)
+        deadline: Use this Deadline instead of creating one (e.g. so the
+            caller can cancel it from another thread)
+
+    Yields:
+        The active Deadline
+    """
+    if deadline is None:
+        deadline = Deadline(seconds, parent=_current_deadline.get())
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def check_deadline(operation: str = "request"):
+    """Raise DeadlineExceeded if the current request's deadline has passed"""
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check(operation)
+
+
+def remaining_timeout(default: Optional[float] = None) -> Optional[float]:
+    """Cap an I/O timeout by the current request's remaining time"""
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return default
+    return deadline.timeout(default)
+
+
+def detached_context() -> contextvars.Context:
+    """
+    Copy of the current context without a request deadline
+
+    For work that must outlive the request (audit logging, fire-and-forget
+    submissions) when it is handed to a worker pool.
+    """
+    context = contextvars.copy_context()
+    context.run(_current_deadline.set, None)
+    return context
@@ -0,0 +1,153 @@
+"""
+Field Extraction Engine
+Single-pass extraction of requisition and vendor fields from free text
+
+All field patterns are compiled once at import time into one alternation.
+A message is tokenized with a single finditer scan; item and department are
+then sliced from the text using the offsets of the anchors found (price,
+quantity, "for"/"in", labelled vendor/tax ID/industry clauses), so no pattern
+is ever applied twice.
+"""
+
+import re
+from typing import Dict, Any, List, Optional, Iterable
+
+_FIELD_GRAMMAR = re.compile(
+    r"""
+      \$(?P<price>\d[\d,]*(?:\.\d+)?)
+    | \b(?:
+          tax\s*id[:\s]+(?P<tax_id>[0-9-]+)
+        | industry[:\s]+(?P<industry>[^,\n]+)
+        | (?:from\s+)?(?:vendor|company|supplier)\b[:\s]+
+            (?P<vendor_name>(?:(?!\btax\s*id\b|\bindustry\b|\s+(?:for|in)\b)[^,\n])+)
+        | (?P<verb>buy|order|need|purchase|get)\b(?:\s+(?P<quantity>\d+)\b)?
+        | (?P<prep>for|in)\s+(?:the\s+)?
+        | (?P<request_ref>[A-Z]+-\d+)\b
+      )
+    """,
+    re.IGNORECASE | re.VERBOSE
+)
+
+_TRAILING_PUNCTUATION = " \t\n.!?;:"
+
+
+class Span:
+    """An extracted field value with its character offsets in the source text"""
+
+    __slots__ = ("field", "value", "start", "end")
+
+    def __init__(self, field: str, value: Any, start: int, end: int):
+        self.field = field
+        self.value = value
+        self.start = start
+        self.end = end
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"field": self.field, "value": self.value, "start": self.start, "end": self.end}
+
+    def __repr__(self) -> str:
+        return f"Span({self.field}={self.value!r}, {self.start}:{self.end})"
+
+
+class ExtractionResult:
+    """Structured spans plus a field dictionary built from them"""
+
+    def __init__(self, text: str, spans: List[Span]):
+        self.text = text
+        self.spans = spans
+        self.fields: Dict[str, Any] = {}
+        for span in spans:
+            self.fields.setdefault(span.field, span.value)
+
+    def get(self, field: str, default: Any = None) -> Any:
+        return self.fields.get(field, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fields": dict(self.fields),
+            "spans": [span.to_dict() for span in self.spans]
+        }
+
+
+def _parse_price(raw: str):
+    value = raw.replace(",", "")
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+def _clean_span(text: str, start: int, end: int):
+    """Trim whitespace and trailing punctuation, returning adjusted offsets"""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1] in _TRAILING_PUNCTUATION:
+        end -= 1
+    return start, end
+
+
+def extract(text: str) -> ExtractionResult:
+    """
+    Extract price, quantity, item, department, tax ID, vendor name, industry
+    and request reference from text in one scan
+
+    Args:
+        text: Free-text user message
+
+    Returns:
+        ExtractionResult with spans in text order
+    """
+    spans: List[Span] = []
+    price: Optional[Span] = None
+    quantity: Optional[Span] = None
+    prep_positions: List[tuple] = []
+    clause_starts: List[int] = []
+
+    for match in _FIELD_GRAMMAR.finditer(text):
+        kind = match.lastgroup
+        if kind == "price":
+            if price is None:
+                price = Span("price", _parse_price(match.group("price")), *match.span("price"))
+                spans.append(price)
+        elif kind in ("verb", "quantity"):
+            if quantity is None and match.group("quantity"):
+                quantity = Span("quantity", int(match.group("quantity")), *match.span("quantity"))
+                spans.append(quantity)
+        elif kind == "prep":
+            prep_positions.append(match.span())
+        elif kind == "request_ref":
+            spans.append(Span("request_ref", match.group(kind).upper(), *match.span(kind)))
+        else:
+            clause_starts.append(match.start())
+            start, end = _clean_span(text, *match.span(kind))
+            if end > start:
+                spans.append(Span(kind, text[start:end], start, end))
+
+    # Item runs from the price (or quantity) anchor to the next "for"/"in" or
+    # labelled clause ("from vendor Dell"); department runs from that
+    # preposition to the next labelled clause.
+    anchor = price or quantity
+    if anchor is not None:
+        item_end = len(text)
+        department_start = None
+        for prep_start, prep_end in prep_positions:
+            if prep_start >= anchor.end:
+                item_end = prep_start
+                department_start = prep_end
+                break
+        item_end = min([item_end] + [c for c in clause_starts if c >= anchor.end])
+
+        start, end = _clean_span(text, anchor.end, item_end)
+        if end > start:
+            spans.append(Span("item", text[start:end], start, end))
+            if department_start is not None:
+                department_end = min([len(text)] + [c for c in clause_starts if c >= department_start])
+                start, end = _clean_span(text, department_start, department_end)
+                if end > start:
+                    spans.append(Span("department", text[start:end], start, end))
+
+    spans.sort(key=lambda span: span.start)
+    return ExtractionResult(text, spans)
+
+
+def extract_many(texts: Iterable[str]) -> List[ExtractionResult]:
+    """Extract fields for every text, preserving order"""
+    return [extract(text) for text in texts]
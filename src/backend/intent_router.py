@@ -0,0 +1,266 @@
+"""
+Intent Router
+Data-driven intent detection compiled into a single-pass keyword automaton
+
+Keyword and phrase tables come from the "routing" section of the agent
+definitions in orchestrate/agents/*.json. All keywords are compiled into one
+Aho-Corasick automaton, so a message is scanned once regardless of how many
+keywords are configured, and every agent is scored from that single scan.
+"""
+
+import glob
+import json
+import logging
+import os
+from collections import deque
+from typing import Dict, Any, Optional, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_AGENTS_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'orchestrate', 'agents'
+)
+
+
+class IntentMatch:
+    """One scored routing candidate"""
+
+    def __init__(
+        self,
+        agent_id: str,
+        workflow_id: str,
+        score: float,
+        confidence: float,
+        matched: List[str]
+    ):
+        self.agent_id = agent_id
+        self.workflow_id = workflow_id
+        self.score = score
+        self.confidence = confidence
+        self.matched = matched
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "agent_id": self.agent_id,
+            "workflow_id": self.workflow_id,
+            "score": self.score,
+            "confidence": self.confidence,
+            "matched": list(self.matched)
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"IntentMatch({self.agent_id}, score={self.score}, "
+            f"confidence={self.confidence:.2f}, matched={self.matched})"
+        )
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over lowercase keywords and phrases
+
+    Matches must start and end on a word boundary, so "new" matches neither
+    "renew" nor "news". A keyword ending in "*" is a prefix and may end
+    mid-word: "order*" matches "orders" and "ordering" but not "reorder".
+    """
+
+    def __init__(self, keywords: List[str]):
+        self.keywords = keywords
+        self.lengths = [len(keyword.rstrip("*")) for keyword in keywords]
+        self.prefix = [keyword.endswith("*") for keyword in keywords]
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[int]] = [[]]
+
+        for index, keyword in enumerate(keywords):
+            state = 0
+            for char in keyword.rstrip("*"):
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = next_state
+            self.output[state].append(index)
+
+        # Breadth-first construction of failure links
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                candidate = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = candidate if candidate != next_state else 0
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def scan(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Find all keyword occurrences in one pass
+
+        Args:
+            text: Lowercased text to scan
+
+        Returns:
+            List of (keyword_index, start_offset) pairs
+        """
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        lengths = self.lengths
+        prefix = self.prefix
+        last = len(text) - 1
+        hits = []
+        state = 0
+
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                for index in output[state]:
+                    start = position - lengths[index] + 1
+                    if start and text[start - 1].isalnum():
+                        continue
+                    if prefix[index] or position == last or not text[position + 1].isalnum():
+                        hits.append((index, start))
+        return hits
+
+
+class IntentRouter:
+    """
+    Ranks agents for a message using weighted keyword scores
+
+    Each distinct keyword contributes its weight once per message. Ties are
+    broken by the agent's configured priority (lower wins).
+    """
+
+    def __init__(self, routes: List[Dict[str, Any]]):
+        """
+        Args:
+            routes: Routing tables, each with agent_id, workflow_id, priority,
+                keywords ({keyword: weight}, "*" suffix for prefixes) and
+                optional fallback flag
+        """
+        self.routes = sorted(routes, key=lambda r: r.get("priority", 100))
+        self.fallback = next((r for r in self.routes if r.get("fallback")), None)
+
+        keywords: List[str] = []
+        # keyword index -> list of (route index, weight)
+        self.keyword_targets: List[List[Tuple[int, float]]] = []
+        positions: Dict[str, int] = {}
+
+        for route_index, route in enumerate(self.routes):
+            for keyword, weight in route.get("keywords", {}).items():
+                keyword = " ".join(keyword.lower().split())
+                if keyword not in positions:
+                    positions[keyword] = len(keywords)
+                    keywords.append(keyword)
+                    self.keyword_targets.append([])
+                self.keyword_targets[positions[keyword]].append((route_index, float(weight)))
+
+        self.automaton = KeywordAutomaton(keywords)
+        logger.info(f"Intent router compiled: {len(self.routes)} routes, {len(keywords)} keywords")
+
+    @classmethod
+    def from_agent_configs(cls, agents_dir: Optional[str] = None) -> "IntentRouter":
+        """
+        Build a router from the "routing" sections of agent JSON definitions
+
+        Args:
+            agents_dir: Directory with agent definitions (default orchestrate/agents)
+        """
+        routes = []
+        for path in sorted(glob.glob(os.path.join(agents_dir or DEFAULT_AGENTS_DIR, "*.json"))):
+            with open(path, "r") as f:
+                definition = json.load(f)
+            routing = definition.get("routing")
+            if not routing:
+                continue
+            if "agent_id" not in routing or "workflow_id" not in routing:
+                raise ValueError(f"Routing section in {path} needs agent_id and workflow_id")
+            routes.append(routing)
+        return cls(routes)
+
+    def rank(self, text: str) -> List[IntentMatch]:
+        """
+        Score every agent against the message in one linear scan
+
+        Args:
+            text: User message
+
+        Returns:
+            Matching intents ordered by score (highest first); empty if no
+            keyword matched
+        """
+        normalized = " ".join(text.lower().split())
+        scores = [0.0] * len(self.routes)
+        matched: List[List[str]] = [[] for _ in self.routes]
+        seen = set()
+
+        for keyword_index, _ in self.automaton.scan(normalized):
+            if keyword_index in seen:
+                continue
+            seen.add(keyword_index)
+            keyword = self.automaton.keywords[keyword_index]
+            for route_index, weight in self.keyword_targets[keyword_index]:
+                scores[route_index] += weight
+                matched[route_index].append(keyword)
+
+        total = sum(scores)
+        ranked = [
+            IntentMatch(
+                agent_id=route["agent_id"],
+                workflow_id=route["workflow_id"],
+                score=scores[i],
+                confidence=scores[i] / total,
+                matched=matched[i]
+            )
+            for i, route in enumerate(self.routes) if scores[i] > 0
+        ]
+        # sorted() is stable, so equal scores keep priority order
+        ranked.sort(key=lambda match: match.score, reverse=True)
+        return ranked
+
+    def route(self, text: str) -> IntentMatch:
+        """
+        Pick the best intent, falling back to the configured fallback route
+
+        Args:
+            text: User message
+
+        Returns:
+            Top IntentMatch (fallback has score and confidence 0)
+        """
+        ranked = self.rank(text)
+        if ranked:
+            return ranked[0]
+        if self.fallback is None:
+            raise LookupError("No intent matched and no fallback route configured")
+        return IntentMatch(
+            agent_id=self.fallback["agent_id"],
+            workflow_id=self.fallback["workflow_id"],
+            score=0.0,
+            confidence=0.0,
+            matched=[]
+        )
+
+    def route_many(self, texts: List[str]) -> List[IntentMatch]:
+        """Route a batch of messages, preserving order"""
+        return [self.route(text) for text in texts]
+
+
+# Global router instance
+_intent_router = None
+
+
+def get_intent_router() -> IntentRouter:
+    """Get global intent router built from orchestrate/agents (singleton)"""
+    global _intent_router
+    if _intent_router is None:
+        _intent_router = IntentRouter.from_agent_configs()
+    return _intent_router
@@ -1,14 +1,57 @@
 import logging
 import os
 import json
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 
+# Buffer for log_step entries while a batch() block is active
+_step_batch: ContextVar = ContextVar("workflow_step_batch", default=None)
+
+
+def emit_batch(target, messages, level=logging.INFO):
+    """
+    Emit many log messages with a single write and flush per handler.
+
+    Walks the logger hierarchy like Logger.callHandlers, but stream handlers
+    receive all formatted records in one write instead of one per record.
+    """
+    if not messages or not target.isEnabledFor(level):
+        return
+
+    records = [
+        target.makeRecord(target.name, level, "(batch)", 0, message, None, None)
+        for message in messages
+    ]
+    current = target
+    while current:
+        for handler in current.handlers:
+            if level < handler.level:
+                continue
+            accepted = [record for record in records if handler.filter(record)]
+            if isinstance(handler, logging.StreamHandler) and getattr(handler, "stream", None):
+                handler.acquire()
+                try:
+                    handler.stream.write(
+                        "".join(handler.format(record) + handler.terminator for record in accepted)
+                    )
+                    handler.flush()
+                finally:
+                    handler.release()
+            else:
+                for record in accepted:
+                    handler.handle(record)
+        if not current.propagate:
+            break
+        current = current.parent
+
+
 class Logger:
     def __init__(self):
         self.log_dir = "logs"
         if not os.path.exists(self.log_dir):
             os.makedirs(self.log_dir)
-            
+
         # Configure logging
         logging.basicConfig(
             filename=os.path.join(self.log_dir, 'workflow_execution.log'),
@@ -28,9 +71,33 @@ class Logger:
             "details": details or {},
             "timestamp": datetime.now().isoformat()
         }
+        buffer = _step_batch.get()
+        if buffer is not None:
+            buffer.append(json.dumps(log_entry))
+            return
         self.logger.info(json.dumps(log_entry))
         print(f"[LOG] {step_name}: {status}")
 
+    @contextmanager
+    def batch(self):
+        """
+        Buffer log_step calls and write them in one flush when the block exits.
+
+        Nested batches join the outermost one.
+        """
+        if _step_batch.get() is not None:
+            yield
+            return
+        buffer = []
+        token = _step_batch.set(buffer)
+        try:
+            yield
+        finally:
+            _step_batch.reset(token)
+            emit_batch(self.logger, buffer)
+            if buffer:
+                print(f"[LOG] {len(buffer)} workflow steps flushed")
+
     def log_error(self, workflow_id, error_msg):
         self.logger.error(f"Workflow {workflow_id} Failed: {error_msg}")
 
@@ -41,4 +108,3 @@ def get_logger(name=None):
     if name:
         return logging.getLogger(name)
     return workflow_logger.logger
-
@@ -0,0 +1,288 @@
+"""
+Traffic Record & Replay
+Reproducible orchestrator benchmarking from captured traffic
+
+Recording: an Orchestrator created with a TrafficRecorder (or with
+ORCHESTRATOR_RECORD_TRACE set for the global instance) appends every routed
+message to a JSONL trace with its arrival offset and session id.
+
+Replay: replay_trace() feeds a trace to a seeded Orchestrator at the recorded
+pacing scaled by a speed factor (speed=0 sends as fast as possible) and
+returns a ReplayReport with latency percentiles, throughput and a per-agent
+breakdown. With the same trace, seed and speed, two versions of the code do
+the same simulated work, so their reports can be compared directly. Replays
+never reach the real watsonx service: they use the mock client, or the local
+stand-in (backend.watsonx_standin) when its URL is given.
+
+Usage:
+    cd src && python -m backend.replay ../logs/traffic.jsonl --speed 0 --seed 42 --json report.json
+    cd src && python -m backend.replay ../logs/traffic.jsonl --standin-url http://127.0.0.1:8900/v2
+"""
+
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, List
+
+logger = logging.getLogger(__name__)
+
+
+class SystemClock:
+    """Wall clock used for timestamps shown to users"""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+
+class FixedClock:
+    """
+    Deterministic clock for replay: starts at a fixed instant and advances by
+    a constant step on every reading
+    """
+
+    def __init__(self, start: Optional[datetime] = None, step_seconds: float = 0.0):
+        self.current = start or datetime(2025, 1, 1, 9, 0, 0)
+        self.step = timedelta(seconds=step_seconds)
+        self._lock = threading.Lock()
+
+    def now(self) -> datetime:
+        with self._lock:
+            value = self.current
+            self.current = value + self.step
+            return value
+
+
+class TrafficRecorder:
+    """Appends routed messages to a JSONL trace"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Trace file; appended to if it already exists
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+
+    def record(self, session_id: str, message: str):
+        entry = {
+            "offset_ms": round((time.monotonic() - self._started) * 1000, 3),
+            "session_id": session_id,
+            "message": message
+        }
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def load_trace(path: str) -> List[Dict[str, Any]]:
+    """
+    Read a recorded trace
+
+    Returns:
+        Entries ordered by arrival offset
+    """
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                entries.append(json.loads(line))
+    entries.sort(key=lambda entry: entry.get("offset_ms", 0.0))
+    return entries
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(fraction * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _latency_summary(latencies_ms: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies_ms)
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered), 3) if ordered else 0.0,
+        "p50_ms": round(_percentile(ordered, 0.50), 3),
+        "p95_ms": round(_percentile(ordered, 0.95), 3),
+        "p99_ms": round(_percentile(ordered, 0.99), 3),
+        "max_ms": round(ordered[-1], 3) if ordered else 0.0
+    }
+
+
+class ReplayReport:
+    """Latency and throughput of one replay run"""
+
+    def __init__(
+        self,
+        samples: List[Dict[str, Any]],
+        wall_seconds: float,
+        drain_seconds: float,
+        settings: Dict[str, Any]
+    ):
+        self.samples = samples
+        self.wall_seconds = wall_seconds
+        self.drain_seconds = drain_seconds
+        self.settings = settings
+
+    def to_dict(self) -> Dict[str, Any]:
+        ok = [s for s in self.samples if s["error"] is None]
+        per_agent: Dict[str, List[float]] = {}
+        for sample in ok:
+            per_agent.setdefault(sample["agent"], []).append(sample["latency_ms"])
+        return {
+            "settings": dict(self.settings),
+            "requests": len(self.samples),
+            "errors": len(self.samples) - len(ok),
+            "wall_seconds": round(self.wall_seconds, 3),
+            "drain_seconds": round(self.drain_seconds, 3),
+            "throughput_rps": round(len(ok) / self.wall_seconds, 2) if self.wall_seconds > 0 else 0.0,
+            "latency": _latency_summary([s["latency_ms"] for s in ok]),
+            "agents": {agent: _latency_summary(values) for agent, values in sorted(per_agent.items())}
+        }
+
+    def format(self) -> str:
+        """Plain-text summary for terminals and CI logs"""
+        data = self.to_dict()
+        latency = data["latency"]
+        lines = [
+            f"Replay: {data['requests']} requests, {data['errors']} errors, "
+            f"{data['wall_seconds']}s wall (+{data['drain_seconds']}s background drain)",
+            f"Throughput: {data['throughput_rps']} req/s",
+            f"Latency: p50 {latency['p50_ms']}ms  p95 {latency['p95_ms']}ms  "
+            f"p99 {latency['p99_ms']}ms  max {latency['max_ms']}ms",
+            "Per agent:"
+        ]
+        for agent, summary in data["agents"].items():
+            lines.append(
+                f"  {agent:<22} n={summary['count']:<6} p50 {summary['p50_ms']}ms  "
+                f"p95 {summary['p95_ms']}ms  p99 {summary['p99_ms']}ms"
+            )
+        return "\n".join(lines)
+
+
+def replay_trace(
+    trace: List[Dict[str, Any]],
+    orchestrator=None,
+    speed: float = 1.0,
+    concurrency: int = 1,
+    seed: int = 0,
+    standin_url: Optional[str] = None
+) -> ReplayReport:
+    """
+    Replay recorded traffic through an orchestrator
+
+    Requests are released at their recorded offsets divided by speed
+    (open loop); latency is measured from the scheduled release, so queueing
+    behind slow requests shows up in the percentiles.
+
+    Args:
+        trace: Entries from load_trace()
+        orchestrator: Orchestrator to drive (default: a new one seeded with seed
+            and a FixedClock, closed when the replay ends)
+        speed: Pacing multiplier; 2.0 replays twice as fast, 0 sends back-to-back
+        concurrency: Requests in flight at once
+        seed: Seed for the default orchestrator
+        standin_url: watsonx stand-in base URL for the default orchestrator
+            (default: the mock client)
+
+    Returns:
+        ReplayReport
+    """
+    if orchestrator is not None:
+        return _replay(trace, orchestrator, speed, concurrency, seed)
+
+    from backend.orchestrator import Orchestrator
+    from backend.watsonx_orchestrate_client import WatsonxOrchestrationClient
+    client = WatsonxOrchestrationClient(base_url=standin_url, use_mock=standin_url is None)
+    orchestrator = Orchestrator(seed=seed, clock=FixedClock(), watsonx_client=client)
+    try:
+        return _replay(trace, orchestrator, speed, concurrency, seed)
+    finally:
+        orchestrator.close()
+
+
+def _replay(trace: List[Dict[str, Any]], orchestrator, speed: float, concurrency: int, seed: int) -> ReplayReport:
+    samples: List[Optional[Dict[str, Any]]] = [None] * len(trace)
+
+    def send(index: int, entry: Dict[str, Any], scheduled: float):
+        try:
+            result = orchestrator.route_message(entry["message"], session_id=entry.get("session_id"))
+            agent, error = result["agent"], None
+        except Exception as e:
+            agent, error = None, str(e)
+        samples[index] = {
+            "agent": agent,
+            "latency_ms": (time.perf_counter() - scheduled) * 1000,
+            "error": error
+        }
+
+    first_offset = trace[0].get("offset_ms", 0.0) if trace else 0.0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="replay") as pool:
+        for index, entry in enumerate(trace):
+            scheduled = started
+            if speed > 0:
+                scheduled += (entry.get("offset_ms", 0.0) - first_offset) / 1000 / speed
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            else:
+                scheduled = time.perf_counter()
+            if concurrency <= 1:
+                send(index, entry, scheduled)
+            else:
+                pool.submit(send, index, entry, scheduled)
+    wall_seconds = time.perf_counter() - started
+
+    drain_started = time.perf_counter()
+    if hasattr(orchestrator, "wait_for_background"):
+        orchestrator.wait_for_background()
+    drain_seconds = time.perf_counter() - drain_started
+
+    settings = {
+        "seed": getattr(orchestrator, "seed", seed),
+        "speed": speed,
+        "concurrency": concurrency
+    }
+    return ReplayReport(samples, wall_seconds, drain_seconds, settings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded orchestrator traffic")
+    parser.add_argument("trace", help="JSONL trace recorded with ORCHESTRATOR_RECORD_TRACE")
+    parser.add_argument("--speed", type=float, default=1.0, help="Pacing multiplier (0 = as fast as possible)")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write the report as JSON")
+    parser.add_argument("--standin-url", default=None, help="watsonx stand-in base URL (default: mock client)")
+    args = parser.parse_args()
+
+    report = replay_trace(
+        load_trace(args.trace), speed=args.speed, concurrency=args.concurrency, seed=args.seed,
+        standin_url=args.standin_url
+    )
+    print(report.format())
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report.to_dict(), f, indent=2)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
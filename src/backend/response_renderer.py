@@ -0,0 +1,383 @@
+"""
+Response Rendering
+Formats structured agent results as markdown, plain text or JSON
+
+Agents decide; the renderer formats. Each agent returns an AgentResponse (an
+outcome name plus the values its reply needs) and the renderer looks up the
+template registered for that outcome.
+
+Templates are compiled once per output format when they are registered:
+format strings are split into static fragments and field references,
+adjacent static fragments are merged, and the plain-text variant strips the
+markdown markup from the static fragments at compile time. Rendering is then
+a single walk over the compiled nodes followed by one str.join.
+
+render_stream() walks the same nodes lazily and hands out the reply one
+section (blank-line separated block) at a time as it is produced, for
+streaming chat clients.
+
+Template pieces:
+    "text {field:spec}"             Line(s) with str.format-style fields
+    when(field, *pieces)            Pieces included when data[field] is set (not None)
+    choose(field, cases, default)   Pieces selected by the value of data[field]
+    each(field, *pieces)            Pieces repeated for every dict in data[field]
+                                    (item keys plus "index", counted from 1)
+"""
+
+import json
+import re
+from collections import ChainMap
+from string import Formatter
+from typing import Dict, Any, Optional, List, Iterator, Sequence
+
+FORMATS = ("markdown", "text", "json")
+
+# Markdown markup removed from static fragments for the plain-text format
+_MARKUP = re.compile(r"\*\*|[*`]")
+
+# Streamed replies are cut after every blank line
+_SECTIONS = re.compile(r"(?<=\n\n)")
+
+_FORMATTER = Formatter()
+
+
+class AgentResponse:
+    """Structured agent result: an outcome name and the values to render"""
+
+    __slots__ = ("outcome", "data")
+
+    def __init__(self, outcome: str, data: Optional[Dict[str, Any]] = None):
+        self.outcome = outcome
+        self.data = data or {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"outcome": self.outcome, "data": self.data}
+
+    def __repr__(self) -> str:
+        return f"AgentResponse({self.outcome!r})"
+
+
+class _Block:
+    """Conditional, branching or repeated group of template pieces"""
+
+    __slots__ = ("kind", "field", "pieces", "cases", "default")
+
+    def __init__(self, kind: str, field: str, pieces: Sequence = (), cases: Optional[Dict[Any, Sequence]] = None,
+                 default: Sequence = ()):
+        self.kind = kind
+        self.field = field
+        self.pieces = pieces
+        self.cases = cases or {}
+        self.default = default
+
+
+def when(field: str, *pieces) -> _Block:
+    """Include pieces only when data[field] is set (not None)"""
+    return _Block("when", field, pieces)
+
+
+def choose(field: str, cases: Dict[Any, Sequence], default: Sequence = ()) -> _Block:
+    """Include the pieces registered for the value of data[field]"""
+    return _Block("choose", field, cases=cases, default=default)
+
+
+def each(field: str, *pieces) -> _Block:
+    """Repeat pieces for every item of data[field]"""
+    return _Block("each", field, pieces)
+
+
+def _compile(pieces: Sequence, plain: bool) -> List[Any]:
+    """
+    Compile template pieces into render nodes
+
+    Nodes are static strings, (field, spec) tuples and compiled blocks
+    (kind, field, nodes, cases, default). Adjacent static strings are merged.
+    """
+    nodes: List[Any] = []
+
+    def add_static(text: str):
+        if plain:
+            text = _MARKUP.sub("", text)
+        if not text:
+            return
+        if nodes and isinstance(nodes[-1], str):
+            nodes[-1] += text
+        else:
+            nodes.append(text)
+
+    for piece in pieces:
+        if isinstance(piece, _Block):
+            nodes.append((
+                piece.kind,
+                piece.field,
+                _compile(piece.pieces, plain),
+                {value: _compile(case, plain) for value, case in piece.cases.items()},
+                _compile(piece.default, plain)
+            ))
+            continue
+        for literal, field, spec, conversion in _FORMATTER.parse(piece):
+            if literal:
+                add_static(literal)
+            if field is not None:
+                if conversion:
+                    raise ValueError(f"Conversions are not supported in templates: {piece!r}")
+                nodes.append((field, spec or ""))
+    return nodes
+
+
+def _render(nodes: List[Any], data, out: List[str]):
+    for node in nodes:
+        if isinstance(node, str):
+            out.append(node)
+        elif len(node) == 2:
+            field, spec = node
+            value = data[field]
+            out.append(format(value, spec) if spec else str(value))
+        else:
+            kind, field, children, cases, default = node
+            value = data.get(field)
+            if kind == "when":
+                if value is not None:
+                    _render(children, data, out)
+            elif kind == "choose":
+                _render(cases.get(value, default), data, out)
+            else:
+                for index, item in enumerate(value or (), 1):
+                    _render(children, ChainMap({"index": index}, item, data), out)
+
+
+def _walk(nodes: List[Any], data) -> Iterator[str]:
+    """Lazy _render(): yields the rendered fragments in order"""
+    for node in nodes:
+        if isinstance(node, str):
+            yield node
+        elif len(node) == 2:
+            field, spec = node
+            value = data[field]
+            yield format(value, spec) if spec else str(value)
+        else:
+            kind, field, children, cases, default = node
+            value = data.get(field)
+            if kind == "when":
+                if value is not None:
+                    yield from _walk(children, data)
+            elif kind == "choose":
+                yield from _walk(cases.get(value, default), data)
+            else:
+                for index, item in enumerate(value or (), 1):
+                    yield from _walk(children, ChainMap({"index": index}, item, data))
+
+
+class ResponseRenderer:
+    """Registry of compiled agent response templates"""
+
+    def __init__(self, templates: Optional[Dict[str, Sequence]] = None):
+        """
+        Args:
+            templates: Outcome name -> template pieces (default: the agent templates)
+        """
+        self._compiled: Dict[str, Dict[str, List[Any]]] = {}
+        for outcome, pieces in (AGENT_TEMPLATES if templates is None else templates).items():
+            self.register(outcome, pieces)
+
+    def register(self, outcome: str, pieces: Sequence):
+        """Compile and register the template for an outcome"""
+        self._compiled[outcome] = {
+            "markdown": _compile(pieces, plain=False),
+            "text": _compile(pieces, plain=True)
+        }
+
+    def outcomes(self) -> List[str]:
+        return sorted(self._compiled)
+
+    def render(self, response: AgentResponse, fmt: str = "markdown") -> str:
+        """
+        Render an agent response
+
+        Args:
+            response: Structured agent result
+            fmt: "markdown", "text" or "json"
+
+        Returns:
+            The formatted reply
+        """
+        if fmt == "json":
+            return json.dumps(response.to_dict(), default=str)
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown response format: {fmt}")
+        compiled = self._compiled.get(response.outcome)
+        if compiled is None:
+            raise ValueError(f"No template registered for outcome: {response.outcome}")
+        out: List[str] = []
+        _render(compiled[fmt], response.data, out)
+        return "".join(out)
+
+    def render_stream(self, response: AgentResponse, fmt: str = "markdown") -> Iterator[str]:
+        """
+        Render an agent response one section at a time
+
+        Each section is yielded as soon as the walk reaches its closing blank
+        line; the sections concatenate to render(response, fmt).
+
+        Args:
+            response: Structured agent result
+            fmt: "markdown", "text" or "json" (json is a single chunk)
+
+        Yields:
+            Consecutive pieces of the formatted reply
+        """
+        if fmt == "json" or fmt not in FORMATS:
+            yield self.render(response, fmt)
+            return
+        compiled = self._compiled.get(response.outcome)
+        if compiled is None:
+            raise ValueError(f"No template registered for outcome: {response.outcome}")
+        pending = ""
+        for fragment in _walk(compiled[fmt], response.data):
+            pending += fragment
+            if "\n\n" in pending:
+                *sections, pending = _SECTIONS.split(pending)
+                for section in sections:
+                    if section:
+                        yield section
+        if pending:
+            yield pending
+
+
+AGENT_TEMPLATES: Dict[str, Sequence] = {
+    "vendor.needs_details": [
+        "I'll help you onboard a new vendor. Please provide:\n\n"
+        "1. **Vendor Name**: Company legal name\n"
+        "2. **Tax ID**: Employer Tax ID (EIN)\n"
+        "3. **Industry**: Manufacturing/Wholesale/Retail/Services\n"
+        "4. **Contact Person**: Name and email\n\n"
+        "Example: Add vendor: Quantum Systems Inc, Tax ID: 99-8877665, Industry: Technology"
+    ],
+    "vendor.validated": [
+        "**{status}**\n"
+        "**Vendor Onboarding Complete**\n\n"
+        "---\n\n"
+        "**📋 Vendor Details**\n"
+        "- Name: {vendor_name}\n"
+        "- Tax ID: {tax_id}\n",
+        when("industry", "- Industry: {industry}\n"),
+        "\n**🔍 Validation Results**\n"
+        "- Vendor ID: `{vendor_id}`\n"
+        "- Validation Score: {validation_score}\n"
+        "- Risk Level: {risk_level}\n"
+        "\n**✨ Autonomous Checks Performed**\n"
+        "- ✅ Tax ID format validation\n"
+        "- ✅ Industry compliance check\n"
+        "- ✅ Policy requirements verification\n"
+        "- ✅ Risk assessment (watsonx.ai)\n",
+        choose("approved", {
+            True: [
+                "\n**🎉 Next Steps**\n"
+                "- Vendor added to approved suppliers list\n"
+                "- Ready for purchase orders\n"
+                "- Notification sent to procurement team\n"
+            ]
+        }, default=[
+            "\n**⚠️ Action Required**\n"
+            "- Manual review needed\n"
+            "- Escalated to compliance team\n"
+        ]),
+        "\n---\n"
+        "\n*Processed by Vendor Agent | Session: {session}*\n"
+    ],
+    "requisition.needs_details": [
+        "Unable to process. Please provide: item and quantity/price. "
+        "Example: 'Order a $1,000 laptop for IT' or 'I need to buy 5 chairs for office'"
+    ],
+    "requisition.blocked": [
+        "Request Blocked - Policy Violation\n\n",
+        each(
+            "violations",
+            "Violation {index}: {rule}\n"
+            "Issue: {violation}\n"
+            "Requires: {requires}\n\n"
+        ),
+        "To proceed, please provide:\n"
+        "- Business justification\n"
+        "- Expected ROI (if applicable)\n"
+        "- Department approval\n"
+        "- Executive sign-off (for items > $10,000)\n"
+        "\nRequest Details:\n"
+        "- Item: {item}\n"
+        "- Amount: ${total_price:,}\n"
+        "- Quantity: {quantity}\n"
+        "- Department: {department}\n"
+        "\n---\nCompliance Check | Agent: Requisition | Session: {session}\n"
+    ],
+    "requisition.created": [
+        "Purchase Requisition Created\n\n"
+        "Requisition Details\n"
+        "- Requisition ID: {req_id}\n"
+        "- Item: {item}\n",
+        when("sku", "- Catalog Item: {catalog_item} (SKU {sku})\n"),
+        "- Quantity: {quantity}\n"
+        "- Unit Price: ${unit_price:,}\n"
+        "- Total Cost: ${total_price:,}\n"
+        "- Department: {department}\n"
+        "\nBudget Analysis\n"
+        "- Budget Status: {budget_status}\n"
+        "- Remaining Budget: ${remaining_budget:,}\n",
+        when("budget_impact", "- Budget Impact: {budget_impact}%\n"),
+        when("reservation_id", "- Funds: ${total_price:,} {budget_action} on the {budget_account} budget\n"),
+        "\nWorkflow Status\n"
+        "- Status: {approval_status}\n"
+        "- Routing: {routing}\n"
+        "\n---\nAgent: Requisition | Session: {session}\n"
+    ],
+    "approval.needs_details": [
+        "I can check the status of your requests. Please provide:\n\n"
+        "- **Request ID**: e.g., REQ-001, PO-2025-001\n\n"
+        "Example: *Check status of REQ-001*"
+    ],
+    "approval.status": [
+        "**🔎 Request Status Found**\n\n"
+        "**📄 Request Information**\n"
+        "- Request ID: `{req_id}`\n"
+        "- Current Status: **{current_status}**\n"
+        "- Last Updated: Today, {updated_at}\n"
+        "\n**🔄 Approval Chain**\n"
+        "- ✅ Submitted by User\n"
+        "- ✅ Budget Check Passed\n",
+        choose("current_status", {
+            "Pending Approval": [
+                "- ⏳ **Manager Approval (Current Step)**\n"
+                "- ⚪ Procurement Review\n"
+            ],
+            "Approved": [
+                "- ✅ Manager Approval\n"
+                "- ✅ Procurement Review\n"
+                "- 🎉 **Ready for Ordering**\n"
+            ]
+        }, default=[
+            "- ✅ Manager Approval\n"
+            "- ✅ Procurement Review\n"
+            "- 🚚 **{current_status}**\n"
+        ]),
+        "\n---\n"
+        "\n*Processed by Approval Agent | Session: {session}*\n"
+    ],
+    "communication.help": [
+        "I understand you're feeling **{sentiment}**. I can help with:\n\n"
+        "- **Vendor Onboarding**: 'Add a new vendor'\n"
+        "- **Purchase Requests**: 'I need to buy...'\n"
+        "- **Status Checks**: 'Check status of..'\n\n"
+        "What would you like to do?"
+    ]
+}
+
+
+# Global renderer instance
+_renderer = None
+
+
+def get_response_renderer() -> ResponseRenderer:
+    """Get the global response renderer (singleton)"""
+    global _renderer
+    if _renderer is None:
+        _renderer = ResponseRenderer()
+    return _renderer
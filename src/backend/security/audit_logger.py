@@ -11,10 +11,15 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 from enum import Enum
 from functools import wraps
+from contextlib import contextmanager
+from contextvars import ContextVar
 import os
 
 logger = logging.getLogger(__name__)
 
+# Buffer for audit events while an AuditLogger.batch() block is active
+_audit_batch: ContextVar = ContextVar("audit_batch", default=None)
+
 
 class AuditEventType(str, Enum):
     """Types of auditable events"""
@@ -24,6 +29,10 @@ class AuditEventType(str, Enum):
     VENDOR_UPDATED = "vendor_updated"
     VENDOR_DELETED = "vendor_deleted"
     
+    # Catalog and Contract Operations
+    CATALOG_SEARCHED = "catalog_searched"
+    CONTRACT_DATA_EXTRACTED = "contract_data_extracted"
+    
     # PO Operations
     PO_CREATED = "po_created"
     PO_APPROVED = "po_approved"
@@ -37,14 +46,23 @@ class AuditEventType(str, Enum):
     # Compliance Operations
     POLICY_VIOLATION = "policy_violation"
     POLICY_OVERRIDE = "policy_override"
+    POLICY_CHECKED = "policy_checked"
     
     # Security Operations
     CREDENTIAL_ACCESSED = "credential_accessed"
     PERMISSION_CHANGED = "permission_changed"
+    UNAUTHORIZED_ACCESS_ATTEMPT = "unauthorized_access_attempt"
     
     # User Operations
     USER_LOGIN = "user_login"
     USER_LOGOUT = "user_logout"
+    USER_INPUT_RECEIVED = "user_input_received"
+    ASSISTANT_RESPONSE_SENT = "assistant_response_sent"
+    SESSION_CLEANUP = "session_cleanup"
+    
+    # Agent Operations
+    LLM_REASONING_PERFORMED = "llm_reasoning_performed"
+    NOTIFICATION_SENT = "notification_sent"
     
     # Data Operations
     DATA_EXPORTED = "data_exported"
@@ -86,7 +104,8 @@ class AuditLogger:
         resource_id: str,
         action: str,
         details: Optional[Dict[str, Any]] = None,
-        sensitive: bool = False
+        sensitive: bool = False,
+        resource_type: Optional[str] = None
     ):
         """
         Log an audit event
@@ -98,12 +117,14 @@ class AuditLogger:
             action: Action performed (e.g., 'create', 'approve', 'delete')
             details: Additional context data
             sensitive: Whether this involves sensitive/PII data
+            resource_type: Kind of resource affected (e.g., 'vendor', 'workflow')
         """
         
         event_data = {
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "event_type": event_type.value,
             "user_id": user_id,
+            "resource_type": resource_type,
             "resource_id": resource_id,
             "action": action,
             "ip_address": self._get_request_ip(),
@@ -121,10 +142,51 @@ class AuditLogger:
             )
         else:
             event_data["details"] = details or {}
-            logger.info(json.dumps(event_data))
+        
+        buffer = _audit_batch.get()
+        if buffer is not None:
+            buffer.append(json.dumps(event_data, default=str))
+            return
+        
+        if not sensitive or not details:
+            logger.info(json.dumps(event_data, default=str))
         
         # Write to audit log
-        self.logger.info(json.dumps(event_data))
+        self.logger.info(json.dumps(event_data, default=str))
+    
+    @contextmanager
+    def batch(self):
+        """
+        Buffer audit events and write them in one flush when the block exits
+        
+        Events logged from any code running in this context (including worker
+        threads started with a copy of it) are collected. Nested batches join
+        the outermost one.
+        
+        Usage:
+            with get_audit_logger().batch():
+                for item in items:
+                    process(item)  # log_event calls are buffered
+        """
+        if _audit_batch.get() is not None:
+            yield
+            return
+        
+        buffer = []
+        token = _audit_batch.set(buffer)
+        try:
+            yield
+        finally:
+            _audit_batch.reset(token)
+            self.flush_events(buffer)
+    
+    def flush_events(self, serialized_events):
+        """Write pre-serialized audit events with a single flush"""
+        if not serialized_events:
+            return
+        from backend.logger import emit_batch
+        emit_batch(self.logger, serialized_events)
+        logger.info(f"AUDIT: flushed {len(serialized_events)} batched events")
     
     def log_policy_violation(
         self,
@@ -1,7 +1,8 @@
 # Optional REST API server
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
 import sys
 import os
+import json
 import logging
 
 # Add src to path
@@ -16,6 +17,8 @@ from backend.agent_communication import get_communication_bus
 from backend.watsonx_orchestrate_client import get_watsonx_client
 from backend.skill_base import get_skill_registry
 from backend.logger import get_logger
+from backend.orchestrator import orchestrator
+from backend.response_renderer import FORMATS
 
 app = Flask(__name__)
 logger = get_logger(__name__)
@@ -43,7 +46,7 @@ def initialize_components():
         logger.info("  - Session Manager: Ready")
         logger.info("  - Agent Communication Bus: Ready")
         logger.info("  - watsonx Client: Ready")
-        logger.info("  - Skill Registry: Ready")
+        logger.info(f"  - Skill Registry: Ready ({len(skill_registry.list_skills())} skills)")
         
         return True
     except Exception as e:
@@ -81,6 +84,42 @@ def init_status():
         logger.error(f"Component check failed: {str(e)}")
         return jsonify({"status": "error", "message": str(e)}), 500
 
+def _sse_events(events):
+    """Encode orchestrator stream events as Server-Sent Events."""
+    for event in events:
+        data = dict(event)
+        name = data.pop("event")
+        yield f"event: {name}\ndata: {json.dumps(data, default=str)}\n\n"
+
+@app.route('/api/chat/stream', methods=['GET', 'POST'])
+def chat_stream():
+    """
+    Stream a chat reply as Server-Sent Events.
+    
+    Parameters (JSON body for POST, query string for GET/EventSource):
+        message: User's request text (required)
+        session_id: Session identifier
+        format: markdown (default), text or json
+    """
+    params = (request.get_json(silent=True) or {}) if request.method == 'POST' else request.args
+    message = params.get("message")
+    response_format = params.get("format", "markdown")
+    if not message:
+        return jsonify({"status": "error", "message": "message is required"}), 400
+    if response_format not in FORMATS:
+        return jsonify({"status": "error", "message": f"format must be one of {', '.join(FORMATS)}"}), 400
+    
+    events = orchestrator.stream_message(
+        message,
+        session_id=params.get("session_id"),
+        response_format=response_format
+    )
+    return Response(
+        stream_with_context(_sse_events(events)),
+        mimetype='text/event-stream',
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 if __name__ == '__main__':
     # Initialize components
     if initialize_components():
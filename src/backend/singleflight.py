@@ -0,0 +1,147 @@
+"""
+Single-Flight Request Coalescing
+Concurrent identical calls share one in-flight execution
+
+The first caller for a key (the leader) runs the call; callers that arrive
+with the same key while it is running wait for it and receive its result (or
+its exception). Once the call completes the key is released, so later calls
+run again - this deduplicates concurrent work, it is not a cache.
+
+Waiters stay bound by their own request deadline: a waiter whose deadline
+passes (or whose request is cancelled) raises DeadlineExceeded while the
+leader keeps running for everyone else.
+"""
+
+import copy
+import functools
+import inspect
+import logging
+import threading
+from typing import Dict, Any, Callable, Hashable, Optional, Tuple
+
+from backend.cache import stable_hash
+from backend.deadline import current_deadline
+
+logger = logging.getLogger(__name__)
+
+# How often a waiter with a deadline checks for cancellation
+CANCEL_POLL_SECONDS = 0.05
+
+
+class _Call:
+    __slots__ = ("event", "result", "error", "waiters")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Tuple[Any, bool]:
+        """
+        Run fn unless an identical call is already in flight
+
+        Args:
+            key: Identity of the call
+            fn: Callable to run when this caller is the leader
+
+        Returns:
+            (result, shared) - shared is True when the result came from
+            another caller's execution
+
+        Raises:
+            DeadlineExceeded: if the current request's deadline passes while
+                waiting for another caller's execution
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            self._wait(key, call)
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+            if call.waiters:
+                logger.debug(f"Single-flight result shared with {call.waiters} waiters")
+        return call.result, False
+
+    def _wait(self, key: Hashable, call: _Call):
+        """Wait for the leader, for no longer than the current deadline allows"""
+        deadline = current_deadline()
+        if deadline is None:
+            call.event.wait()
+            return
+        try:
+            while not call.event.wait(deadline.timeout(CANCEL_POLL_SECONDS)):
+                pass
+        except BaseException:
+            with self._lock:
+                call.waiters -= 1
+            logger.debug(f"Single-flight waiter for {key!r} gave up before the leader finished")
+            raise
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"executed": self.executed, "shared": self.shared, "in_flight": len(self._calls)}
+
+
+def coalesced(key_fn: Optional[Callable[[Dict[str, Any]], Any]] = None):
+    """
+    Decorator for methods whose concurrent identical calls should be coalesced
+
+    The instance needs a SingleFlight in self.inflight. Calls are keyed by the
+    method name and the bound arguments (or key_fn(arguments) when given);
+    waiters receive a deep copy of the leader's result so callers never share
+    mutable state.
+
+    Args:
+        key_fn: Maps the bound arguments (excluding self) to a JSON-able key
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            arguments.pop("self", None)
+            key = (method.__name__, stable_hash(key_fn(arguments) if key_fn else arguments))
+            result, shared = self.inflight.do(key, method, self, *args, **kwargs)
+            return copy.deepcopy(result) if shared else result
+
+        return wrapper
+    return decorator
@@ -4,15 +4,35 @@ All digital skills must inherit from this class and implement formal contracts
 """
 
 from pydantic import BaseModel, Field, validator
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Union
+from collections import ChainMap
+from collections.abc import Mapping
+from contextlib import nullcontext
 from enum import Enum
 from datetime import datetime
+import copy
+import glob
+import importlib.util
+import inspect
 import logging
+import os
+import sys
+import threading
 import time
 from abc import ABC, abstractmethod
 
+from backend.deadline import deadline_scope, check_deadline
+from backend.cache import LRUCache, stable_hash
+
 logger = logging.getLogger(__name__)
 
+# Input fields that never change a skill's result (excluded from memo keys)
+MEMO_IGNORED_FIELDS = frozenset({"request_id", "timeout_seconds", "execution_context"})
+
+DEFAULT_SKILLS_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'orchestrate', 'skills'
+)
+
 
 class SkillStatus(str, Enum):
     """Skill execution status codes"""
@@ -51,6 +71,99 @@ class SkillOutput(BaseModel):
         json_encoders = {
             datetime: lambda v: v.isoformat()
         }
+    
+    @classmethod
+    def trusted(
+        cls,
+        skill_name: str,
+        status: SkillStatus,
+        request_id: str,
+        execution_time_ms: float,
+        result: Optional[Dict[str, Any]] = None,
+        error_message: Optional[str] = None,
+        error_code: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[datetime] = None
+    ) -> "TrustedSkillOutput":
+        """
+        Build an output from values the skill framework produced itself
+        
+        Returns a TrustedSkillOutput: a plain object with the same fields,
+        about twice as fast to build as SkillOutput(...) (pydantic's
+        model_construct() is slower than validating), which becomes a
+        validated SkillOutput when it is serialized. It is not a
+        SkillOutput instance - see SkillResult. Only for internally built
+        values of the right types - anything from outside goes through
+        SkillOutput(...).
+        
+        Returns:
+            TrustedSkillOutput whose to_output() equals the validated construction
+        """
+        return TrustedSkillOutput(
+            skill_name, status, request_id, execution_time_ms, result,
+            error_message, error_code, metadata, timestamp or datetime.utcnow()
+        )
+
+
+class TrustedSkillOutput:
+    """
+    Unvalidated SkillOutput built by the skill framework (see SkillOutput.trusted)
+    
+    Reads like a SkillOutput (same attributes). At API boundaries it turns
+    into a validated SkillOutput: to_output(), dict(), model_dump() and
+    model_dump_json() all go through SkillOutput. It does not subclass
+    SkillOutput, so isinstance() checks and pydantic fields typed as
+    SkillOutput need to_output() first.
+    """
+    
+    __slots__ = (
+        "skill_name", "status", "request_id", "execution_time_ms", "result",
+        "error_message", "error_code", "metadata", "timestamp"
+    )
+    
+    def __init__(self, skill_name: str, status: SkillStatus, request_id: str, execution_time_ms: float,
+                 result: Optional[Dict[str, Any]] = None, error_message: Optional[str] = None,
+                 error_code: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None,
+                 timestamp: Optional[datetime] = None):
+        self.skill_name = skill_name
+        # Match use_enum_values: validated outputs store the plain value
+        self.status = status.value if isinstance(status, SkillStatus) else status
+        self.request_id = request_id
+        self.execution_time_ms = execution_time_ms
+        self.result = result
+        self.error_message = error_message
+        self.error_code = error_code
+        self.metadata = metadata
+        self.timestamp = timestamp or datetime.utcnow()
+    
+    def to_output(self) -> SkillOutput:
+        """Validated SkillOutput with the same values"""
+        return SkillOutput(**{name: getattr(self, name) for name in self.__slots__})
+    
+    def dict(self, **kwargs) -> Dict[str, Any]:
+        return self.to_output().dict(**kwargs)
+    
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        return self.to_output().model_dump(**kwargs)
+    
+    def model_dump_json(self, **kwargs) -> str:
+        return self.to_output().model_dump_json(**kwargs)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (SkillOutput, TrustedSkillOutput)):
+            return self.model_dump() == other.model_dump()
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"TrustedSkillOutput({self.skill_name!r}, status={self.status!r}, request_id={self.request_id!r})"
+
+
+# What skills return: a validated SkillOutput, or a TrustedSkillOutput for
+# successes built by the framework. Read the shared attributes, or call
+# to_output() on a TrustedSkillOutput where a real SkillOutput is required.
+SkillResult = Union[SkillOutput, TrustedSkillOutput]
 
 
 class BaseSkill(ABC):
@@ -69,8 +182,31 @@ class BaseSkill(ABC):
     - Execution timing
     - Request tracking
     - Audit logging
+    
+    execution_profile selects the SkillExecutor pool: "io" (threads, the
+    default) or "cpu" (worker processes, for skills that are importable and
+    constructible without arguments).
+    
+    Memoization (opt-in for pure skills): set memoize = True and the result
+    for an input is cached under a stable hash of the input and the skill's
+    data_version(), in an LRU with a TTL. Override data_version() when the
+    result depends on data that can change (catalog, budgets), so a change
+    invalidates earlier results. Outputs report metadata["cache_hit"].
+    Skills that audit their results do it in _audit_result(), which runs for
+    memo hits too (with cache_hit=True), so a cached answer is still audited.
+    
+    Successful outputs are built with SkillOutput.trusted(), skipping model
+    validation, so execute() returns a SkillResult; set validate_outputs =
+    True to get validated SkillOutputs (e.g. while developing a skill whose
+    results do not fit the contract).
     """
     
+    execution_profile = "io"
+    memoize = False
+    memo_max_entries = 1024
+    memo_ttl_seconds = 3600.0
+    validate_outputs = False
+    
     def __init__(self, skill_name: str):
         """
         Initialize the skill
@@ -81,7 +217,44 @@ class BaseSkill(ABC):
         self.skill_name = skill_name
         self.logger = logging.getLogger(f"skill.{skill_name}")
         self.timeout_ms = None
+        self.memo_cache = LRUCache(self.memo_max_entries, self.memo_ttl_seconds) if self.memoize else None
+    
+    def data_version(self) -> str:
+        """
+        Version of the data the skill's results depend on
+        
+        Part of every memo key; return a new value whenever that data changes.
+        """
+        return "1"
+    
+    def _memo_key(self, input_data: Dict[str, Any], version: str) -> str:
+        return stable_hash({
+            "skill": self.skill_name,
+            "data_version": version,
+            "input": {k: v for k, v in input_data.items() if k not in MEMO_IGNORED_FIELDS}
+        })
     
+    def _audit_result(self, input_data: Dict[str, Any], result: Dict[str, Any], cache_hit: bool = False):
+        """
+        Write the audit event for a result (no-op by default)
+        
+        Skills call it from _execute_logic(); execute() calls it for memo
+        hits, which skip _execute_logic().
+        """
+    
+    def _success_output(self, request_id: str, result: Dict[str, Any], execution_time_ms: float,
+                        metadata: Optional[Dict[str, Any]]) -> SkillResult:
+        """SUCCESS output for a result this skill produced (unvalidated unless validate_outputs)"""
+        build = SkillOutput if self.validate_outputs else SkillOutput.trusted
+        return build(
+            skill_name=self.skill_name,
+            status=SkillStatus.SUCCESS,
+            request_id=request_id,
+            result=result,
+            execution_time_ms=execution_time_ms,
+            metadata=metadata
+        )
+
     @abstractmethod
     def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """
@@ -112,7 +285,7 @@ class BaseSkill(ABC):
         """
         raise NotImplementedError("Subclasses must implement _execute_logic()")
     
-    def execute(self, input_data: Dict[str, Any]) -> SkillOutput:
+    def execute(self, input_data: Dict[str, Any]) -> SkillResult:
         """
         Execute the skill with formal error handling
         
@@ -123,17 +296,46 @@ class BaseSkill(ABC):
         4. Error handling
         5. Timing and logging
         
+        The skill runs under the caller's request deadline, tightened by
+        input_data["timeout_seconds"] when given. Work is not started once the
+        deadline has passed, and DeadlineExceeded raised by downstream calls
+        (bus, watsonx, NLU) is reported as a TIMEOUT.
+        
         Args:
             input_data: Raw input data
         
         Returns:
-            SkillOutput with status and result
+            SkillOutput with status and result (a TrustedSkillOutput for
+            successes unless validate_outputs)
         """
+        with deadline_scope(input_data.get("timeout_seconds")):
+            return self._execute_with_deadline(input_data)
+    
+    def _execute_with_deadline(self, input_data: Dict[str, Any]) -> SkillResult:
+        """Body of execute(), run inside the skill's deadline scope"""
         import uuid
         start_time = time.time()
-        request_id = input_data.get("request_id", str(uuid.uuid4()))
+        request_id = input_data.get("request_id") or str(uuid.uuid4())
         
         try:
+            check_deadline(f"skill {self.skill_name}")
+            
+            # Memoized skills: identical input and data version -> cached result
+            memo_key = None
+            if self.memo_cache is not None:
+                version = self.data_version()
+                memo_key = self._memo_key(input_data, version)
+                cached = self.memo_cache.get(memo_key)
+                if cached is not None:
+                    result = copy.deepcopy(cached)
+                    self._audit_result(input_data, result, cache_hit=True)
+                    return self._success_output(
+                        request_id,
+                        result,
+                        (time.time() - start_time) * 1000,
+                        {"cache_hit": True, "data_version": version}
+                    )
+            
             # Validate input
             if not self.validate_input(input_data):
                 self.logger.warning(f"Input validation failed for request {request_id}")
@@ -148,7 +350,10 @@ class BaseSkill(ABC):
                 )
             
             # Execute skill logic
+            check_deadline(f"skill {self.skill_name}")
             result = self._execute_logic(input_data)
+            if memo_key is not None:
+                self.memo_cache.set(memo_key, copy.deepcopy(result))
             
             execution_time = (time.time() - start_time) * 1000
             
@@ -157,15 +362,14 @@ class BaseSkill(ABC):
                 f"(request: {request_id}, time: {execution_time:.1f}ms)"
             )
             
-            return SkillOutput(
-                skill_name=self.skill_name,
-                status=SkillStatus.SUCCESS,
-                request_id=request_id,
-                result=result,
-                execution_time_ms=execution_time
+            return self._success_output(
+                request_id,
+                result,
+                execution_time,
+                {"cache_hit": False, "data_version": version} if memo_key is not None else None
             )
             
-        except TimeoutError:
+        except TimeoutError as e:
             execution_time = (time.time() - start_time) * 1000
             self.logger.error(
                 f"Skill execution timeout: {self.skill_name} "
@@ -175,7 +379,7 @@ class BaseSkill(ABC):
                 skill_name=self.skill_name,
                 status=SkillStatus.TIMEOUT,
                 request_id=request_id,
-                error_message="Skill execution timeout",
+                error_message=str(e) or "Skill execution timeout",
                 error_code="TIMEOUT",
                 execution_time_ms=execution_time
             )
@@ -196,6 +400,162 @@ class BaseSkill(ABC):
                 metadata={"exception_type": type(e).__name__}
             )
     
+    def execute_many(self, inputs: List[Dict[str, Any]], executor=None) -> List[SkillResult]:
+        """
+        Execute the skill over many inputs
+        
+        Skills that implement _execute_batch() receive every valid input in
+        one call; other skills run item by item in parallel on the skill
+        executor (each item keeps its own timeout). Audit events logged
+        during the call are written as one batch.
+        
+        Args:
+            inputs: Raw input data per item
+            executor: SkillExecutor for per-item execution (default global executor)
+        
+        Returns:
+            One SkillOutput per input, in input order, each with its own status
+        """
+        try:
+            from backend.security.audit_logger import get_audit_logger
+            audit_batch = get_audit_logger().batch()
+        except ImportError:
+            audit_batch = nullcontext()
+        
+        with audit_batch:
+            if type(self)._execute_batch is not BaseSkill._execute_batch:
+                # One call for the whole batch: it runs under the tightest item timeout
+                timeouts = [item["timeout_seconds"] for item in inputs if item.get("timeout_seconds")]
+                with deadline_scope(min(timeouts) if timeouts else None):
+                    return self._execute_batch_outputs(inputs)
+            if executor is None:
+                from backend.skill_executor import get_skill_executor
+                executor = get_skill_executor()
+            return executor.execute_many(self, inputs)
+    
+    def _execute_batch(self, inputs: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Vectorized skill logic over many validated inputs (optional)
+        
+        Override in subclasses that can process a batch faster than item by
+        item.
+        
+        Args:
+            inputs: Validated input data
+        
+        Returns:
+            One result dict per input, in order; an Exception instance in
+            place of a result fails just that item
+        """
+        raise NotImplementedError
+    
+    def _execute_batch_outputs(self, inputs: List[Dict[str, Any]]) -> List[SkillResult]:
+        """Validate every input, run _execute_batch() on the valid ones and wrap the results"""
+        import uuid
+        start_time = time.time()
+        outputs: List[Optional[SkillResult]] = [None] * len(inputs)
+        request_ids = [item.get("request_id") or str(uuid.uuid4()) for item in inputs]
+        valid_indexes = []
+        
+        for index, item in enumerate(inputs):
+            try:
+                valid = self.validate_input(item)
+            except Exception as e:
+                outputs[index] = SkillOutput(
+                    skill_name=self.skill_name,
+                    status=SkillStatus.ERROR,
+                    request_id=request_ids[index],
+                    error_message=str(e),
+                    error_code="EXECUTION_ERROR",
+                    execution_time_ms=0,
+                    metadata={"exception_type": type(e).__name__}
+                )
+                continue
+            if not valid:
+                outputs[index] = SkillOutput(
+                    skill_name=self.skill_name,
+                    status=SkillStatus.FAILURE,
+                    request_id=request_ids[index],
+                    error_message="Input validation failed",
+                    error_code="INVALID_INPUT",
+                    execution_time_ms=0,
+                    metadata={"validation_failed": True}
+                )
+                continue
+            valid_indexes.append(index)
+        
+        # Memoized skills only send cache misses to _execute_batch()
+        cached_results: Dict[int, Any] = {}
+        memo_keys: Dict[int, str] = {}
+        if self.memo_cache is not None:
+            version = self.data_version()
+            for index in valid_indexes:
+                memo_keys[index] = self._memo_key(inputs[index], version)
+                cached = self.memo_cache.get(memo_keys[index])
+                if cached is not None:
+                    cached_results[index] = copy.deepcopy(cached)
+            valid_indexes = [index for index in valid_indexes if index not in cached_results]
+        
+        try:
+            check_deadline(f"skill {self.skill_name}")
+            results = self._execute_batch([inputs[index] for index in valid_indexes]) if valid_indexes else []
+            if len(results) != len(valid_indexes):
+                raise ValueError(
+                    f"_execute_batch returned {len(results)} results for {len(valid_indexes)} inputs"
+                )
+        except Exception as e:
+            timeout = isinstance(e, TimeoutError)
+            self.logger.error(f"Batch execution failed: {self.skill_name}: {str(e)}", exc_info=not timeout)
+            results = [e] * len(valid_indexes)
+        
+        for index, result in zip(valid_indexes, results):
+            if index in memo_keys and not isinstance(result, Exception):
+                self.memo_cache.set(memo_keys[index], copy.deepcopy(result))
+        
+        # The batch ran as one call: report each item's share of its time
+        batch_time = (time.time() - start_time) * 1000
+        item_time = batch_time / len(inputs) if inputs else 0.0
+        metadata = {"batch_size": len(inputs), "batch_time_ms": round(batch_time, 3)}
+        if self.memo_cache is not None:
+            metadata["data_version"] = version
+        for index, result in cached_results.items():
+            outputs[index] = self._success_output(
+                request_ids[index], result, item_time, dict(metadata, cache_hit=True)
+            )
+        for index, result in zip(valid_indexes, results):
+            if isinstance(result, TimeoutError):
+                outputs[index] = SkillOutput(
+                    skill_name=self.skill_name,
+                    status=SkillStatus.TIMEOUT,
+                    request_id=request_ids[index],
+                    error_message=str(result) or "Skill execution timeout",
+                    error_code="TIMEOUT",
+                    execution_time_ms=item_time,
+                    metadata=dict(metadata)
+                )
+            elif isinstance(result, Exception):
+                outputs[index] = SkillOutput(
+                    skill_name=self.skill_name,
+                    status=SkillStatus.ERROR,
+                    request_id=request_ids[index],
+                    error_message=str(result),
+                    error_code="EXECUTION_ERROR",
+                    execution_time_ms=item_time,
+                    metadata=dict(metadata, exception_type=type(result).__name__)
+                )
+            else:
+                outputs[index] = self._success_output(
+                    request_ids[index],
+                    result,
+                    item_time,
+                    dict(metadata, cache_hit=False) if self.memo_cache is not None else dict(metadata)
+                )
+        
+        self.logger.info(
+            f"Batch executed: {self.skill_name} ({len(inputs)} items, time: {batch_time:.1f}ms)"
+        )
+        return outputs
+    
     def handle_error(
         self, 
         error_code: str, 
@@ -217,27 +577,112 @@ class BaseSkill(ABC):
 
 
 class SkillRegistry:
-    """Registry for all available skills"""
+    """
+    Registry for all available skills
     
-    def __init__(self):
-        self.skills: Dict[str, BaseSkill] = {}
+    With a skills_dir the registry discovers skill plugins lazily: the
+    directory is indexed on the first lookup, and a plugin module
+    (<skill_name>.py) is imported only when its skill is first requested.
+    Every BaseSkill subclass defined in the module is instantiated once and
+    shared by all callers.
+    """
     
+    def __init__(self, executor=None, skills_dir: Optional[str] = None):
+        """
+        Args:
+            executor: SkillExecutor that runs the skills (default global executor)
+            skills_dir: Directory of skill plugin modules (None = explicit registration only)
+        """
+        self.skills: Dict[str, BaseSkill] = {}
+        self._executor = executor
+        self.skills_dir = skills_dir
+        self._plugins: Optional[Dict[str, str]] = None
+        self._lock = threading.RLock()
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            from backend.skill_executor import get_skill_executor
+            self._executor = get_skill_executor()
+        return self._executor
+
     def register(self, skill: BaseSkill):
         """Register a skill"""
         self.skills[skill.skill_name] = skill
         logger.info(f"Registered skill: {skill.skill_name}")
     
     def get_skill(self, skill_name: str) -> Optional[BaseSkill]:
-        """Get a skill by name"""
-        return self.skills.get(skill_name)
+        """Get a skill by name, loading its plugin on first use"""
+        skill = self.skills.get(skill_name)
+        if skill is None and self.skills_dir:
+            skill = self._load_plugin(skill_name)
+        return skill
+    
+    def get_or_register(self, skill_name: str, factory) -> BaseSkill:
+        """
+        Shared instance of a skill, created with factory() if no plugin provides it
+        
+        Args:
+            skill_name: Name of the skill
+            factory: Zero-argument callable returning the skill
+        """
+        skill = self.get_skill(skill_name)
+        if skill is None:
+            with self._lock:
+                skill = self.skills.get(skill_name)
+                if skill is None:
+                    skill = factory()
+                    self.register(skill)
+        return skill
     
+    def load_plugins(self):
+        """Import every plugin not loaded yet"""
+        for skill_name in list(self._plugin_index()):
+            self._load_plugin(skill_name)
+    
+    def _plugin_index(self) -> Dict[str, str]:
+        """Skill name -> plugin path for plugins not imported yet"""
+        with self._lock:
+            if self._plugins is None:
+                self._plugins = {}
+                if self.skills_dir:
+                    for path in sorted(glob.glob(os.path.join(self.skills_dir, "*.py"))):
+                        name = os.path.splitext(os.path.basename(path))[0]
+                        if not name.startswith("_"):
+                            self._plugins[name] = path
+            return self._plugins
+    
+    def _load_plugin(self, skill_name: str) -> Optional[BaseSkill]:
+        with self._lock:
+            if skill_name in self.skills:
+                return self.skills[skill_name]
+            # Popped before importing: a broken plugin is attempted once
+            path = self._plugin_index().pop(skill_name, None)
+            if path is None:
+                return None
+            try:
+                module = _import_plugin(skill_name, path)
+                for obj in vars(module).values():
+                    if (inspect.isclass(obj) and issubclass(obj, BaseSkill) and not inspect.isabstract(obj)
+                            and obj.__module__ == module.__name__):
+                        skill = obj()
+                        if skill.skill_name not in self.skills:
+                            self.register(skill)
+            except Exception as e:
+                logger.error(f"Failed to load skill plugin {path}: {str(e)}")
+                return None
+            return self.skills.get(skill_name)
+
     def execute_skill(
         self,
         skill_name: str,
         input_data: Dict[str, Any]
-    ) -> SkillOutput:
+    ) -> SkillResult:
         """
-        Execute a registered skill
+        Execute a registered skill on the skill executor's pools
+        
+        The call returns within the skill's timeout_seconds (capped by the
+        request deadline); a skill that overruns yields a TIMEOUT output.
         
         Args:
             skill_name: Name of the skill to execute
@@ -257,20 +702,258 @@ class SkillRegistry:
                 execution_time_ms=0
             )
         
-        return skill.execute(input_data)
+        return self.executor.execute(skill, input_data)
+    
+    def execute_many(
+        self,
+        skill_name: str,
+        inputs: List[Dict[str, Any]]
+    ) -> List[SkillResult]:
+        """
+        Execute a registered skill over many inputs (see BaseSkill.execute_many)
+        
+        Args:
+            skill_name: Name of the skill to execute
+            inputs: Input data per item
+        
+        Returns:
+            One SkillOutput per input, in input order
+        """
+        skill = self.get_skill(skill_name)
+        if not skill:
+            return [
+                SkillOutput(
+                    skill_name=skill_name,
+                    status=SkillStatus.ERROR,
+                    request_id=item.get("request_id", "unknown"),
+                    error_message=f"Skill not found: {skill_name}",
+                    error_code="SKILL_NOT_FOUND",
+                    execution_time_ms=0
+                )
+                for item in inputs
+            ]
+        
+        return skill.execute_many(inputs, executor=self.executor)
     
     def list_skills(self) -> Dict[str, str]:
-        """List all registered skills"""
+        """List all registered skills (loading any undiscovered plugins)"""
+        self.load_plugins()
         return {name: skill.skill_name for name, skill in self.skills.items()}
 
 
+def _import_plugin(skill_name: str, path: str):
+    """Import a plugin module as orchestrate.skills.<name> (reusing an earlier import)"""
+    module_name = f"orchestrate.skills.{skill_name}"
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
 # Global skill registry
 _skill_registry = None
 
 
 def get_skill_registry() -> SkillRegistry:
-    """Get global skill registry (singleton)"""
+    """Get global skill registry (singleton), discovering plugins in SKILLS_DIR"""
     global _skill_registry
     if _skill_registry is None:
-        _skill_registry = SkillRegistry()
+        _skill_registry = SkillRegistry(skills_dir=os.getenv("SKILLS_DIR", DEFAULT_SKILLS_DIR))
     return _skill_registry
+
+
+def get_shared_skill(skill_name: str, factory) -> BaseSkill:
+    """
+    Warm skill instance from the global registry for the legacy function wrappers
+    
+    Args:
+        skill_name: Name of the skill
+        factory: Zero-argument callable used when no plugin provides the skill
+    """
+    return get_skill_registry().get_or_register(skill_name, factory)
+
+
+class PipelineStage:
+    """One skill in a SkillPipeline"""
+    
+    __slots__ = ("name", "skill", "inputs", "output", "when", "stop_if")
+    
+    def __init__(self, name: str, skill, inputs=None, output: Optional[str] = None, when=None, stop_if=None):
+        self.name = name
+        self.skill = skill
+        self.inputs = inputs
+        self.output = output
+        self.when = when
+        self.stop_if = stop_if
+
+
+class SkillPipeline:
+    """
+    Chain of skills sharing one copy-on-write context
+    
+    The context is a ChainMap: each stage reads the layers below it without
+    copying them and writes its result into a new layer on top, so no stage
+    can change what an earlier stage saw. Input validation runs once, on
+    the entry stage, and the pipeline produces a single SkillOutput at the
+    end; stages in between call the skill logic directly, with no per-stage
+    SkillOutput. Stages can be skipped (when) or end the pipeline early
+    (stop_if), and every stage's status and timing is reported in one trace.
+    
+    Usage:
+        pipeline = (SkillPipeline("vendor_intake")
+            .stage("extract_contract_data")
+            .stage("validate_vendor", inputs={"vendor_name": "extracted_data.vendor_name",
+                                              "tax_id": "extracted_data.tax_id"},
+                   stop_if=lambda ctx: ctx["validation_status"] == "rejected")
+            .stage("send_notification", inputs=lambda ctx: {...}))
+        output = pipeline.run({"contract_text": text})
+    """
+    
+    def __init__(self, name: str, registry: Optional[SkillRegistry] = None):
+        """
+        Args:
+            name: Pipeline name (used as the output's skill_name)
+            registry: Registry used to resolve stages given by skill name
+                (default global registry)
+        """
+        self.name = name
+        self.registry = registry
+        self.stages: List[PipelineStage] = []
+    
+    def stage(self, skill, inputs=None, output: Optional[str] = None, name: Optional[str] = None,
+              when=None, stop_if=None) -> "SkillPipeline":
+        """
+        Append a stage
+        
+        Args:
+            skill: BaseSkill or registered skill name
+            inputs: None to pass the whole context, a dict of
+                {input field: dotted context path}, or a callable(context) -> dict
+            output: Context key for the stage's result (default: merge its
+                fields into the context)
+            name: Stage name in the trace (default: skill name)
+            when: callable(context) -> bool; the stage is skipped when False
+            stop_if: callable(context) -> bool, checked after the stage; True
+                ends the pipeline successfully
+        
+        Returns:
+            The pipeline, for chaining
+        """
+        if isinstance(skill, str):
+            resolved = (self.registry or get_skill_registry()).get_skill(skill)
+            if resolved is None:
+                raise ValueError(f"Skill not found: {skill}")
+            skill = resolved
+        self.stages.append(PipelineStage(name or skill.skill_name, skill, inputs, output, when, stop_if))
+        return self
+    
+    def run(self, input_data: Dict[str, Any]) -> SkillOutput:
+        """
+        Run the stages in order
+        
+        Args:
+            input_data: Initial context (validated against the entry stage)
+        
+        Returns:
+            SkillOutput whose result is the final context and whose metadata
+            holds the per-stage trace and the stage that stopped the pipeline
+        """
+        import uuid
+        start_time = time.time()
+        request_id = input_data.get("request_id", str(uuid.uuid4()))
+        context = ChainMap(input_data)
+        trace: List[Dict[str, Any]] = []
+        stopped_at = None
+        failed: Optional[Exception] = None
+        invalid = False
+        
+        with deadline_scope(input_data.get("timeout_seconds")):
+            for position, stage in enumerate(self.stages):
+                stage_start = time.perf_counter()
+                entry = {"stage": stage.name, "skill": stage.skill.skill_name}
+                trace.append(entry)
+                try:
+                    check_deadline(f"pipeline {self.name}")
+                    if stage.when is not None and not stage.when(context):
+                        entry["status"] = "skipped"
+                        continue
+                    stage_input = self._stage_input(stage, context)
+                    if position == 0 and not stage.skill.validate_input(stage_input):
+                        entry["status"] = "invalid_input"
+                        invalid = True
+                        break
+                    result = stage.skill._execute_logic(stage_input) or {}
+                    context = context.new_child({stage.output: result} if stage.output else result)
+                    entry["status"] = "success"
+                    if stage.stop_if is not None and stage.stop_if(context):
+                        stopped_at = stage.name
+                        break
+                except Exception as e:
+                    entry["status"] = "timeout" if isinstance(e, TimeoutError) else "error"
+                    entry["error"] = str(e)
+                    failed = e
+                    break
+                finally:
+                    entry["time_ms"] = round((time.perf_counter() - stage_start) * 1000, 3)
+        
+        if invalid:
+            return self._output(
+                SkillStatus.FAILURE, request_id, start_time, context, trace, None,
+                error_message="Input validation failed", error_code="INVALID_INPUT"
+            )
+        if failed is not None:
+            timeout = isinstance(failed, TimeoutError)
+            logger.error(f"Pipeline {self.name} failed at stage {trace[-1]['stage']}: {str(failed)}")
+            return self._output(
+                SkillStatus.TIMEOUT if timeout else SkillStatus.ERROR, request_id, start_time, context, trace,
+                stopped_at, error_message=str(failed), error_code="TIMEOUT" if timeout else "EXECUTION_ERROR"
+            )
+        return self._output(SkillStatus.SUCCESS, request_id, start_time, context, trace, stopped_at)
+    
+    @staticmethod
+    def _stage_input(stage: PipelineStage, context: ChainMap):
+        if stage.inputs is None:
+            # Scratch layer: whatever the skill writes to its input stays out of the shared context
+            return context.new_child()
+        if callable(stage.inputs):
+            return stage.inputs(context)
+        return {field: _lookup(context, path) for field, path in stage.inputs.items()}
+    
+    def _output(self, status: SkillStatus, request_id: str, start_time: float, context: ChainMap,
+                trace: List[Dict[str, Any]], stopped_at: Optional[str], error_message: Optional[str] = None,
+                error_code: Optional[str] = None) -> SkillOutput:
+        execution_time = (time.time() - start_time) * 1000
+        self_time = execution_time - sum(entry.get("time_ms", 0.0) for entry in trace)
+        return SkillOutput(
+            skill_name=self.name,
+            status=status,
+            request_id=request_id,
+            result=dict(context) if status == SkillStatus.SUCCESS else None,
+            error_message=error_message,
+            error_code=error_code,
+            execution_time_ms=execution_time,
+            metadata={
+                "pipeline": self.name,
+                "trace": trace,
+                "stopped_at": stopped_at,
+                "overhead_ms": round(max(0.0, self_time), 3)
+            }
+        )
+
+
+def _lookup(context, path: str) -> Any:
+    """Resolve a dotted path ("extracted_data.vendor_name") in the context"""
+    value = context
+    for part in path.split("."):
+        if not isinstance(value, Mapping) or part not in value:
+            return None
+        value = value[part]
+    return value
@@ -0,0 +1,284 @@
+"""
+Skill Executor
+Runs skills on persistent worker pools with enforced timeouts
+
+Skills declare an execution_profile: "io" skills (the default - network,
+audit and bus calls) run on a thread pool; "cpu" skills run on a process pool
+so they do not contend for the GIL. Both pools are created once and reused.
+
+Every execution is bounded by the smaller of input_data["timeout_seconds"]
+(SkillInput default) and the caller's request deadline. When the bound
+passes the caller gets a SkillStatus.TIMEOUT output instead of blocking; on a
+thread the skill's own deadline is cancelled so cooperative checks
+(check_deadline, bus and watsonx timeouts) stop it, while a hung worker
+process is left to finish in the background. Output metadata reports the
+time spent queued for a worker separately from the run time.
+"""
+
+import contextvars
+import importlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Dict, Any, Optional, List, Tuple
+
+from backend.deadline import Deadline, DeadlineExceeded, current_deadline, deadline_scope, remaining_timeout
+from backend.skill_base import BaseSkill, SkillInput, SkillOutput, SkillResult, SkillStatus
+
+logger = logging.getLogger(__name__)
+
+IO_PROFILE = "io"
+CPU_PROFILE = "cpu"
+
+DEFAULT_TIMEOUT_SECONDS = SkillInput.model_fields["timeout_seconds"].default
+
+# Set on executor worker threads; nested skill calls from a worker run inline
+_in_worker = threading.local()
+
+# Skill instances created inside worker processes, by (module, qualname)
+_process_skills: Dict[Tuple[str, str], BaseSkill] = {}
+
+
+def _run_on_thread(skill: BaseSkill, input_data: Dict[str, Any], timing: Dict[str, float]) -> SkillResult:
+    timing["started"] = time.time()
+    _in_worker.active = True
+    try:
+        return skill.execute(input_data)
+    finally:
+        _in_worker.active = False
+        timing["finished"] = time.time()
+
+
+def _run_in_process(module: str, qualname: str, input_data: Dict[str, Any]) -> Tuple[SkillResult, float, float]:
+    """Process-pool entry point: resolve (and keep) the skill, then run it"""
+    started = time.time()
+    skill = _process_skills.get((module, qualname))
+    if skill is None:
+        cls = importlib.import_module(module)
+        for part in qualname.split("."):
+            cls = getattr(cls, part)
+        skill = _process_skills[(module, qualname)] = cls()
+    output = skill.execute(input_data)
+    return output, started, time.time()
+
+
+class _Submission:
+    """A skill call handed to a pool and not yet collected"""
+
+    __slots__ = ("skill", "request_id", "submitted", "timeout", "executor", "future", "deadline", "timing", "output")
+
+    def __init__(self, skill: BaseSkill, request_id: str):
+        self.skill = skill
+        self.request_id = request_id
+        self.submitted = time.time()
+        self.timeout: Optional[float] = None
+        self.executor = "thread"
+        self.future: Optional[Future] = None
+        self.deadline: Optional[Deadline] = None
+        self.timing: Dict[str, float] = {}
+        self.output: Optional[SkillResult] = None
+
+
+class SkillExecutor:
+    """Thread and process pools for skill execution"""
+
+    def __init__(self, thread_workers: int = 8, process_workers: Optional[int] = None):
+        """
+        Args:
+            thread_workers: Threads for "io" skills
+            process_workers: Processes for "cpu" skills (default: CPU count);
+                the process pool is started on first use
+        """
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers or os.cpu_count() or 1
+        self._threads = ThreadPoolExecutor(max_workers=thread_workers, thread_name_prefix="skill")
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def profile_for(self, skill: BaseSkill) -> str:
+        """
+        Pool a skill runs on
+
+        "cpu" skills need an importable, argument-free class to be rebuilt in
+        the worker process; anything else falls back to the thread pool.
+        """
+        if getattr(skill, "execution_profile", IO_PROFILE) != CPU_PROFILE:
+            return IO_PROFILE
+        cls = type(skill)
+        if cls.__module__ == "__main__" or "<locals>" in cls.__qualname__:
+            return IO_PROFILE
+        return CPU_PROFILE
+
+    def execute(self, skill: BaseSkill, input_data: Dict[str, Any]) -> SkillResult:
+        """
+        Run a skill on its pool and wait for it within its timeout
+
+        Args:
+            skill: Skill to run
+            input_data: Input data for the skill
+
+        Returns:
+            The skill's output, or a TIMEOUT output when it did not finish in time.
+            metadata gains executor, queue_wait_ms and run_time_ms.
+        """
+        return self._collect(self._submit(skill, input_data))
+
+    def execute_many(self, skill: BaseSkill, inputs: List[Dict[str, Any]]) -> List[SkillResult]:
+        """
+        Run a skill over many inputs in parallel
+
+        Every item is submitted before any is awaited; each keeps its own
+        timeout, measured from its submission.
+
+        Returns:
+            One output per input, in input order
+        """
+        submissions = [self._submit(skill, input_data) for input_data in inputs]
+        return [self._collect(submission) for submission in submissions]
+
+    def _submit(self, skill: BaseSkill, input_data: Dict[str, Any]) -> _Submission:
+        submission = _Submission(skill, input_data.get("request_id", "unknown"))
+        try:
+            timeout = remaining_timeout(input_data.get("timeout_seconds", DEFAULT_TIMEOUT_SECONDS))
+        except DeadlineExceeded as e:
+            submission.executor = "inline"
+            submission.output = self._timeout_output(submission, str(e), None)
+            return submission
+        submission.timeout = timeout
+
+        if getattr(_in_worker, "active", False):
+            # Already on a skill worker: waiting on the pool from here could exhaust it
+            output = skill.execute(input_data)
+            submission.output = self._with_timing(output, "inline", 0.0, (time.time() - submission.submitted) * 1000)
+        elif self.profile_for(skill) == CPU_PROFILE:
+            submission.executor = "process"
+            if timeout is not None:
+                # No deadline crosses the process boundary; pass the budget as the skill's own timeout
+                input_data = dict(input_data, timeout_seconds=timeout)
+            cls = type(skill)
+            submission.future = self._process_pool().submit(
+                _run_in_process, cls.__module__, cls.__qualname__, input_data
+            )
+        else:
+            # The skill runs under its own deadline so a timeout can stop it cooperatively
+            submission.deadline = Deadline(timeout, parent=current_deadline())
+            context = contextvars.copy_context()
+            submission.future = self._threads.submit(
+                context.run, self._run_scoped, submission.deadline, skill, input_data, submission.timing
+            )
+        return submission
+
+    def _collect(self, submission: _Submission) -> SkillResult:
+        if submission.output is not None:
+            return submission.output
+        wait = None
+        if submission.timeout is not None:
+            wait = max(0.0, submission.submitted + submission.timeout - time.time())
+        try:
+            result = submission.future.result(timeout=wait)
+        except FuturesTimeoutError:
+            submission.future.cancel()
+            if submission.deadline is not None:
+                submission.deadline.cancel(f"skill {submission.skill.skill_name} timed out")
+            return self._timeout_output(
+                submission,
+                f"Skill execution exceeded {submission.timeout:.3f}s",
+                submission.timing.get("started")
+            )
+        except Exception as e:
+            # Only process-pool failures land here; thread runs return error outputs
+            logger.error(f"Skill {submission.skill.skill_name} failed in worker process: {str(e)}")
+            return SkillOutput(
+                skill_name=submission.skill.skill_name,
+                status=SkillStatus.ERROR,
+                request_id=submission.request_id,
+                error_message=str(e),
+                error_code="EXECUTION_ERROR",
+                execution_time_ms=(time.time() - submission.submitted) * 1000,
+                metadata={"exception_type": type(e).__name__, "executor": "process"}
+            )
+
+        if submission.executor == "process":
+            output, started, finished = result
+        else:
+            output = result
+            started = submission.timing.get("started", submission.submitted)
+            finished = submission.timing.get("finished", time.time())
+        return self._with_timing(
+            output, submission.executor, (started - submission.submitted) * 1000, (finished - started) * 1000
+        )
+
+    @staticmethod
+    def _run_scoped(deadline: Deadline, skill: BaseSkill, input_data: Dict[str, Any],
+                    timing: Dict[str, float]) -> SkillResult:
+        with deadline_scope(deadline=deadline):
+            return _run_on_thread(skill, input_data, timing)
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(max_workers=self.process_workers)
+            return self._processes
+
+    @staticmethod
+    def _with_timing(output: SkillResult, executor: str, queue_wait_ms: float, run_time_ms: float) -> SkillResult:
+        output.metadata = dict(
+            output.metadata or {},
+            executor=executor,
+            queue_wait_ms=round(max(0.0, queue_wait_ms), 3),
+            run_time_ms=round(max(0.0, run_time_ms), 3)
+        )
+        return output
+
+    @staticmethod
+    def _timeout_output(submission: _Submission, message: str, started: Optional[float]) -> SkillOutput:
+        now = time.time()
+        submitted = submission.submitted
+        # Never started: the whole wait was queueing
+        queue_end = started if started is not None else now
+        logger.error(f"Skill execution timeout: {submission.skill.skill_name} (request: {submission.request_id})")
+        return SkillOutput(
+            skill_name=submission.skill.skill_name,
+            status=SkillStatus.TIMEOUT,
+            request_id=submission.request_id,
+            error_message=message,
+            error_code="TIMEOUT",
+            execution_time_ms=(now - submitted) * 1000,
+            metadata={
+                "executor": submission.executor,
+                "queue_wait_ms": round((queue_end - submitted) * 1000, 3),
+                "run_time_ms": round((now - queue_end) * 1000, 3),
+                "started": started is not None
+            }
+        )
+
+    def shutdown(self, wait: bool = True):
+        """Stop both pools"""
+        self._threads.shutdown(wait=wait, cancel_futures=True)
+        with self._lock:
+            if self._processes is not None:
+                self._processes.shutdown(wait=wait, cancel_futures=True)
+                self._processes = None
+
+
+# Global skill executor
+_skill_executor = None
+
+
+def get_skill_executor() -> SkillExecutor:
+    """
+    Get the global skill executor (singleton)
+
+    Pool sizes come from SKILL_THREAD_WORKERS and SKILL_PROCESS_WORKERS.
+    """
+    global _skill_executor
+    if _skill_executor is None:
+        process_workers = os.getenv("SKILL_PROCESS_WORKERS")
+        _skill_executor = SkillExecutor(
+            thread_workers=int(os.getenv("SKILL_THREAD_WORKERS", "8")),
+            process_workers=int(process_workers) if process_workers else None
+        )
+    return _skill_executor
@@ -6,11 +6,16 @@ Client for orchestrating agents and workflows
 import os
 import logging
 import json
+import contextvars
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from enum import Enum
 
+from backend.singleflight import SingleFlight, coalesced
+from backend.deadline import remaining_timeout
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,20 +45,37 @@ class WatsonxOrchestrationClient:
     - Digital skill invocation
     - Multi-agent collaboration/handoff
     - Status tracking and monitoring
+    - Single-flight coalescing: concurrent identical calls share one request
+    - Request timeouts capped by the caller's deadline (backend.deadline);
+      DeadlineExceeded is raised instead of sending a request nobody awaits
     """
     
-    def __init__(self):
-        """Initialize watsonx Orchestrate client"""
+    def __init__(self, base_url: Optional[str] = None, use_mock: Optional[bool] = None):
+        """
+        Initialize watsonx Orchestrate client
+        
+        Args:
+            base_url: API base URL, e.g. a local stand-in (default WATSONX_BASE_URL)
+            use_mock: Answer locally without HTTP calls (default USE_MOCK_WATSONX)
+        """
         self.api_key = os.getenv("WATSONX_API_KEY", "")
         self.account_id = os.getenv("WATSONX_ACCOUNT_ID", "")
-        self.base_url = os.getenv(
+        self.base_url = base_url or os.getenv(
             "WATSONX_BASE_URL",
             "https://api.watsonxdata.cloud.ibm.com/v2"
         )
         self.timeout = 30
+        self.inflight = SingleFlight()
+        
+        # The batch execution endpoint is not part of every deployment;
+        # without it batches fan out to the single-execution endpoint
+        self.batch_execute = os.getenv("WATSONX_BATCH_EXECUTE", "false").lower() == "true"
+        self.batch_fanout_workers = int(os.getenv("WATSONX_BATCH_FANOUT_WORKERS", "8"))
         
         # Mock mode for testing
-        self.use_mock = os.getenv("USE_MOCK_WATSONX", "false").lower() == "true"
+        if use_mock is None:
+            use_mock = os.getenv("USE_MOCK_WATSONX", "false").lower() == "true"
+        self.use_mock = use_mock
         
         if not self.use_mock:
             self.headers = {
@@ -63,6 +85,11 @@ class WatsonxOrchestrationClient:
         else:
             logger.warning("Using mock watsonx - NOT FOR PRODUCTION")
     
+    @coalesced(key_fn=lambda args: dict(
+        args,
+        # Retries of the same request differ only in their timestamp
+        input_data={k: v for k, v in args["input_data"].items() if k != "timestamp"}
+    ))
     def execute_agent_workflow(
         self,
         agent_id: str,
@@ -93,7 +120,7 @@ class WatsonxOrchestrationClient:
         payload = {
             "accountId": self.account_id,
             "input": input_data,
-            "executionMode": execution_mode.value,
+            "executionMode": ExecutionMode(execution_mode).value,
             "timestamp": datetime.utcnow().isoformat() + "Z"
         }
         
@@ -102,7 +129,7 @@ class WatsonxOrchestrationClient:
                 endpoint,
                 json=payload,
                 headers=self.headers,
-                timeout=self.timeout
+                timeout=remaining_timeout(self.timeout)
             )
             response.raise_for_status()
             
@@ -134,6 +161,124 @@ class WatsonxOrchestrationClient:
                 "timestamp": datetime.utcnow().isoformat()
             }
     
+    def execute_agent_workflow_batch(
+        self,
+        agent_id: str,
+        workflow_id: str,
+        inputs: List[Dict[str, Any]],
+        execution_mode: ExecutionMode = ExecutionMode.ASYNC
+    ) -> List[Dict[str, Any]]:
+        """
+        Submit many executions of one workflow
+        
+        Uses the execute_batch endpoint (one request) when the deployment
+        supports it (WATSONX_BATCH_EXECUTE=true); otherwise each input is
+        submitted to the execute endpoint, several at a time.
+        
+        Args:
+            agent_id: ID of the procurement agent
+            workflow_id: ID of the workflow to execute
+            inputs: Input parameters, one dict per execution
+            execution_mode: Sync or async execution
+        
+        Returns:
+            One result per input, in the same order and shape as
+            execute_agent_workflow
+        """
+        if not inputs:
+            return []
+        
+        if self.use_mock:
+            return [
+                self._mock_execute_workflow(agent_id, workflow_id, input_data)
+                for input_data in inputs
+            ]
+        
+        if not self.batch_execute:
+            return self._fan_out_workflow_batch(agent_id, workflow_id, inputs, execution_mode)
+        
+        endpoint = f"{self.base_url}/agents/{agent_id}/workflows/{workflow_id}/execute_batch"
+        
+        payload = {
+            "accountId": self.account_id,
+            "inputs": inputs,
+            "executionMode": ExecutionMode(execution_mode).value,
+            "timestamp": datetime.utcnow().isoformat() + "Z"
+        }
+        
+        try:
+            response = requests.post(
+                endpoint,
+                json=payload,
+                headers=self.headers,
+                timeout=remaining_timeout(self.timeout)
+            )
+            response.raise_for_status()
+            
+            executions = response.json().get("executions", [])
+            logger.info(
+                f"Workflow batch executed: {agent_id}/{workflow_id} "
+                f"({len(executions)} executions)"
+            )
+            
+            results = [
+                {
+                    "status": "success",
+                    "execution_id": execution.get("executionId"),
+                    "output": execution.get("output"),
+                    "timestamp": execution.get("timestamp")
+                }
+                for execution in executions[:len(inputs)]
+            ]
+            if len(executions) != len(inputs):
+                logger.error(
+                    f"Workflow batch {agent_id}/{workflow_id} returned {len(executions)} "
+                    f"executions for {len(inputs)} inputs"
+                )
+                results.extend(
+                    {
+                        "status": "error",
+                        "error_message": "No execution returned for this input",
+                        "timestamp": datetime.utcnow().isoformat()
+                    }
+                    for _ in range(len(inputs) - len(results))
+                )
+            return results
+        
+        except requests.exceptions.Timeout:
+            logger.error(f"Workflow batch timeout: {agent_id}/{workflow_id}")
+            failure = {
+                "status": "timeout",
+                "error_message": "Workflow batch execution timed out"
+            }
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Workflow batch execution failed: {str(e)}")
+            failure = {
+                "status": "error",
+                "error_message": str(e)
+            }
+        
+        failure["timestamp"] = datetime.utcnow().isoformat()
+        return [dict(failure) for _ in inputs]
+    
+    def _fan_out_workflow_batch(
+        self,
+        agent_id: str,
+        workflow_id: str,
+        inputs: List[Dict[str, Any]],
+        execution_mode: ExecutionMode
+    ) -> List[Dict[str, Any]]:
+        """Submit a batch as concurrent single executions (each keeps its own status)"""
+        def submit(input_data):
+            return self.execute_agent_workflow(agent_id, workflow_id, input_data, execution_mode)
+        
+        workers = max(1, min(self.batch_fanout_workers, len(inputs)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="watsonx-batch") as pool:
+            # Each submission runs under the caller's deadline
+            futures = [pool.submit(contextvars.copy_context().run, submit, item) for item in inputs]
+            return [future.result() for future in futures]
+
+    @coalesced()
     def get_workflow_status(
         self,
         agent_id: str,
@@ -164,7 +309,7 @@ class WatsonxOrchestrationClient:
             response = requests.get(
                 endpoint,
                 headers=self.headers,
-                timeout=self.timeout
+                timeout=remaining_timeout(self.timeout)
             )
             response.raise_for_status()
             return response.json()
@@ -175,6 +320,7 @@ class WatsonxOrchestrationClient:
                 "error_message": str(e)
             }
     
+    @coalesced()
     def invoke_skill(
         self,
         skill_name: str,
@@ -207,7 +353,7 @@ class WatsonxOrchestrationClient:
                 endpoint,
                 json=payload,
                 headers=self.headers,
-                timeout=self.timeout
+                timeout=remaining_timeout(self.timeout)
             )
             response.raise_for_status()
             
@@ -263,7 +409,7 @@ class WatsonxOrchestrationClient:
                 endpoint,
                 json=payload,
                 headers=self.headers,
-                timeout=self.timeout
+                timeout=remaining_timeout(self.timeout)
             )
             response.raise_for_status()
             
@@ -280,6 +426,7 @@ class WatsonxOrchestrationClient:
                 "target_agent": target_agent
             }
     
+    @coalesced()
     def list_agents(self) -> List[Dict[str, Any]]:
         """
         List all registered agents
@@ -323,7 +470,7 @@ class WatsonxOrchestrationClient:
             response = requests.get(
                 endpoint,
                 headers=self.headers,
-                timeout=self.timeout
+                timeout=remaining_timeout(self.timeout)
             )
             response.raise_for_status()
             return response.json().get("agents", [])
@@ -331,6 +478,7 @@ class WatsonxOrchestrationClient:
             logger.error(f"Failed to list agents: {str(e)}")
             return []
     
+    @coalesced()
     def get_agent_status(self, agent_id: str) -> Dict[str, Any]:
         """Get status of a specific agent"""
         
@@ -348,7 +496,7 @@ class WatsonxOrchestrationClient:
             response = requests.get(
                 endpoint,
                 headers=self.headers,
-                timeout=self.timeout
+                timeout=remaining_timeout(self.timeout)
             )
             response.raise_for_status()
             return response.json()
@@ -0,0 +1,463 @@
+"""
+Local watsonx.orchestrate Stand-in Server
+HTTP stand-in for the endpoints used by WatsonxOrchestrationClient
+
+Lets pooling, retry, async and batching behaviour of the client be
+load-tested on a laptop without the real service. Latency, error rate
+and throttling are configurable and seedable so runs are reproducible.
+
+Usage:
+    python src/backend/watsonx_standin.py --port 8900 \\
+        --latency lognormal:40,0.6 --error-rate 0.02 --rate-limit 200
+
+    export WATSONX_BASE_URL=http://127.0.0.1:8900/v2
+    export USE_MOCK_WATSONX=false
+"""
+
+import argparse
+import logging
+import math
+import os
+import random
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from flask import Flask, Blueprint, jsonify, request
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyModel:
+    """
+    Latency distribution parsed from a compact spec string
+
+    Supported specs (all values in milliseconds unless noted):
+        fixed:50
+        uniform:20,80
+        normal:50,10          (mean, stddev)
+        lognormal:40,0.6      (median, sigma of the underlying normal)
+        exponential:30        (mean)
+    """
+
+    KINDS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+    def __init__(self, spec: str = "fixed:0"):
+        kind, _, raw_params = spec.partition(":")
+        kind = kind.strip().lower()
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution: {kind}")
+
+        params = [float(p) for p in raw_params.split(",") if p.strip()] if raw_params else []
+        expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exponential": 1}[kind]
+        if len(params) != expected:
+            raise ValueError(f"Latency spec '{spec}' needs {expected} parameter(s)")
+
+        self.spec = spec
+        self.kind = kind
+        self.params = params
+
+    def sample_ms(self, rng: random.Random) -> float:
+        """Draw one latency sample in milliseconds (never negative)"""
+        p = self.params
+        if self.kind == "fixed":
+            value = p[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(p[0], p[1])
+        elif self.kind == "normal":
+            value = rng.gauss(p[0], p[1])
+        elif self.kind == "lognormal":
+            value = rng.lognormvariate(math.log(max(p[0], 1e-6)), p[1])
+        else:
+            value = rng.expovariate(1.0 / p[0]) if p[0] > 0 else 0.0
+        return max(0.0, value)
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to emulate service-side throttling"""
+
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate = rate_per_second
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def try_acquire(self) -> Optional[float]:
+        """
+        Take one token
+
+        Returns:
+            None if a token was taken, otherwise seconds until one is available
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return None
+            return (1 - self.tokens) / self.rate
+
+
+class StandinConfig:
+    """Behaviour knobs for the stand-in server"""
+
+    def __init__(
+        self,
+        latency: str = "fixed:0",
+        endpoint_latency: Optional[Dict[str, str]] = None,
+        error_rate: float = 0.0,
+        hang_rate: float = 0.0,
+        hang_seconds: float = 35.0,
+        rate_limit: float = 0.0,
+        burst: int = 50,
+        execution_duration_ms: float = 0.0,
+        seed: Optional[int] = None,
+        url_prefix: str = "/v2"
+    ):
+        """
+        Args:
+            latency: Default latency spec for every endpoint
+            endpoint_latency: Per-endpoint overrides keyed by endpoint name
+                (execute, execute_batch, execution_status, invoke_skill, route,
+                list_agents, agent_status)
+            error_rate: Probability of answering with a 5xx error
+            hang_rate: Probability of stalling for hang_seconds (client timeouts)
+            hang_seconds: Stall duration for hung requests
+            rate_limit: Allowed requests per second (0 disables throttling)
+            burst: Token bucket capacity when throttling is enabled
+            execution_duration_ms: Time an async execution stays "running"
+            seed: Seed for latency and fault sampling
+            url_prefix: Path prefix matching WATSONX_BASE_URL (default /v2)
+        """
+        if not 0.0 <= error_rate <= 1.0 or not 0.0 <= hang_rate <= 1.0:
+            raise ValueError("error_rate and hang_rate must be between 0 and 1")
+
+        self.latency = LatencyModel(latency)
+        self.endpoint_latency = {
+            name: LatencyModel(spec) for name, spec in (endpoint_latency or {}).items()
+        }
+        self.error_rate = error_rate
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.execution_duration_ms = execution_duration_ms
+        self.seed = seed
+        self.url_prefix = url_prefix.rstrip("/")
+
+    @classmethod
+    def from_env(cls) -> "StandinConfig":
+        """Build configuration from WATSONX_STANDIN_* environment variables"""
+        seed = os.getenv("WATSONX_STANDIN_SEED")
+        return cls(
+            latency=os.getenv("WATSONX_STANDIN_LATENCY", "fixed:0"),
+            error_rate=float(os.getenv("WATSONX_STANDIN_ERROR_RATE", "0")),
+            hang_rate=float(os.getenv("WATSONX_STANDIN_HANG_RATE", "0")),
+            rate_limit=float(os.getenv("WATSONX_STANDIN_RATE_LIMIT", "0")),
+            burst=int(os.getenv("WATSONX_STANDIN_BURST", "50")),
+            execution_duration_ms=float(os.getenv("WATSONX_STANDIN_EXECUTION_MS", "0")),
+            seed=int(seed) if seed else None,
+            url_prefix=os.getenv("WATSONX_STANDIN_PREFIX", "/v2")
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "latency": self.latency.spec,
+            "endpoint_latency": {k: v.spec for k, v in self.endpoint_latency.items()},
+            "error_rate": self.error_rate,
+            "hang_rate": self.hang_rate,
+            "hang_seconds": self.hang_seconds,
+            "rate_limit": self.rate_limit,
+            "burst": self.burst,
+            "execution_duration_ms": self.execution_duration_ms,
+            "seed": self.seed,
+            "url_prefix": self.url_prefix
+        }
+
+
+class WatsonxStandin:
+    """
+    Stateful core of the stand-in: fault injection, executions and stats
+
+    Kept separate from the Flask wiring so it can be driven directly in tests.
+    """
+
+    AGENTS = [
+        {"agent_id": "vendor_agent", "name": "Vendor Onboarding Agent", "status": "active"},
+        {"agent_id": "requisition_agent", "name": "Requisition Agent", "status": "active"},
+        {"agent_id": "compliance_agent", "name": "Compliance Agent", "status": "active"},
+        {"agent_id": "approval_agent", "name": "Approval Agent", "status": "active"},
+        {"agent_id": "communication_agent", "name": "Communication Agent", "status": "active"}
+    ]
+
+    def __init__(self, config: Optional[StandinConfig] = None):
+        self.config = config or StandinConfig()
+        self.rng = random.Random(self.config.seed)
+        self.rng_lock = threading.Lock()
+        self.bucket = (
+            TokenBucket(self.config.rate_limit, self.config.burst)
+            if self.config.rate_limit > 0 else None
+        )
+        self.executions: Dict[str, Dict[str, Any]] = {}
+        self.executions_lock = threading.Lock()
+        self.stats_lock = threading.Lock()
+        self.stats = {"requests": {}, "errors": 0, "throttled": 0, "hung": 0}
+
+    def _draw(self, endpoint: str):
+        """Sample latency and fault outcome for one request"""
+        model = self.config.endpoint_latency.get(endpoint, self.config.latency)
+        with self.rng_lock:
+            latency_ms = model.sample_ms(self.rng)
+            hang = self.rng.random() < self.config.hang_rate
+            error = self.rng.random() < self.config.error_rate
+        return latency_ms, hang, error
+
+    def _count(self, key: str, endpoint: Optional[str] = None):
+        with self.stats_lock:
+            if endpoint:
+                self.stats["requests"][endpoint] = self.stats["requests"].get(endpoint, 0) + 1
+            else:
+                self.stats[key] += 1
+
+    def admit(self, endpoint: str):
+        """
+        Apply throttling, latency and fault injection for a request
+
+        Returns:
+            None to continue with a normal answer, or a (body, status, headers)
+            tuple to return instead
+        """
+        self._count("requests", endpoint)
+
+        if self.bucket:
+            retry_after = self.bucket.try_acquire()
+            if retry_after is not None:
+                self._count("throttled")
+                return (
+                    {"status": "error", "error_message": "Rate limit exceeded"},
+                    429,
+                    {"Retry-After": f"{max(retry_after, 0.001):.3f}"}
+                )
+
+        latency_ms, hang, error = self._draw(endpoint)
+        if hang:
+            self._count("hung")
+            time.sleep(self.config.hang_seconds)
+        elif latency_ms:
+            time.sleep(latency_ms / 1000.0)
+
+        if error:
+            self._count("errors")
+            return (
+                {"status": "error", "error_message": "Injected upstream failure"},
+                503,
+                {}
+            )
+        return None
+
+    def create_execution(self, agent_id: str, workflow_id: str, input_data: Any) -> Dict[str, Any]:
+        execution_id = f"exec-{uuid.uuid4().hex[:16]}"
+        record = {
+            "execution_id": execution_id,
+            "agent_id": agent_id,
+            "workflow_id": workflow_id,
+            "input": input_data,
+            "created": time.monotonic()
+        }
+        with self.executions_lock:
+            self.executions[execution_id] = record
+        return record
+
+    def execution_status(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        with self.executions_lock:
+            record = self.executions.get(execution_id)
+        if record is None:
+            return None
+
+        duration_ms = self.config.execution_duration_ms
+        elapsed_ms = (time.monotonic() - record["created"]) * 1000
+        progress = 100 if duration_ms <= 0 else min(100, int(elapsed_ms / duration_ms * 100))
+        return {
+            "status": "success" if progress >= 100 else "running",
+            "execution_id": execution_id,
+            "agent_id": record["agent_id"],
+            "workflow_id": record["workflow_id"],
+            "progress": progress,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+    def snapshot_stats(self) -> Dict[str, Any]:
+        with self.stats_lock:
+            stats = {
+                "requests": dict(self.stats["requests"]),
+                "errors": self.stats["errors"],
+                "throttled": self.stats["throttled"],
+                "hung": self.stats["hung"]
+            }
+        with self.executions_lock:
+            stats["executions"] = len(self.executions)
+        stats["config"] = self.config.to_dict()
+        return stats
+
+
+def create_standin_app(config: Optional[StandinConfig] = None) -> Flask:
+    """
+    Build the Flask app serving the stand-in endpoints
+
+    Args:
+        config: Stand-in behaviour; defaults to WATSONX_STANDIN_* env vars
+
+    Returns:
+        Flask app with the stand-in core available as app.config["STANDIN"]
+    """
+    standin = WatsonxStandin(config or StandinConfig.from_env())
+    api = Blueprint("watsonx_standin", __name__)
+
+    def faulted(endpoint: str):
+        outcome = standin.admit(endpoint)
+        if outcome is None:
+            return None
+        body, status, headers = outcome
+        return jsonify(body), status, headers
+
+    @api.route("/agents/<agent_id>/workflows/<workflow_id>/execute", methods=["POST"])
+    def execute_workflow(agent_id, workflow_id):
+        fault = faulted("execute")
+        if fault:
+            return fault
+        payload = request.get_json(silent=True) or {}
+        record = standin.create_execution(agent_id, workflow_id, payload.get("input"))
+        return jsonify({
+            "status": "success",
+            "executionId": record["execution_id"],
+            "executionMode": payload.get("executionMode", "sync"),
+            "output": {"result": "Stand-in execution accepted"},
+            "timestamp": datetime.utcnow().isoformat()
+        })
+
+    @api.route("/agents/<agent_id>/workflows/<workflow_id>/execute_batch", methods=["POST"])
+    def execute_workflow_batch(agent_id, workflow_id):
+        fault = faulted("execute_batch")
+        if fault:
+            return fault
+        payload = request.get_json(silent=True) or {}
+        timestamp = datetime.utcnow().isoformat()
+        executions = [
+            {
+                "executionId": standin.create_execution(agent_id, workflow_id, item)["execution_id"],
+                "output": {"result": "Stand-in execution accepted"},
+                "timestamp": timestamp
+            }
+            for item in payload.get("inputs", [])
+        ]
+        return jsonify({"status": "success", "executions": executions})
+
+    @api.route("/agents/<agent_id>/executions/<execution_id>", methods=["GET"])
+    def execution_status(agent_id, execution_id):
+        fault = faulted("execution_status")
+        if fault:
+            return fault
+        status = standin.execution_status(execution_id)
+        if status is None:
+            return jsonify({"status": "error", "error_message": "Execution not found"}), 404
+        return jsonify(status)
+
+    @api.route("/skills/<skill_name>/invoke", methods=["POST"])
+    def invoke_skill(skill_name):
+        fault = faulted("invoke_skill")
+        if fault:
+            return fault
+        payload = request.get_json(silent=True) or {}
+        body = {
+            "status": "success",
+            "skill_name": skill_name,
+            "result": {"standin": True, "input_received": payload.get("input")},
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        if skill_name == "llm_reasoning":
+            body["decision"] = "approve"
+            body["confidence"] = 0.9
+        return jsonify(body)
+
+    @api.route("/agents/<agent_id>/route", methods=["POST"])
+    def route_to_agent(agent_id):
+        fault = faulted("route")
+        if fault:
+            return fault
+        return jsonify({
+            "status": "success",
+            "target_agent": agent_id,
+            "handoff_id": f"hoff-{uuid.uuid4().hex[:6]}",
+            "timestamp": datetime.utcnow().isoformat()
+        })
+
+    @api.route("/agents", methods=["GET"])
+    def list_agents():
+        fault = faulted("list_agents")
+        if fault:
+            return fault
+        return jsonify({"agents": WatsonxStandin.AGENTS})
+
+    @api.route("/agents/<agent_id>/status", methods=["GET"])
+    def agent_status(agent_id):
+        fault = faulted("agent_status")
+        if fault:
+            return fault
+        return jsonify({
+            "agent_id": agent_id,
+            "status": "active",
+            "last_activity": datetime.utcnow().isoformat(),
+            "execution_count": standin.snapshot_stats()["requests"].get("execute", 0)
+        })
+
+    app = Flask(__name__)
+    app.register_blueprint(api, url_prefix=standin.config.url_prefix or None)
+    app.config["STANDIN"] = standin
+
+    @app.route("/_standin/stats", methods=["GET"])
+    def standin_stats():
+        """Counters for load-test reports (not part of the real API)"""
+        return jsonify(standin.snapshot_stats())
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local watsonx.orchestrate stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", default=os.getenv("WATSONX_STANDIN_LATENCY", "fixed:0"),
+                        help="fixed:MS | uniform:LO,HI | normal:MEAN,SD | lognormal:MEDIAN,SIGMA | exponential:MEAN")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--hang-seconds", type=float, default=35.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Requests per second (0 = unlimited)")
+    parser.add_argument("--burst", type=int, default=50)
+    parser.add_argument("--execution-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--prefix", default="/v2")
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        hang_rate=args.hang_rate,
+        hang_seconds=args.hang_seconds,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        execution_duration_ms=args.execution_ms,
+        seed=args.seed,
+        url_prefix=args.prefix
+    )
+    app = create_standin_app(config)
+    logger.info(f"watsonx stand-in listening on http://{args.host}:{args.port}{config.url_prefix}")
+    app.run(host=args.host, port=args.port, threaded=True)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,703 @@
+"""
+Workflow Engine
+Local executor for the step graphs in orchestrate/workflows/*.json
+
+Each definition is validated and compiled once into a DAG: step ids are
+resolved to node indexes, conditional "next" branches become labelled edges,
+and every action is bound to a handler or a SkillRegistry skill. Compiled
+workflows are cached by file path and modification time, so a run only pays
+for scheduling and the steps themselves.
+
+A step may rename its action's results before they are merged into the run
+context ("outputs": {"budget_available": "approved"}), so workflow conditions
+can be written against skills whose result keys differ.
+
+At run time a step's conditional edges are resolved against the run context
+(truthiness of context[condition]); the branch not taken is eliminated along
+with every step reachable only through it. Steps whose predecessors have all
+finished are ready; when several are ready they run in parallel on a worker
+pool, and a lone ready step runs inline on the calling thread.
+
+With a CheckpointStore the run state is checkpointed after every step, so a
+restarted process can resume incomplete executions from their last step, and
+an action can raise WorkflowSuspended to park the execution until resume()
+supplies what it was waiting for (e.g. a manager's approval).
+"""
+
+import glob
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Any, Optional, List, Callable, Tuple
+
+from backend.skill_base import SkillRegistry, SkillStatus, get_skill_registry
+from backend.checkpoint_store import CheckpointStore, TERMINAL_STATUSES, get_checkpoint_store
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKFLOWS_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'orchestrate', 'workflows'
+)
+
+END = "end"
+
+# An action receives a snapshot of the run context and returns a dict of
+# updates to merge back into it (or None)
+ActionHandler = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+class WorkflowDefinitionError(ValueError):
+    """Raised when a workflow definition cannot be compiled"""
+
+
+class WorkflowStepError(RuntimeError):
+    """Raised by an action to fail its step"""
+
+
+class WorkflowSuspended(Exception):
+    """
+    Raised by an action that must wait for an external event (e.g. a manager
+    approval). The execution is checkpointed as "suspended" and the step is
+    re-run when resume() is called with the missing context.
+    """
+
+    def __init__(self, reason: str = "waiting"):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+
+class WorkflowStep:
+    """One compiled node of a workflow DAG"""
+
+    def __init__(
+        self,
+        index: int,
+        step_id: str,
+        action: str,
+        agent: Optional[str],
+        error_handler: Optional[str],
+        outputs: Optional[Dict[str, str]] = None
+    ):
+        self.index = index
+        self.step_id = step_id
+        self.action = action
+        self.agent = agent
+        self.error_handler = error_handler
+        # context key -> result key of the action
+        self.outputs = outputs or {}
+        self.condition: Optional[str] = None
+        # (label, target index); label is None, True or False
+        self.edges: List[Tuple[Optional[bool], int]] = []
+        self.handler: Optional[ActionHandler] = None
+        self.error_action: Optional[ActionHandler] = None
+
+    def __repr__(self) -> str:
+        return f"WorkflowStep({self.step_id}, action={self.action})"
+
+
+class CompiledWorkflow:
+    """A validated workflow DAG ready to run"""
+
+    def __init__(
+        self,
+        workflow_id: str,
+        name: str,
+        steps: List[WorkflowStep],
+        entry: int,
+        source: Optional[str] = None
+    ):
+        self.workflow_id = workflow_id
+        self.name = name
+        self.steps = steps
+        self.entry = entry
+        self.source = source
+        # Actions with no handler or skill (bound to a no-op outside strict mode)
+        self.unbound: List[str] = []
+        self.indegree = [0] * len(steps)
+        for step in steps:
+            for _, target in step.edges:
+                self.indegree[target] += 1
+
+    @classmethod
+    def compile(
+        cls,
+        workflow_id: str,
+        definition: Dict[str, Any],
+        source: Optional[str] = None
+    ) -> "CompiledWorkflow":
+        """
+        Validate a workflow definition and resolve it into a DAG
+
+        Args:
+            workflow_id: Identifier for the workflow
+            definition: Parsed workflow JSON ("workflow_name", "steps")
+            source: Path the definition was loaded from, for error messages
+
+        Returns:
+            CompiledWorkflow (actions are not bound yet)
+        """
+        where = source or workflow_id
+        raw_steps = definition.get("steps")
+        if not isinstance(raw_steps, list) or not raw_steps:
+            raise WorkflowDefinitionError(f"{where}: 'steps' must be a non-empty list")
+
+        # Plain string steps describe a linear chain
+        if all(isinstance(step, str) for step in raw_steps):
+            ids = [_slug(step) for step in raw_steps]
+            raw_steps = [
+                {"id": step_id, "action": step_id, "next": ids[i + 1] if i + 1 < len(ids) else END}
+                for i, step_id in enumerate(ids)
+            ]
+
+        steps: List[WorkflowStep] = []
+        positions: Dict[str, int] = {}
+        for raw in raw_steps:
+            if not isinstance(raw, dict) or not raw.get("id") or not raw.get("action"):
+                raise WorkflowDefinitionError(f"{where}: every step needs an 'id' and an 'action'")
+            if raw["id"] == END or raw["id"] in positions:
+                raise WorkflowDefinitionError(f"{where}: duplicate or reserved step id '{raw['id']}'")
+            outputs = raw.get("outputs", {})
+            if not isinstance(outputs, dict) or not all(isinstance(v, str) for v in outputs.values()):
+                raise WorkflowDefinitionError(
+                    f"{where}: 'outputs' of '{raw['id']}' must map context keys to result keys"
+                )
+            positions[raw["id"]] = len(steps)
+            steps.append(WorkflowStep(
+                index=len(steps),
+                step_id=raw["id"],
+                action=raw["action"],
+                agent=raw.get("agent"),
+                error_handler=raw.get("error_handler"),
+                outputs=outputs
+            ))
+
+        def resolve(step_id: Any, origin: str) -> Optional[int]:
+            if step_id in (None, END):
+                return None
+            if step_id not in positions:
+                raise WorkflowDefinitionError(f"{where}: step '{origin}' points to unknown step '{step_id}'")
+            return positions[step_id]
+
+        for raw, step in zip(raw_steps, steps):
+            next_spec = raw.get("next", END)
+            if isinstance(next_spec, dict):
+                if "condition" not in next_spec:
+                    raise WorkflowDefinitionError(f"{where}: conditional next of '{step.step_id}' needs a 'condition'")
+                step.condition = next_spec["condition"]
+                for label in (True, False):
+                    target = resolve(next_spec.get(str(label).lower()), step.step_id)
+                    if target is not None:
+                        step.edges.append((label, target))
+            else:
+                targets = next_spec if isinstance(next_spec, list) else [next_spec]
+                for target_id in targets:
+                    target = resolve(target_id, step.step_id)
+                    if target is not None:
+                        step.edges.append((None, target))
+
+        compiled = cls(workflow_id, definition.get("workflow_name", workflow_id), steps, 0, source)
+        compiled._check_graph(where)
+        return compiled
+
+    def _check_graph(self, where: str):
+        """Reject cycles and steps that can never run"""
+        # Kahn's algorithm: every node is visited only if the graph is acyclic
+        indegree = list(self.indegree)
+        ready = [i for i, degree in enumerate(indegree) if degree == 0]
+        visited = 0
+        while ready:
+            index = ready.pop()
+            visited += 1
+            for _, target in self.steps[index].edges:
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    ready.append(target)
+        if visited != len(self.steps):
+            raise WorkflowDefinitionError(f"{where}: step graph contains a cycle")
+
+        roots = [step.step_id for step in self.steps if self.indegree[step.index] == 0]
+        if roots != [self.steps[self.entry].step_id]:
+            raise WorkflowDefinitionError(
+                f"{where}: only the first step may have no predecessors (found {roots})"
+            )
+
+    def actions(self) -> List[str]:
+        """All action names referenced by steps and error handlers"""
+        names = []
+        for step in self.steps:
+            for name in (step.action, step.error_handler):
+                if name and name not in names:
+                    names.append(name)
+        return names
+
+
+class StepResult:
+    """Outcome and timing of one executed step"""
+
+    def __init__(
+        self,
+        step_id: str,
+        action: str,
+        status: str,
+        started_ms: float,
+        duration_ms: float,
+        error: Optional[str] = None
+    ):
+        self.step_id = step_id
+        self.action = action
+        self.status = status
+        self.started_ms = started_ms
+        self.duration_ms = duration_ms
+        self.error = error
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "step_id": self.step_id,
+            "action": self.action,
+            "status": self.status,
+            "started_ms": round(self.started_ms, 3),
+            "duration_ms": round(self.duration_ms, 3),
+            "error": self.error
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StepResult":
+        return cls(
+            step_id=data["step_id"],
+            action=data["action"],
+            status=data["status"],
+            started_ms=data["started_ms"],
+            duration_ms=data["duration_ms"],
+            error=data.get("error")
+        )
+
+
+class WorkflowRun:
+    """Result of running a compiled workflow, plus the state needed to resume it"""
+
+    def __init__(self, workflow_id: str, context: Dict[str, Any], execution_id: Optional[str] = None):
+        self.workflow_id = workflow_id
+        self.execution_id = execution_id or str(uuid.uuid4())
+        self.context = context
+        self.status = "running"
+        self.steps: List[StepResult] = []
+        self.skipped: List[str] = []
+        self.unbound: List[str] = []
+        self.duration_ms = 0.0
+        # Scheduling state for dead-path elimination: remaining counts incoming
+        # edges not yet resolved, live records whether any resolved edge was
+        # taken, pending holds steps that are ready but not finished.
+        self.remaining: List[int] = []
+        self.live: List[bool] = []
+        self.pending: List[int] = []
+        self.seq = 0
+
+    @classmethod
+    def start(cls, compiled: "CompiledWorkflow", context: Dict[str, Any],
+              execution_id: Optional[str] = None) -> "WorkflowRun":
+        run = cls(compiled.workflow_id, context, execution_id)
+        run.remaining = list(compiled.indegree)
+        run.live = [False] * len(compiled.steps)
+        run.pending = [compiled.entry]
+        return run
+
+    def checkpoint_state(self, compiled: "CompiledWorkflow", pending: List[int]) -> Dict[str, Any]:
+        """Serializable state; steps are referenced by id so indexes never leak"""
+        steps = compiled.steps
+        return {
+            "context": dict(self.context),
+            "steps": [step.to_dict() for step in self.steps],
+            "skipped": list(self.skipped),
+            "remaining": {steps[i].step_id: count for i, count in enumerate(self.remaining)},
+            "live": [steps[i].step_id for i, live in enumerate(self.live) if live],
+            "pending": [steps[i].step_id for i in pending],
+            "duration_ms": self.duration_ms
+        }
+
+    @classmethod
+    def from_checkpoint(cls, compiled: "CompiledWorkflow", record: Dict[str, Any]) -> "WorkflowRun":
+        state = record["state"]
+        positions = {step.step_id: step.index for step in compiled.steps}
+        run = cls(compiled.workflow_id, dict(state["context"]), record["execution_id"])
+        run.status = record["status"]
+        run.seq = record["seq"]
+        run.steps = [StepResult.from_dict(step) for step in state["steps"]]
+        run.skipped = list(state["skipped"])
+        run.duration_ms = state.get("duration_ms", 0.0)
+        try:
+            run.remaining = [state["remaining"][step.step_id] for step in compiled.steps]
+            live = set(state["live"])
+            run.live = [step.step_id in live for step in compiled.steps]
+            run.pending = [positions[step_id] for step_id in state["pending"]]
+        except KeyError as e:
+            raise WorkflowDefinitionError(
+                f"Checkpoint of {record['execution_id']} does not match workflow {compiled.workflow_id}: step {e}"
+            )
+        return run
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workflow_id": self.workflow_id,
+            "execution_id": self.execution_id,
+            "status": self.status,
+            "steps": [step.to_dict() for step in self.steps],
+            "skipped": list(self.skipped),
+            "unbound_actions": list(self.unbound),
+            "duration_ms": round(self.duration_ms, 3),
+            "context": dict(self.context)
+        }
+
+
+class WorkflowEngine:
+    """
+    Loads, compiles, caches and runs workflow definitions
+
+    Actions are bound in this order: handlers registered with
+    register_action(), then skills of the same name in the SkillRegistry.
+    In strict mode an unbound action is a compile error; otherwise it is
+    bound to a no-op so partially implemented workflows still run, with a
+    warning naming every unbound action and the list kept on the compiled
+    workflow (and in each run's result).
+    """
+
+    def __init__(
+        self,
+        registry: Optional[SkillRegistry] = None,
+        workflows_dir: Optional[str] = None,
+        max_workers: int = 4,
+        strict: bool = False,
+        checkpoint_store: Optional[CheckpointStore] = None
+    ):
+        """
+        Args:
+            registry: Skill registry used to resolve actions (default global registry)
+            workflows_dir: Directory with workflow definitions (default orchestrate/workflows)
+            max_workers: Worker pool size for parallel branches
+            strict: Fail compilation when an action has no handler or skill
+            checkpoint_store: Durable store for execution state (None disables checkpoints)
+        """
+        self.registry = registry or get_skill_registry()
+        self.workflows_dir = workflows_dir or DEFAULT_WORKFLOWS_DIR
+        self.strict = strict
+        self.checkpoints = checkpoint_store
+        self.handlers: Dict[str, ActionHandler] = {}
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="workflow")
+        # path -> (mtime, CompiledWorkflow)
+        self._cache: Dict[str, Tuple[float, CompiledWorkflow]] = {}
+        self._cache_lock = threading.Lock()
+
+    def register_action(self, action: str, handler: ActionHandler):
+        """
+        Bind an action name to a Python callable
+
+        Cached workflows are dropped so the next run picks up the new binding.
+        """
+        self.handlers[action] = handler
+        with self._cache_lock:
+            self._cache.clear()
+
+    def workflow_path(self, workflow_id: str) -> str:
+        """Definition file for a workflow id ("purchase_request_workflow")"""
+        return os.path.join(self.workflows_dir, f"{workflow_id.replace('_', '-')}.json")
+
+    def list_workflows(self) -> List[str]:
+        """Workflow ids available in the workflows directory"""
+        return [
+            os.path.splitext(os.path.basename(path))[0].replace("-", "_")
+            for path in sorted(glob.glob(os.path.join(self.workflows_dir, "*.json")))
+        ]
+
+    def load(self, workflow_id: str) -> CompiledWorkflow:
+        """
+        Get a compiled workflow, compiling it only if the file changed
+
+        Args:
+            workflow_id: Workflow id (file stem with '-' replaced by '_')
+
+        Returns:
+            CompiledWorkflow with actions bound
+        """
+        path = self.workflow_path(workflow_id)
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            raise WorkflowDefinitionError(f"Unknown workflow: {workflow_id}")
+
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(path, "r") as f:
+            definition = json.load(f)
+        compiled = CompiledWorkflow.compile(workflow_id, definition, source=path)
+        self._bind(compiled)
+
+        with self._cache_lock:
+            self._cache[path] = (mtime, compiled)
+        logger.info(f"Compiled workflow {workflow_id}: {len(compiled.steps)} steps")
+        return compiled
+
+    def _bind(self, compiled: CompiledWorkflow):
+        """Resolve every action of a compiled workflow to a callable"""
+        bound: Dict[str, ActionHandler] = {}
+        unbound = []
+        for action in compiled.actions():
+            handler = self._resolve_action(action)
+            if handler is None:
+                if self.strict:
+                    raise WorkflowDefinitionError(
+                        f"{compiled.source or compiled.workflow_id}: no handler or skill for action '{action}'"
+                    )
+                unbound.append(action)
+                handler = _noop_action
+            bound[action] = handler
+        compiled.unbound = unbound
+        if unbound:
+            logger.warning(
+                f"Workflow {compiled.workflow_id}: no handler or skill for actions {unbound}; "
+                f"they run as no-ops and set no context"
+            )
+        for step in compiled.steps:
+            step.handler = bound[step.action]
+            step.error_action = bound[step.error_handler] if step.error_handler else None
+
+    def _resolve_action(self, action: str) -> Optional[ActionHandler]:
+        if action in self.handlers:
+            return self.handlers[action]
+        if self.registry.get_skill(action) is None:
+            return None
+
+        def run_skill(context: Dict[str, Any]) -> Dict[str, Any]:
+            output = self.registry.execute_skill(action, context)
+            if output.status != SkillStatus.SUCCESS:
+                raise WorkflowStepError(output.error_message or f"Skill {action} returned {output.status}")
+            return output.result or {}
+
+        return run_skill
+
+    def run(
+        self,
+        workflow: Any,
+        context: Optional[Dict[str, Any]] = None,
+        execution_id: Optional[str] = None
+    ) -> WorkflowRun:
+        """
+        Execute a workflow
+
+        Args:
+            workflow: Workflow id or CompiledWorkflow
+            context: Initial run context; step results are merged into it
+            execution_id: Id used for checkpoints (generated if omitted)
+
+        Returns:
+            WorkflowRun with final status (completed, failed or suspended),
+            context and per-step timings
+        """
+        compiled = workflow if isinstance(workflow, CompiledWorkflow) else self.load(workflow)
+        run = WorkflowRun.start(compiled, dict(context or {}), execution_id)
+        run.unbound = list(compiled.unbound)
+        self._checkpoint(compiled, run, run.pending)
+        return self._drive(compiled, run)
+
+    def resume(self, execution_id: str, updates: Optional[Dict[str, Any]] = None) -> WorkflowRun:
+        """
+        Continue an execution from its latest checkpoint
+
+        Finished executions are returned as recorded, without re-running any
+        step. Steps that were pending when the checkpoint was taken run again.
+
+        Args:
+            execution_id: Execution to resume
+            updates: Context to merge before resuming (e.g. an approval decision)
+
+        Returns:
+            WorkflowRun
+        """
+        if self.checkpoints is None:
+            raise RuntimeError("Workflow engine has no checkpoint store")
+        record = self.checkpoints.get(execution_id)
+        if record is None:
+            raise KeyError(f"No checkpoint for execution {execution_id}")
+
+        compiled = self.load(record["workflow_id"])
+        run = WorkflowRun.from_checkpoint(compiled, record)
+        run.unbound = list(compiled.unbound)
+        if run.status in TERMINAL_STATUSES:
+            return run
+        run.status = "running"
+        if updates:
+            run.context.update(updates)
+        logger.info(f"Resuming {run.workflow_id} execution {execution_id} at {len(run.steps)} steps done")
+        return self._drive(compiled, run)
+
+    def resume_incomplete(self, include_suspended: bool = False) -> List[WorkflowRun]:
+        """
+        Resume executions interrupted by a restart
+
+        Args:
+            include_suspended: Also re-run suspended executions' waiting steps
+
+        Returns:
+            Runs that were resumed
+        """
+        if self.checkpoints is None:
+            return []
+        status = None if include_suspended else "running"
+        return [self.resume(record["execution_id"]) for record in self.checkpoints.incomplete(status)]
+
+    def _checkpoint(self, compiled: CompiledWorkflow, run: WorkflowRun, pending: List[int],
+                    durable: bool = False):
+        if self.checkpoints is None:
+            return
+        run.seq += 1
+        write = self.checkpoints.save(
+            run.execution_id, run.workflow_id, run.status, run.checkpoint_state(compiled, pending), run.seq
+        )
+        if durable:
+            write.wait()
+
+    def _drive(self, compiled: CompiledWorkflow, run: WorkflowRun) -> WorkflowRun:
+        """Schedule ready steps until the run finishes, fails or suspends"""
+        steps = compiled.steps
+        remaining = run.remaining
+        live = run.live
+        ready = run.pending
+        in_flight = {}
+        started = time.perf_counter()
+
+        def resolve_edges(step: WorkflowStep, taken: Optional[bool]):
+            """Mark outgoing edges taken or dead, then release ready successors"""
+            stack = [(step, taken)]
+            while stack:
+                node, node_taken = stack.pop()
+                branch = None
+                if node_taken and node.condition is not None:
+                    if node.condition not in run.context:
+                        logger.warning(
+                            f"Workflow {run.workflow_id}: condition '{node.condition}' of step "
+                            f"{node.step_id} is not set in the context; taking the false branch"
+                        )
+                    branch = bool(run.context.get(node.condition))
+                for label, target in node.edges:
+                    if node_taken and (label is None or label == branch):
+                        live[target] = True
+                    remaining[target] -= 1
+                    if remaining[target] == 0:
+                        if live[target]:
+                            ready.append(target)
+                        else:
+                            run.skipped.append(steps[target].step_id)
+                            stack.append((steps[target], False))
+
+        def finish(step: WorkflowStep, outcome):
+            self._apply(run, step, outcome, resolve_edges, ready)
+            self._checkpoint(compiled, run, ready + [s.index for s in in_flight.values()])
+
+        # After a failure or suspension nothing new is scheduled, but branches
+        # already in flight are allowed to finish
+        while (ready and run.status == "running") or in_flight:
+            if run.status == "running" and len(ready) == 1 and not in_flight:
+                step = steps[ready.pop()]
+                finish(step, self._run_step(step, dict(run.context), started))
+                continue
+
+            if run.status == "running":
+                for index in ready:
+                    future = self.executor.submit(self._run_step, steps[index], dict(run.context), started)
+                    in_flight[future] = steps[index]
+                ready.clear()
+
+            done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for future in done:
+                step = in_flight.pop(future)
+                finish(step, future.result())
+
+        if run.status == "running":
+            run.status = "completed"
+        if run.status == "failed":
+            ready.clear()
+        run.duration_ms += (time.perf_counter() - started) * 1000
+        # Terminal and suspended states must be on disk before callers act on them
+        self._checkpoint(compiled, run, ready, durable=True)
+        return run
+
+    def _run_step(
+        self,
+        step: WorkflowStep,
+        snapshot: Dict[str, Any],
+        run_started: float
+    ) -> Tuple[StepResult, Optional[Dict[str, Any]]]:
+        """Execute one step's action, never raising"""
+        step_started = time.perf_counter()
+        try:
+            updates = step.handler(snapshot)
+            if updates and step.outputs:
+                updates = dict(updates)
+                for key, source in step.outputs.items():
+                    if source in updates:
+                        updates[key] = updates[source]
+            status, error = "success", None
+        except WorkflowSuspended as e:
+            updates, status, error = None, "waiting", e.reason
+        except Exception as e:
+            updates, status, error = None, "failed", str(e)
+            logger.warning(f"Workflow step {step.step_id} ({step.action}) failed: {error}")
+            if step.error_action is not None:
+                snapshot["error"] = {"step_id": step.step_id, "message": error}
+                try:
+                    updates = step.error_action(snapshot)
+                except Exception as handler_error:
+                    logger.error(f"Error handler {step.error_handler} failed: {handler_error}")
+        finished = time.perf_counter()
+        result = StepResult(
+            step_id=step.step_id,
+            action=step.action,
+            status=status,
+            started_ms=(step_started - run_started) * 1000,
+            duration_ms=(finished - step_started) * 1000,
+            error=error
+        )
+        return result, updates
+
+    def _apply(self, run: WorkflowRun, step: WorkflowStep, outcome, resolve_edges, ready: List[int]):
+        """Merge a finished step into the run (always on the scheduling thread)"""
+        result, updates = outcome
+        run.steps.append(result)
+        if updates:
+            run.context.update(updates)
+        if result.status == "waiting":
+            # The step stays pending and runs again on resume
+            ready.append(step.index)
+            if run.status == "running":
+                run.status = "suspended"
+        elif result.status == "failed":
+            run.status = "failed"
+            run.context.setdefault("failed_step", step.step_id)
+            resolve_edges(step, False)
+        else:
+            resolve_edges(step, True)
+
+
+def _noop_action(context: Dict[str, Any]) -> Dict[str, Any]:
+    return {}
+
+
+# Global engine instance
+_workflow_engine = None
+
+
+def get_workflow_engine() -> WorkflowEngine:
+    """Get global workflow engine bound to the global skill registry and checkpoint store (singleton)"""
+    global _workflow_engine
+    if _workflow_engine is None:
+        _workflow_engine = WorkflowEngine(checkpoint_store=get_checkpoint_store())
+    return _workflow_engine
@@ -2,7 +2,6 @@ import streamlit as st
 import yaml
 import os
 import sys
-import time
 import logging
 from datetime import datetime
 
@@ -474,10 +473,12 @@ else:  # mode == "Chat with Co-Pilot"
     
     from backend.orchestrator import orchestrator
     
-    def process_input(user_input):
+    def stream_input(user_input):
         """
-        Delegates processing to the Orchestrator with enhanced logging.
+        Delegates processing to the Orchestrator with enhanced logging,
+        yielding the response section by section as the pipeline completes.
         """
+        response_text = ""
         try:
             # Log the incoming message
             try:
@@ -497,9 +498,11 @@ else:  # mode == "Chat with Co-Pilot"
             if session:
                 session.add_message("user", "user", user_input)
             
-            # Process through orchestrator
-            result = orchestrator.route_message(user_input)
-            response_text = result["response"]
+            # Process through orchestrator, streaming each section as it is ready
+            for event in orchestrator.stream_message(user_input):
+                if event["event"] == "chunk":
+                    response_text += event["text"]
+                    yield event["text"]
             
             # Add assistant response to session
             if session:
@@ -517,11 +520,10 @@ else:  # mode == "Chat with Co-Pilot"
                 )
             except Exception as e:
                 logger.warning(f"Failed to log response: {str(e)}")
-            
-            return response_text
         except Exception as e:
             logger.error(f"Error processing input: {str(e)}", exc_info=True)
-            return f"Sorry, I encountered an error processing your request. Please try again."
+            if not response_text:
+                yield "Sorry, I encountered an error processing your request. Please try again."
     
     # Chat Interface
     for message in st.session_state.messages:
@@ -536,20 +538,7 @@ else:  # mode == "Chat with Co-Pilot"
         
         # Bot Response
         with st.chat_message("assistant"):
-            message_placeholder = st.empty()
-            full_response = ""
-            
-            # Simulate processing delay
-            with st.spinner("Thinking..."):
-                time.sleep(0.5)
-                response_text = process_input(prompt)
-            
-            # Typewriter effect
-            for chunk in response_text.split():
-                full_response += chunk + " "
-                time.sleep(0.05)
-                message_placeholder.markdown(full_response + "▌")
-            message_placeholder.markdown(full_response)
+            full_response = st.write_stream(stream_input(prompt))
         
         st.session_state.messages.append({"role": "assistant", "content": full_response})
 
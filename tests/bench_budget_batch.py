@@ -0,0 +1,59 @@
+"""
+Benchmark: batched budget checks
+
+Checks many (department, amount) lines with CheckBudgetSkill one execute()
+per line (one audit write each) and with execute_many(), which takes
+running totals per department in one vectorized pass and writes a single
+summarized audit event.
+
+Usage:
+    python tests/bench_budget_batch.py [lines]
+"""
+import random
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+sys.path.append(os.path.join(os.getcwd(), 'orchestrate', 'skills'))
+
+from backend.budget_ledger import BudgetLedger
+from check_budget import CheckBudgetSkill
+
+DEPARTMENTS = ["IT", "HR", "Marketing", "Operations", "Finance", "Facilities"]
+
+
+def build_lines(count):
+    rng = random.Random(11)
+    return [
+        {"department_id": rng.choice(DEPARTMENTS), "amount": round(rng.uniform(10, 2500), 2)}
+        for _ in range(count)
+    ]
+
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    skill = CheckBudgetSkill(ledger=BudgetLedger())
+
+    count = 1000
+    while count <= largest:
+        lines = build_lines(count)
+        # Single checks do not see each other: time a slice and scale it
+        sample = lines[:min(count, 2000)]
+        started = time.perf_counter()
+        for line in sample:
+            skill.execute(line)
+        single_ms = (time.perf_counter() - started) * 1e3 * count / len(sample)
+
+        started = time.perf_counter()
+        outputs = skill.execute_many(lines)
+        batch_ms = (time.perf_counter() - started) * 1e3
+        approved = sum(1 for output in outputs if output.result and output.result["approved"])
+        print(
+            f"{count:>8} lines: one by one {single_ms:9.1f} ms, batch {batch_ms:8.1f} ms "
+            f"({single_ms / batch_ms:5.1f}x), {approved} approved"
+        )
+        count *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: budget ledger under concurrent reservations
+
+Many threads reserve money and then commit, release or abandon it (left to
+expire) across departments whose budgets are too small for everything
+asked, so reservations race for the last of the money. Afterwards every
+balance is checked against the reservations that were granted, and the
+journal is replayed into a fresh ledger, which must agree. Runs once with
+requests spread over all departments and once with every request for one.
+
+Usage:
+    python tests/bench_budget_ledger.py [threads] [operations_per_thread]
+"""
+import random
+import sys
+import os
+import tempfile
+import threading
+import time
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+
+from backend.budget_ledger import BudgetLedger, ReservationError, to_cents
+
+BUDGETS = {"IT": 1000000, "HR": 200000, "Marketing": 400000, "Operations": 700000, "Finance": 500000}
+
+
+def run(threads, operations, departments, journal_path):
+    ledger = BudgetLedger(BUDGETS, journal_path=journal_path, fsync=False, ttl_seconds=0.05)
+    outcomes = [[] for _ in range(threads)]
+    start = threading.Barrier(threads + 1)
+
+    def worker(index):
+        rng = random.Random(index)
+        mine = outcomes[index]
+        start.wait()
+        for _ in range(operations):
+            reservation = ledger.reserve(rng.choice(departments), round(rng.uniform(1, 400), 2))
+            if reservation is None:
+                continue
+            roll = rng.random()
+            try:
+                if roll < 0.6:
+                    ledger.commit(reservation.id)
+                elif roll < 0.9:
+                    ledger.release(reservation.id)
+            except ReservationError:
+                # Expired while this thread was descheduled
+                pass
+            mine.append(reservation)
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    start.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    granted = [reservation for mine in outcomes for reservation in mine]
+    time.sleep(0.06)
+    for department in BUDGETS:
+        balance = ledger.balance(department)
+        committed = sum(r.cents for r in granted if r.department == department and r.status == "committed")
+        assert to_cents(balance["committed"]) == committed, department
+        assert balance["reserved"] == 0 and balance["available"] >= 0, department
+        assert to_cents(balance["available"]) == to_cents(BUDGETS[department]) - committed, department
+    ledger.close()
+
+    recovered = BudgetLedger(BUDGETS, journal_path=journal_path, fsync=False, ttl_seconds=0.05)
+    for department in BUDGETS:
+        assert recovered.balance(department) == ledger.balance(department), department
+    recovered.close()
+    return elapsed, len(granted), sum(1 for r in granted if r.status == "expired")
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    operations = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    print(f"{threads} threads x {operations} reservations")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, departments in (("all departments", list(BUDGETS)), ("one department ", ["IT"])):
+            journal_path = os.path.join(tmp, f"{len(departments)}.jsonl")
+            elapsed, granted, expired = run(threads, operations, departments, journal_path)
+            total = threads * operations
+            print(
+                f"  {label}: {total / elapsed:9.0f} reservations/s, "
+                f"{granted} granted ({expired} expired), balances and journal replay consistent"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: catalog search latency as the catalog grows
+
+Compares the former linear substring scan of SearchCatalogSkill with the
+inverted index in backend.catalog_index on synthetic catalogs of increasing
+size, and times typo-tolerant resolution of misspelled item descriptions.
+
+Usage:
+    python tests/bench_catalog_search.py [largest_catalog_size]
+"""
+import random
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+
+from backend.catalog_index import CatalogIndex
+
+ADJECTIVES = ["ergonomic", "wireless", "compact", "heavy", "portable", "premium", "budget", "smart"]
+NOUNS = ["laptop", "monitor", "chair", "desk", "keyboard", "mouse", "printer", "headset", "cable", "lamp"]
+CATEGORIES = ["Electronics", "Furniture", "Accessories", "Equipment"]
+VENDORS = ["TechGiant", "OfficeMax", "SupplyCo", "Globex", "Initech"]
+QUERIES = ["laptop", "ergonomic chair", "wireless keyboard techgiant", "lamp", "smart monitor 42"]
+TYPOS = ["labtop", "moniter", "ergonomic chiar", "wireles keybaord", "hedset"]
+
+
+def build_catalog(size):
+    rng = random.Random(7)
+    return [
+        {
+            "id": f"SKU-{n}",
+            "name": f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {n % 97}",
+            "price": round(rng.uniform(5, 3000), 2),
+            "category": rng.choice(CATEGORIES),
+            "vendor": rng.choice(VENDORS)
+        }
+        for n in range(size)
+    ]
+
+
+def linear_scan(catalog, query):
+    return [
+        item for item in catalog
+        if query in item['name'].lower() or query in item['category'].lower()
+    ][:20]
+
+
+def time_per_query(fn, iterations, queries=QUERIES):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for query in queries:
+            fn(query)
+    return (time.perf_counter() - start) / (iterations * len(queries)) * 1e3
+
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    size = 1000
+    while size <= largest:
+        catalog = build_catalog(size)
+        started = time.perf_counter()
+        index = CatalogIndex(catalog)
+        build_ms = (time.perf_counter() - started) * 1e3
+        iterations = max(1, 20000 // size)
+        scan_ms = time_per_query(lambda query: linear_scan(catalog, query), iterations)
+        index_ms = time_per_query(lambda query: index.search(query), iterations * 10)
+        fuzzy_ms = time_per_query(lambda query: index.resolve(query), iterations * 10, TYPOS)
+        print(
+            f"{size:>8} items: linear scan {scan_ms:8.3f} ms/query, "
+            f"index {index_ms:8.3f} ms/query, typo resolve {fuzzy_ms:8.3f} ms/query "
+            f"(built in {build_ms:.0f} ms)"
+        )
+        size *= 10
+
+
+if __name__ == "__main__":
+    main()
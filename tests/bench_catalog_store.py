@@ -0,0 +1,76 @@
+"""
+Benchmark: catalog memory, load time and filter scans, dicts vs catalog store
+
+Loads the same synthetic catalog as a JSON list of dicts and as a
+memory-mapped catalog store, then compares a price-range + category filter
+done with a Python loop over dicts and with the store's vectorized scan.
+
+Usage:
+    python tests/bench_catalog_store.py [catalog_size]
+"""
+import json
+import sys
+import os
+import tempfile
+import time
+import tracemalloc
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+sys.path.append(os.path.join(os.getcwd(), 'tests'))
+
+from backend.catalog_store import CatalogStore, write_catalog_store
+from bench_catalog_search import build_catalog
+
+
+def timed(fn):
+    """Result, load time (ms) and heap bytes held by the result (traced in a second, untimed call)"""
+    started = time.perf_counter()
+    value = fn()
+    elapsed = (time.perf_counter() - started) * 1e3
+    tracemalloc.start()
+    traced = fn()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del traced
+    return value, elapsed, allocated
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    catalog = build_catalog(size)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "catalog.json")
+        store_path = os.path.join(tmp, "catalog.cat")
+        with open(json_path, "w") as f:
+            json.dump(catalog, f)
+        write_catalog_store(store_path, catalog)
+
+        def load_json():
+            with open(json_path) as f:
+                return json.load(f)
+
+        items, json_ms, json_bytes = timed(load_json)
+        store, store_ms, store_bytes = timed(lambda: CatalogStore(store_path))
+        print(f"Catalog: {size} items")
+        print(f"  JSON dicts : load {json_ms:8.1f} ms, {json_bytes / size:7.1f} bytes/item on the heap")
+        print(f"  store      : open {store_ms:8.3f} ms, {store_bytes / size:7.1f} bytes/item on the heap "
+              f"({os.path.getsize(store_path) / size:.1f} bytes/item mapped, shared between processes)")
+
+        started = time.perf_counter()
+        loop_rows = [
+            row for row, item in enumerate(items)
+            if 100 <= item["price"] <= 500 and item["category"] == "Furniture"
+        ]
+        loop_ms = (time.perf_counter() - started) * 1e3
+        started = time.perf_counter()
+        scan_rows = store.filter(min_price=100, max_price=500, categories=["Furniture"])
+        scan_ms = (time.perf_counter() - started) * 1e3
+        assert scan_rows.tolist() == loop_rows
+        print(f"\nFilter 100 <= price <= 500, category Furniture ({len(loop_rows)} rows)")
+        print(f"  Python loop over dicts : {loop_ms:8.3f} ms")
+        print(f"  vectorized column scan : {scan_ms:8.3f} ms")
+        del store
+
+
+if __name__ == "__main__":
+    main()
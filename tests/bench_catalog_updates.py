@@ -0,0 +1,65 @@
+"""
+Benchmark: catalog updates without a full rebuild
+
+Times a batch price update applied to a LiveCatalogIndex (delta segment)
+against rebuilding the whole CatalogIndex, then search latency while a
+background merge folds the delta into a new base.
+
+Usage:
+    python tests/bench_catalog_updates.py [catalog_size]
+"""
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+sys.path.append(os.path.join(os.getcwd(), 'tests'))
+
+from backend.catalog_index import CatalogIndex, LiveCatalogIndex
+from bench_catalog_search import build_catalog, QUERIES
+
+
+def percentiles(latencies):
+    latencies = sorted(latencies)
+    return tuple(latencies[int(len(latencies) * q)] * 1e3 for q in (0.5, 0.99)) + (latencies[-1] * 1e3,)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    catalog = build_catalog(size)
+    live = LiveCatalogIndex(CatalogIndex(catalog), merge_threshold=size)
+
+    print(f"Catalog of {size} items")
+    for batch in (1, 100, 1000):
+        updates = [dict(item, price=item["price"] + 1) for item in catalog[:batch]]
+        started = time.perf_counter()
+        live.upsert(updates)
+        print(f"  upsert {batch:>5} items : {(time.perf_counter() - started) * 1e3:8.2f} ms")
+    started = time.perf_counter()
+    CatalogIndex(live.items)
+    print(f"  full rebuild       : {(time.perf_counter() - started) * 1e3:8.2f} ms")
+
+    latencies = []
+    for _ in range(50):
+        for query in QUERIES:
+            started = time.perf_counter()
+            live.search(query)
+            latencies.append(time.perf_counter() - started)
+    print("\nsearch with %d pending changes: p50 %.3f ms, p99 %.3f ms, max %.3f ms"
+          % ((live.pending_changes,) + percentiles(latencies)))
+
+    latencies = []
+    merge = live.compact(wait=False)
+    started = time.perf_counter()
+    while merge.is_alive():
+        for query in QUERIES:
+            query_started = time.perf_counter()
+            live.search(query)
+            latencies.append(time.perf_counter() - query_started)
+    merge_ms = (time.perf_counter() - started) * 1e3
+    print("search during merge (%.0f ms)  : p50 %.3f ms, p99 %.3f ms, max %.3f ms"
+          % ((merge_ms,) + percentiles(latencies)))
+    print(f"pending changes after merge: {live.pending_changes}")
+
+
+if __name__ == "__main__":
+    main()
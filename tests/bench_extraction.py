@@ -0,0 +1,115 @@
+"""
+Benchmark: per-message parse cost of the extraction grammar
+
+Compares the legacy sequential re.search chains formerly inlined in the
+vendor/requisition agents with backend.extraction on a corpus of realistic
+messages.
+
+Usage:
+    python tests/bench_extraction.py [iterations]
+"""
+import re
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+
+from backend.extraction import extract
+
+CORPUS = [
+    "Order a $12,000 espresso machine for the office",
+    "I need to buy 5 chairs for office",
+    "buy 10 laptops",
+    "Please purchase 3 standing desks for the Engineering team",
+    "Order a $850 printer for HR",
+    "We need to order 25 monitors in the IT department",
+    "get 2 ergonomic keyboards for Finance",
+    "Order 5 laptops from vendor Dell for IT",
+    "Order a $850 printer from supplier HP in the IT department",
+    "Add vendor: Quantum Systems Inc, Tax ID: 99-8877665, Industry: Technology",
+    "New supplier: Globex Logistics, Tax ID: 12-3456789, Industry: Wholesale",
+    "Onboard company: Initech LLC, Tax ID: 55-1029384",
+    "Check status of REQ-001",
+    "Can you check the status of PO-2025-001 please?",
+    "I want to add a new vendor",
+    "The weather is nice",
+]
+
+
+def legacy_extract(user_input):
+    """Sequential extraction as previously done inside the agents"""
+    data = {}
+    name_match = re.search(r'(?:vendor|company|supplier)[:\s]+([^,]+)', user_input, re.IGNORECASE)
+    if name_match:
+        data['vendor_name'] = name_match.group(1).strip()
+    tax_match = re.search(r'tax\s*id[:\s]+([0-9-]+)', user_input, re.IGNORECASE)
+    if tax_match:
+        data['tax_id'] = tax_match.group(1).strip()
+    industry_match = re.search(r'industry[:\s]+([^,\n]+)', user_input, re.IGNORECASE)
+    if industry_match:
+        data['industry'] = industry_match.group(1).strip()
+
+    price_match = re.search(r'\$[\d,]+', user_input)
+    if price_match:
+        data['price'] = int(price_match.group(0).replace('$', '').replace(',', ''))
+        item_pattern = r'(?:order|buy|purchase|get)\s+a?\s*\$[\d,]+\s+(.+?)(?:\s+(?:for|in)\s+(?:the\s+)?|\s*$)'
+        item_match = re.search(item_pattern, user_input, re.IGNORECASE)
+        if item_match:
+            data['item'] = item_match.group(1).strip()
+        dept_match = re.search(r'(?:for|in)\s+(?:the\s+)?(.+?)$', user_input, re.IGNORECASE)
+        if dept_match:
+            data['department'] = dept_match.group(1).strip()
+    else:
+        pattern1 = r'(?:buy|order|need|purchase|get)\s+(\d+)\s+(.+?)\s+(?:for|in)\s+(?:the\s+)?(.+?)$'
+        match = re.search(pattern1, user_input, re.IGNORECASE)
+        if match:
+            data['quantity'] = int(match.group(1))
+            data['item'] = match.group(2).strip()
+            data['department'] = match.group(3).strip()
+        else:
+            pattern2 = r'(?:buy|order|need|purchase|get)\s+(\d+)\s+(.+?)$'
+            match = re.search(pattern2, user_input, re.IGNORECASE)
+            if match:
+                data['quantity'] = int(match.group(1))
+                data['item'] = match.group(2).strip()
+
+    id_match = re.search(r'(REQ-\d+|PO-\d+|[A-Z]+-\d+)', user_input, re.IGNORECASE)
+    if id_match:
+        data['request_ref'] = id_match.group(1).upper()
+    return data
+
+
+def time_per_message(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for text in CORPUS:
+            fn(text)
+    elapsed = time.perf_counter() - start
+    return elapsed / (iterations * len(CORPUS)) * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print(f"Corpus: {len(CORPUS)} messages x {iterations} iterations")
+    legacy_us = time_per_message(legacy_extract, iterations)
+    compiled_us = time_per_message(extract, iterations)
+    print(f"  legacy re.search chains : {legacy_us:8.2f} us/message")
+    print(f"  compiled single pass    : {compiled_us:8.2f} us/message")
+    print(f"  speedup                 : {legacy_us / compiled_us:8.2f}x")
+
+    print("\nField differences (legacy -> compiled):")
+    for text in CORPUS:
+        old = legacy_extract(text)
+        new = extract(text).fields
+        diff = {
+            k: (old.get(k), new.get(k))
+            for k in set(old) | set(new)
+            if old.get(k) != new.get(k)
+        }
+        if diff:
+            print(f"  {text!r}: {diff}")
+
+
+if __name__ == "__main__":
+    main()
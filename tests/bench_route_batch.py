@@ -0,0 +1,66 @@
+"""
+Benchmark: throughput of Orchestrator.route_messages vs per-message route_message
+
+Usage:
+    python tests/bench_route_batch.py [batch_size]
+"""
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+os.environ.setdefault("USE_MOCK_WATSONX", "true")
+
+from backend.budget_ledger import BudgetLedger
+from backend.orchestrator import Orchestrator
+
+TEMPLATES = [
+    "I need to buy {n} chairs for Marketing",
+    "Order a ${price} printer for HR",
+    "Please purchase {n} monitors for the IT department",
+    "Add vendor: Supplier {n} Ltd, Tax ID: 12-{n:07d}, Industry: Wholesale",
+    "Check status of REQ-{n:03d}",
+    "What can you do?",
+]
+
+
+def build_batch(size):
+    return [
+        TEMPLATES[i % len(TEMPLATES)].format(n=i % 50 + 1, price=200 + i % 900)
+        for i in range(size)
+    ]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    # Pending requisitions hold budget, so each run gets its own fresh ledger
+    # instead of draining the global one
+    sequential_orchestrator = Orchestrator(ledger=BudgetLedger())
+    batch_orchestrator = Orchestrator(ledger=BudgetLedger())
+    messages = build_batch(size)
+
+    # Silence per-step console output for the sequential baseline
+    devnull = open(os.devnull, "w")
+    stdout = sys.stdout
+    sys.stdout = devnull
+    try:
+        start = time.perf_counter()
+        for message in messages:
+            sequential_orchestrator.route_message(message)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = batch_orchestrator.route_messages(messages)
+        batched = time.perf_counter() - start
+    finally:
+        sys.stdout = stdout
+        devnull.close()
+
+    assert len(results) == size
+    print(f"Batch of {size} messages")
+    print(f"  route_message loop : {sequential:7.2f}s  ({size / sequential:9.0f} msg/s)")
+    print(f"  route_messages     : {batched:7.2f}s  ({size / batched:9.0f} msg/s)")
+    print(f"  speedup            : {sequential / batched:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
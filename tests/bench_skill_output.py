@@ -0,0 +1,78 @@
+"""
+Benchmark: per-call cost of building SkillOutput
+
+Compares validated SkillOutput(...) construction with SkillOutput.trusted()
+on its own, then BaseSkill.execute() overhead on a no-op skill with
+validate_outputs on and off, next to a full check_budget call for scale.
+
+Usage:
+    python tests/bench_skill_output.py [iterations]
+"""
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+sys.path.append(os.path.join(os.getcwd(), 'orchestrate', 'skills'))
+
+from backend.skill_base import BaseSkill, SkillOutput, SkillStatus
+
+FIELDS = {
+    "skill_name": "check_budget",
+    "status": SkillStatus.SUCCESS,
+    "request_id": "req-1",
+    "result": {"approved": True, "remaining_budget": 49000, "department": "IT", "requested_amount": 1000},
+    "execution_time_ms": 0.12,
+    "metadata": {"cache_hit": False, "data_version": "1"}
+}
+
+
+class NoopSkill(BaseSkill):
+    def __init__(self):
+        super().__init__("noop")
+
+    def validate_input(self, input_data):
+        return True
+
+    def _execute_logic(self, input_data):
+        return FIELDS["result"]
+
+
+def time_per_call(fn, iterations):
+    for _ in range(min(iterations, 500)):
+        fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    print(f"SkillOutput construction x {iterations}")
+    validated_us = time_per_call(lambda: SkillOutput(**FIELDS), iterations)
+    trusted_us = time_per_call(lambda: SkillOutput.trusted(**FIELDS), iterations)
+    print(f"  validated SkillOutput(...) : {validated_us:8.2f} us/call")
+    print(f"  SkillOutput.trusted(...)   : {trusted_us:8.2f} us/call")
+    print(f"  speedup                    : {validated_us / trusted_us:8.2f}x")
+
+    from check_budget import CheckBudgetSkill
+    from backend.budget_ledger import BudgetLedger
+
+    request = {"department_id": "IT", "amount": 1000, "request_id": "req-1"}
+    calls = max(1, iterations // 10)
+    skill = NoopSkill()
+    print(f"\nexecute() x {calls}")
+    skill.validate_outputs = True
+    validated_us = time_per_call(lambda: skill.execute(request), calls)
+    skill.validate_outputs = False
+    trusted_us = time_per_call(lambda: skill.execute(request), calls)
+    budget = CheckBudgetSkill(ledger=BudgetLedger())
+    budget_us = time_per_call(lambda: budget.execute(request), calls)
+    print(f"  no-op, validate_outputs=True  : {validated_us:8.2f} us/call")
+    print(f"  no-op, validate_outputs=False : {trusted_us:8.2f} us/call")
+    print(f"  check_budget (audit logged)   : {budget_us:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+import sys
+import os
+import tempfile
+import threading
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+sys.path.append(os.path.join(os.getcwd(), 'orchestrate', 'skills'))
+
+from backend.budget_ledger import BudgetLedger, ReservationError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_reserve_commit_release_and_expiry():
+    print("\n=== Testing Budget Ledger ===")
+    clock = FakeClock()
+    ledger = BudgetLedger({"IT": 1000, "General": 100}, clock=clock, ttl_seconds=60)
+
+    first = ledger.reserve("IT", 600.50)
+    assert first.amount == 600.5 and ledger.balance("IT")["available"] == 399.5
+    # The held money is gone for everyone else
+    assert ledger.reserve("IT", 400) is None
+
+    ledger.commit(first.id)
+    assert first.status == "committed"
+    assert ledger.balance("IT") == {
+        "department": "IT", "budget": 1000, "committed": 600.5, "reserved": 0, "available": 399.5
+    }
+    try:
+        ledger.release(first.id)
+        assert False, "closed reservations cannot be released"
+    except ReservationError:
+        pass
+
+    second = ledger.reserve("IT", 300, reservation_id="REQ-1")
+    ledger.release("REQ-1")
+    assert second.status == "released" and ledger.balance("IT")["available"] == 399.5
+
+    # Unclaimed reservations lapse after their TTL
+    third = ledger.reserve("IT", 399.5, ttl_seconds=5)
+    clock.now += 5
+    assert ledger.balance("IT")["available"] == 399.5 and third.status == "expired"
+    try:
+        ledger.commit(third.id)
+        assert False, "expired reservations cannot be committed"
+    except ReservationError:
+        pass
+
+    assert ledger.account_for("it") == "IT" and ledger.account_for("office") == "General"
+    try:
+        ledger.reserve("Legal", 10)
+        assert False, "unknown departments have no budget"
+    except ValueError:
+        pass
+
+
+def test_concurrent_reservations_never_overspend():
+    print("\n=== Testing Concurrent Reservations ===")
+    ledger = BudgetLedger({"IT": 10000, "HR": 10000})
+    granted = []
+
+    def worker(department):
+        for _ in range(200):
+            reservation = ledger.reserve(department, 7)
+            if reservation is not None:
+                granted.append(reservation)
+
+    threads = [threading.Thread(target=worker, args=("IT" if n % 2 else "HR",)) for n in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for department in ("IT", "HR"):
+        mine = [reservation for reservation in granted if reservation.department == department]
+        assert len(mine) == 10000 // 7
+        assert ledger.balance(department)["available"] == 10000 - 7 * len(mine)
+
+
+def test_journal_recovery():
+    print("\n=== Testing Budget Journal Recovery ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ledger.jsonl")
+        ledger = BudgetLedger({"IT": 1000}, journal_path=path, fsync=False)
+        ledger.commit(ledger.reserve("IT", 100).id)
+        ledger.release(ledger.reserve("IT", 200).id)
+        open_reservation = ledger.reserve("IT", 300, reservation_id="REQ-7")
+        before = ledger.balance("IT")
+        ledger.close()
+
+        # A torn write at the end of the journal is ignored
+        with open(path, "a") as f:
+            f.write('{"op": "commit", "id": "REQ')
+
+        recovered = BudgetLedger({"IT": 1000}, journal_path=path, fsync=False)
+        assert recovered.balance("IT") == before
+        assert before["committed"] == 100 and before["reserved"] == 300
+        recovered.commit(open_reservation.id)
+        assert recovered.balance("IT")["committed"] == 400
+        recovered.close()
+
+
+def test_budget_period_reset_and_global_journal():
+    import backend.budget_ledger as budget_ledger
+
+    print("\n=== Testing Budget Periods ===")
+    clock = FakeClock()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ledger.jsonl")
+        ledger = BudgetLedger({"General": 1000}, journal_path=path, fsync=False, clock=clock,
+                              period=lambda now: "P%d" % (now // 100))
+        ledger.commit(ledger.reserve("General", 900).id)
+        held = ledger.reserve("General", 100)
+        assert ledger.reserve("General", 1) is None
+
+        # A new period forgets last period's spending; open reservations carry over
+        clock.now += 100
+        assert ledger.balance("General")["available"] == 900
+        ledger.commit(held.id)
+        ledger.close()
+        recovered = BudgetLedger({"General": 1000}, journal_path=path, fsync=False, clock=clock,
+                                 period=lambda now: "P%d" % (now // 100))
+        assert recovered.balance("General")["committed"] == 100
+        recovered.close()
+
+        # The global ledger is journaled only when BUDGET_LEDGER_PATH is set
+        previous = budget_ledger._budget_ledger
+        try:
+            budget_ledger._budget_ledger = None
+            os.environ.pop("BUDGET_LEDGER_PATH", None)
+            assert budget_ledger.get_budget_ledger().journal_path is None
+            budget_ledger._budget_ledger = None
+            os.environ["BUDGET_LEDGER_PATH"] = os.path.join(tmp, "global.jsonl")
+            global_ledger = budget_ledger.get_budget_ledger()
+            global_ledger.commit(global_ledger.reserve("IT", 10).id)
+            global_ledger.close()
+            assert os.path.getsize(os.path.join(tmp, "global.jsonl")) > 0
+        finally:
+            os.environ.pop("BUDGET_LEDGER_PATH", None)
+            budget_ledger._budget_ledger = previous
+
+
+def test_check_budget_skill_and_requisitions():
+    os.environ.setdefault("USE_MOCK_WATSONX", "true")
+    from check_budget import CheckBudgetSkill
+    from backend.orchestrator import Orchestrator
+
+    print("\n=== Testing Budget Reservations in Skills and Agents ===")
+    skill = CheckBudgetSkill(ledger=BudgetLedger({"IT": 5000}))
+    check = skill.execute({"department_id": "IT", "amount": 3000}).result
+    assert check["approved"] is True and check["remaining_budget"] == 2000 and "reservation_id" not in check
+
+    held = skill.execute({"department_id": "IT", "amount": 3000, "reserve": True}).result
+    assert held["approved"] is True and held["remaining_budget"] == 2000 and held["reservation_id"]
+    # The first reservation holds the money, so the same request no longer fits
+    assert skill.execute({"department_id": "IT", "amount": 3000, "reserve": True}).result["approved"] is False
+    assert skill.execute({"department_id": "Legal", "amount": 1}).result["approved"] is False
+    assert skill.execute({"department_id": "IT", "amount": -1, "reserve": True}).error_code == "EXECUTION_ERROR"
+
+    ledger = BudgetLedger({"IT": 5000, "General": 1000})
+    orchestrator = Orchestrator(seed=3, ledger=ledger)
+    small = orchestrator._execute_requisition_agent("I need to buy 2 keyboards for IT", "session-1")
+    assert small.data["approval_status"] == "Auto-Approved" and small.data["budget_action"] == "committed"
+    assert small.data["remaining_budget"] == 4900 and ledger.balance("IT")["committed"] == 100
+
+    large = orchestrator._execute_requisition_agent("I need to buy 3 laptops for IT", "session-1")
+    assert large.data["budget_action"] == "held" and large.data["remaining_budget"] == 1300
+    assert "$3,600 held on the IT budget" in orchestrator.renderer.render(large)
+
+    over = orchestrator._execute_requisition_agent("I need to buy 2 laptops for IT", "session-1")
+    assert over.data["budget_status"] == "Insufficient" and over.data["reservation_id"] is None
+
+    general = orchestrator._execute_requisition_agent("I need to buy 4 chairs for office", "session-1")
+    assert general.data["budget_account"] == "General" and ledger.balance("General")["committed"] == 800
+
+    # Held budget goes back when the approver rejects or the session ends
+    orchestrator.settle_requisition(large.data["req_id"], approved=False)
+    assert ledger.balance("IT")["available"] == 4900
+    other = orchestrator._execute_requisition_agent("I need to buy 2 laptops for IT", "session-2")
+    assert other.data["budget_action"] == "held" and ledger.balance("IT")["available"] == 2500
+    assert orchestrator.end_session("session-1") == 0
+    assert orchestrator.end_session("session-2") == 1
+    assert ledger.balance("IT")["available"] == 4900
+    approved = orchestrator._execute_requisition_agent("I need to buy 3 laptops for IT", "session-3")
+    assert orchestrator.settle_requisition(approved.data["req_id"], approved=True).status == "committed"
+    assert orchestrator.end_session("session-3") == 0
+    assert ledger.balance("IT")["committed"] == 3700
+
+
+def test_batch_budget_check():
+    from check_budget import CheckBudgetSkill
+
+    print("\n=== Testing Batched Budget Checks ===")
+
+    class RecordingAuditLogger:
+        def __init__(self):
+            self.events = []
+
+        def log_event(self, **event):
+            self.events.append(event)
+
+    skill = CheckBudgetSkill(ledger=BudgetLedger({"IT": 1000, "HR": 500.5}))
+    skill.audit_logger = RecordingAuditLogger()
+    lines = [("IT", 600), ("HR", 200), ("IT", 300), ("IT", 200), ("Legal", 5), ("HR", 300.5), ("IT", 100)]
+    outputs = skill.execute_many([{"department_id": department, "amount": amount} for department, amount in lines])
+    results = [output.result for output in outputs]
+
+    # Running totals per department, in arrival order; a rejected line takes nothing
+    assert [result["approved"] for result in results] == [True, True, True, False, False, True, True]
+    assert [result["remaining_budget"] for result in results] == [400, 300.5, 100, 100, 0, 0, 0]
+    assert "not found" in results[4]["error"]
+    # Nothing is reserved by a check
+    assert skill.ledger.balance("IT")["available"] == 1000
+
+    assert len(skill.audit_logger.events) == 1
+    details = skill.audit_logger.events[0]["details"]
+    assert details["lines"] == 7 and details["approved"] == 5 and details["unknown_departments"] == ["Legal"]
+    assert details["departments"]["IT"] == {
+        "lines": 4, "approved": 3, "requested_amount": 1200, "approved_amount": 1000, "remaining_budget": 0
+    }
+
+    # Reserve lines are handled in arrival order within the same batch
+    skill.audit_logger.events.clear()
+    mixed = [
+        {"department_id": "IT", "amount": 300},
+        {"department_id": "IT", "amount": 500, "reserve": True, "reservation_id": "res-1"},
+        {"department_id": "IT", "amount": 300},
+        {"department_id": "IT", "amount": 200},
+        {"department_id": "IT", "amount": 300, "reserve": True},
+    ]
+    results = [output.result for output in skill.execute_many(mixed)]
+    assert [result["approved"] for result in results] == [True, True, False, True, False]
+    assert [result["remaining_budget"] for result in results] == [700, 200, 200, 0, 0]
+    assert results[1]["reservation_id"] == "res-1" and "reservation_id" not in results[4]
+    assert skill.ledger.balance("IT")["available"] == 500
+    assert len(skill.audit_logger.events) == 1
+    details = skill.audit_logger.events[0]["details"]
+    assert details["lines"] == 5 and details["approved"] == 3 and details["reservation_ids"] == ["res-1"]
+
+
+if __name__ == "__main__":
+    test_reserve_commit_release_and_expiry()
+    test_concurrent_reservations_never_overspend()
+    test_journal_recovery()
+    test_budget_period_reset_and_global_journal()
+    test_check_budget_skill_and_requisitions()
+    test_batch_budget_check()
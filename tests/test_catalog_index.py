@@ -0,0 +1,179 @@
+import sys
+import os
+import json
+import tempfile
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+sys.path.append(os.path.join(os.getcwd(), 'orchestrate', 'skills'))
+
+from backend.catalog_index import (
+    CatalogIndex, LiveCatalogIndex, DEFAULT_CATALOG, edit_distance, load_catalog, tokenize
+)
+
+ITEMS = [
+    {"id": "A1", "name": "Laptop Pro X", "price": 1500.0, "category": "Electronics", "vendor": "TechGiant"},
+    {"id": "A2", "name": "Laptop Stand", "price": 40.0, "category": "Accessories", "vendor": "OfficeMax"},
+    {"id": "A3", "name": "Ergonomic Chair", "price": 1200.0, "category": "Furniture", "vendor": "OfficeMax"},
+    {"id": "A4", "name": "Monitor 4K", "price": 400.0, "category": "Electronics", "vendor": "TechGiant"},
+    {"id": "A5", "name": "Espresso Machine", "price": 12000.0, "category": "Kitchen", "vendor": "LuxuryKitchens"},
+]
+
+
+def test_and_or_prefix_and_ranking():
+    print("\n=== Testing Catalog Index ===")
+    index = CatalogIndex(ITEMS)
+    assert tokenize("Laptops, Chairs & glass") == ["laptop", "chair", "glass"]
+
+    laptops = index.search("laptops")
+    assert [item["id"] for item in laptops["items"]] == ["A1", "A2"]
+    assert laptops["total_matches"] == 2
+
+    # AND needs every term; OR ranks items matching more terms first
+    assert [item["id"] for item in index.search("laptop officemax")["items"]] == ["A2"]
+    either = index.search("laptop officemax", operator="or")
+    assert either["items"][0]["id"] == "A2" and either["total_matches"] == 3
+
+    # Name matches outrank category/vendor matches; prefixes match whole tokens
+    assert [item["id"] for item in index.search("electronics")["items"]] == ["A1", "A4"]
+    assert [item["id"] for item in index.search("ergo")["items"]] == ["A3"]
+    assert index.search("techgiant", limit=1)["items"][0]["score"] > 0
+    assert len(index.search("techgiant", limit=1)["items"]) == 1
+    assert index.search("typewriter")["total_matches"] == 0
+    assert index.search("  ")["items"] == []
+
+
+def test_catalog_files_and_skill():
+    from search_catalog import SearchCatalogSkill
+
+    print("\n=== Testing Catalog Loading and Skill ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        # Seed-data shape: "item" instead of "name", inside a document
+        document = os.path.join(tmp, "db.json")
+        with open(document, "w") as f:
+            json.dump({"vendors": [], "catalog": [{"item": "Monitor 4K", "price": "400", "vendor": "TechGiant"}]}, f)
+        assert load_catalog(document) == [{"name": "Monitor 4K", "price": 400.0, "vendor": "TechGiant", "id": "1"}]
+
+        table = os.path.join(tmp, "catalog.csv")
+        with open(table, "w") as f:
+            f.write("id,name,price,category\nS-1,Desk Lamp,35.5,Furniture\n")
+        assert load_catalog(table)[0]["price"] == 35.5
+
+    skill = SearchCatalogSkill(index=CatalogIndex(ITEMS))
+    output = skill.execute({"query": "laptop stand"})
+    assert output.result["results_count"] == 1 and output.result["results"][0]["id"] == "A2"
+    assert skill.execute({"query": "laptop", "operator": "xor"}).error_code == "EXECUTION_ERROR"
+
+    version = skill.data_version()
+    skill.set_catalog(ITEMS[:2])
+    assert skill.data_version() != version
+    assert skill.execute({"query": "monitor"}).result["success"] is False
+
+
+def test_typo_tolerant_resolution():
+    print("\n=== Testing Fuzzy Catalog Matching ===")
+    index = CatalogIndex(ITEMS + [
+        {"id": "B1", "name": "Ergonomic Chair", "price": 900.0, "category": "Furniture", "vendor": "SupplyCo"},
+        {"id": "B2", "name": "Monitor Arm", "price": 80.0, "category": "Accessories", "vendor": "OfficeMax"},
+    ])
+    assert edit_distance("chiar", "chair", 1) == 1
+    assert edit_distance("labtop", "laptop", 2) == 1
+    assert edit_distance("keyboard", "keybrd", 1) == 2
+
+    assert index.search("labtop")["items"][0]["id"] == "A1"
+    assert [token for token, _ in index.corrections("moniter")] == ["monitor"]
+    assert index.corrections("xq") == []
+
+    # Same name: the cheaper item wins unless a vendor is preferred
+    assert index.resolve("ergonomic chiar")["id"] == "B1"
+    assert index.resolve("ergonomic chiar", preferred_vendors=["OfficeMax"])["id"] == "A3"
+    assert index.resolve("moniters")["id"] == "B2"
+    assert index.resolve("moniter 4k")["id"] == "A4"
+    # A vendor or category match alone is not the item
+    assert index.resolve("officemax plants") is None
+    assert index.resolve("typewriter") is None
+    # One shared word does not make the item: "printer paper" is not a Printer
+    assert index.resolve("monitor cable") is None
+    assert index.resolve("black ergonomic chair")["id"] == "B1"
+    demo = CatalogIndex(DEFAULT_CATALOG)
+    for text in ("printer paper", "desk lamps", "mouse pads"):
+        assert demo.resolve(text) is None, text
+    assert demo.resolve("printers")["id"] == "5"
+
+
+def test_incremental_updates():
+    from search_catalog import SearchCatalogSkill
+
+    print("\n=== Testing Incremental Catalog Updates ===")
+    skill = SearchCatalogSkill(index=CatalogIndex(ITEMS))
+    version = skill.data_version()
+
+    # Price change, a new item and a delete, all searchable without a rebuild
+    skill.upsert_items([
+        {"id": "A2", "name": "Laptop Stand", "price": 35.0, "category": "Accessories", "vendor": "OfficeMax"},
+        {"id": "N1", "name": "Laptop Sleeve", "price": 25.0, "category": "Accessories", "vendor": "SupplyCo"},
+    ])
+    skill.delete_items(["A4", "N-unknown"])
+    assert skill.data_version() != version
+    assert skill.index.pending_changes == 3
+
+    laptops = skill.execute({"query": "laptop"}).result
+    assert [item["id"] for item in laptops["results"]] == ["A1", "A2", "N1"]
+    assert laptops["total_matches"] == 3 and laptops["results"][1]["price"] == 35.0
+    assert skill.execute({"query": "monitor"}).result["success"] is False
+    assert skill.execute({"query": "laptop", "max_price": 30}).result["results"][0]["id"] == "N1"
+    assert skill.index.resolve("laptop sleve")["id"] == "N1"
+    assert [item["id"] for item in skill.catalog] == ["A1", "A2", "A3", "A5", "N1"]
+
+    # Upserts are normalized like loaded catalogs: string prices become numbers
+    skill.upsert_items([{"sku": 77, "item": "Docking Station", "price": "175", "vendor": "TechGiant"}])
+    dock = skill.index.resolve("docking station")
+    assert dock["id"] == "77" and dock["price"] == 175
+    try:
+        skill.upsert_items([{"name": "No Id", "price": 1}])
+        assert False, "items without an id cannot be upserted"
+    except ValueError:
+        pass
+    skill.delete_items(["77"])
+
+    # Merging keeps results and version, and empties the delta
+    # (scores may shift a little: until then, IDFs still count replaced and deleted items)
+    before = [item["id"] for item in skill.index.search("laptop", operator="or")["items"]]
+    version = skill.data_version()
+    skill.index.compact()
+    assert skill.index.pending_changes == 0 and len(skill.index.base) == 5
+    assert [item["id"] for item in skill.index.search("laptop", operator="or")["items"]] == before
+    assert skill.data_version() == version
+
+    # Enough changes merge in the background; readers keep the state they started with
+    index = LiveCatalogIndex(CatalogIndex(ITEMS), merge_threshold=2)
+    snapshot = index._state
+    index.upsert([{"id": "N2", "name": "Desk Lamp", "price": 20.0}])
+    index.delete(["A1"])
+    if index._merge_thread is not None:
+        index._merge_thread.join()
+    assert index.pending_changes == 0 and [item["id"] for item in index.base.items] == ["A2", "A3", "A4", "A5", "N2"]
+    assert index.search("lamp")["items"][0]["id"] == "N2"
+    assert len(snapshot.base) == 5 and snapshot.changes == {}
+
+
+def test_requisition_agent_prices_from_catalog():
+    os.environ.setdefault("USE_MOCK_WATSONX", "true")
+    from backend.orchestrator import Orchestrator
+
+    print("\n=== Testing Requisition Catalog Pricing ===")
+    orchestrator = Orchestrator(seed=7, catalog=CatalogIndex(ITEMS))
+    response = orchestrator._execute_requisition_agent("I need to buy 3 moniters for IT", "session-1")
+    assert response.outcome == "requisition.created"
+    assert response.data["sku"] == "A4" and response.data["catalog_item"] == "Monitor 4K"
+    assert response.data["unit_price"] == 400.0 and response.data["total_price"] == 1200.0
+    assert "(SKU A4)" in orchestrator.renderer.render(response)
+
+    unknown = orchestrator._execute_requisition_agent("I need to buy 2 whiteboards for HR", "session-1")
+    assert unknown.data["sku"] is None and unknown.data["unit_price"] > 0
+
+
+if __name__ == "__main__":
+    test_and_or_prefix_and_ranking()
+    test_catalog_files_and_skill()
+    test_typo_tolerant_resolution()
+    test_incremental_updates()
+    test_requisition_agent_prices_from_catalog()
@@ -0,0 +1,66 @@
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+sys.path.append(os.path.join(os.getcwd(), 'orchestrate', 'skills'))
+
+from backend.catalog_index import CatalogIndex
+from backend.catalog_store import CatalogStore, write_catalog_store
+
+ITEMS = [
+    {"id": "A1", "name": "Laptop Pro X", "price": 1500, "category": "Electronics", "vendor": "TechGiant"},
+    {"id": "A2", "name": "Laptop Stand", "price": 39.5, "category": "Accessories", "vendor": "OfficeMax", "unit": "each"},
+    {"id": "A3", "name": "Ergonomic Chair", "price": 1200, "category": "Furniture", "vendor": "OfficeMax"},
+    {"id": "A4", "name": "Monitor 4K", "price": 400, "category": "Electronics", "vendor": "TechGiant"},
+    {"id": "A5", "name": "Café Table", "category": "Furniture"},
+]
+
+
+def test_store_round_trip_and_filters():
+    print("\n=== Testing Catalog Store ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.cat")
+        version = write_catalog_store(path, ITEMS)
+        store = CatalogStore(path)
+        assert len(store) == 5 and store.version == version
+        assert list(store) == ITEMS
+        assert store[-1] == {"id": "A5", "name": "Café Table", "category": "Furniture"}
+        assert not store.price.flags.writeable
+
+        # Vectorized scans; the unpriced item never passes a price filter
+        assert store.filter(max_price=500).tolist() == [1, 3]
+        assert store.filter(categories=["furniture"]).tolist() == [2, 4]
+        assert store.filter(min_price=1000, vendors=["OfficeMax"]).tolist() == [2]
+        assert store.filter().tolist() == [0, 1, 2, 3, 4]
+
+        index = CatalogIndex(store)
+        assert index.version == version and index.items is store
+        assert [item["id"] for item in index.search("laptop")["items"]] == ["A1", "A2"]
+        cheap = index.search("laptop", max_price=100)
+        assert [item["id"] for item in cheap["items"]] == ["A2"] and cheap["total_matches"] == 1
+        assert index.search("officemax", category="Furniture")["items"][0]["id"] == "A3"
+
+        truncated = os.path.join(tmp, "truncated.cat")
+        with open(path, "rb") as source, open(truncated, "wb") as target:
+            target.write(source.read()[:-4])
+        try:
+            CatalogStore(truncated)
+        except ValueError as e:
+            print("Rejected:", e)
+        else:
+            raise AssertionError("Expected a truncated store to be rejected")
+
+
+def test_skill_filters_list_catalog():
+    from search_catalog import SearchCatalogSkill
+
+    print("\n=== Testing Filtered Catalog Search ===")
+    skill = SearchCatalogSkill(index=CatalogIndex(ITEMS))
+    output = skill.execute({"query": "electronics", "min_price": 1000})
+    assert [item["id"] for item in output.result["results"]] == ["A1"]
+    assert skill.execute({"query": "laptop", "max_price": "cheap"}).error_code == "EXECUTION_ERROR"
+
+
+if __name__ == "__main__":
+    test_store_round_trip_and_filters()
+    test_skill_filters_list_catalog()
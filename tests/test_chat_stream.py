@@ -0,0 +1,83 @@
+import sys
+import os
+import json
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+os.environ.setdefault("USE_MOCK_WATSONX", "true")
+
+
+def test_stream_message_stages():
+    from backend.orchestrator import Orchestrator
+
+    print("\n=== Testing Streamed Orchestrator Turns ===")
+    orchestrator = Orchestrator(seed=3)
+    events = orchestrator.stream_message("I need to buy 5 chairs for office", session_id="stream-1")
+
+    first = next(events)
+    assert first["event"] == "stage" and first["stage"] == "extraction"
+    assert first["agent"] == "requisition_agent" and first["fields"]["quantity"] == 5
+
+    rest = list(events)
+    orchestrator.wait_for_background(timeout=10)
+    assert rest[0] == {"event": "stage", "stage": "checks", "session_id": "stream-1",
+                       "outcome": "requisition.created"}
+    chunks = [event["text"] for event in rest if event["event"] == "chunk"]
+    done = rest[-1]
+    assert done["event"] == "done"
+    assert len(chunks) > 1 and "".join(chunks) == done["result"]["response"]
+    print(f"Streamed {len(chunks)} chunks")
+
+
+def test_stream_is_incremental():
+    import threading
+    from backend.orchestrator import Orchestrator
+    from backend.response_renderer import ResponseRenderer
+
+    gate = threading.Event()
+
+    class GatedRenderer(ResponseRenderer):
+        def render_stream(self, response, fmt="markdown"):
+            for index, chunk in enumerate(super().render_stream(response, fmt)):
+                if index == 1:
+                    assert gate.wait(5)
+                yield chunk
+
+    orchestrator = Orchestrator(seed=3, renderer=GatedRenderer())
+    events = orchestrator.stream_message("I need to buy 5 chairs for office", session_id="stream-2")
+    assert next(events)["stage"] == "extraction"
+    assert next(events)["stage"] == "checks"
+    # The first section arrives while the rest of the reply is still being rendered
+    first = next(events)
+    assert first["event"] == "chunk" and not gate.is_set()
+    gate.set()
+    rest = list(events)
+    orchestrator.wait_for_background(timeout=10)
+    assert first["text"] + "".join(e["text"] for e in rest if e["event"] == "chunk") == rest[-1]["result"]["response"]
+
+
+def test_sse_endpoint():
+    from backend.server import app
+
+    print("\n=== Testing Chat SSE Endpoint ===")
+    client = app.test_client()
+    response = client.get("/api/chat/stream", query_string={"message": "Check status of REQ-42", "format": "text"})
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+
+    events = []
+    for block in response.get_data(as_text=True).strip().split("\n\n"):
+        name_line, data_line = block.split("\n")
+        events.append((name_line[len("event: "):], json.loads(data_line[len("data: "):])))
+    assert [name for name, _ in events[:2]] == ["stage", "stage"]
+    assert events[-1][0] == "done"
+    text = "".join(data["text"] for name, data in events if name == "chunk")
+    assert text == events[-1][1]["result"]["response"]
+    assert "Request ID: REQ-42" in text and "**" not in text
+
+    assert client.post("/api/chat/stream", json={}).status_code == 400
+    assert client.post("/api/chat/stream", json={"message": "hi", "format": "html"}).status_code == 400
+
+
+if __name__ == "__main__":
+    test_stream_message_stages()
+    test_stream_is_incremental()
+    test_sse_endpoint()
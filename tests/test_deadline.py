@@ -0,0 +1,142 @@
+import sys
+import os
+import time
+import threading
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+os.environ.setdefault("USE_MOCK_WATSONX", "true")
+
+
+def test_nested_deadlines_and_cancellation():
+    from backend.deadline import Deadline, DeadlineExceeded, deadline_scope, remaining_timeout, current_deadline
+
+    print("\n=== Testing Deadline Scopes ===")
+    assert remaining_timeout(30) == 30
+    with deadline_scope(0.5) as outer:
+        assert remaining_timeout(30) <= 0.5
+        with deadline_scope(10) as inner:
+            # A nested scope can only tighten the deadline
+            assert inner.remaining() <= 0.5
+            outer.cancel("client disconnected")
+            assert inner.expired()
+            try:
+                inner.check("lookup")
+                assert False, "cancelled deadline should raise"
+            except DeadlineExceeded as e:
+                print("Raised:", e)
+                assert "client disconnected" in str(e)
+    assert current_deadline() is None
+
+    expired = Deadline(0)
+    try:
+        expired.timeout(5)
+        assert False
+    except TimeoutError:
+        pass
+
+
+def test_skill_honors_timeout_seconds():
+    from backend.skill_base import BaseSkill, SkillStatus
+    from backend.deadline import check_deadline, deadline_scope
+
+    print("\n=== Testing Skill Deadlines ===")
+
+    class PollingSkill(BaseSkill):
+        def __init__(self):
+            super().__init__("polling")
+            self.iterations = 0
+
+        def validate_input(self, input_data):
+            return True
+
+        def _execute_logic(self, input_data):
+            for _ in range(100):
+                check_deadline("polling")
+                self.iterations += 1
+                time.sleep(0.01)
+            return {"done": True}
+
+    skill = PollingSkill()
+    output = skill.execute({"timeout_seconds": 0.1})
+    print("Status:", output.status, "after", skill.iterations, "iterations")
+    assert output.status == SkillStatus.TIMEOUT
+    assert skill.iterations < 50
+
+    skill.iterations = 0
+    with deadline_scope(0):
+        output = skill.execute({})
+    assert output.status == SkillStatus.TIMEOUT
+    assert skill.iterations == 0
+
+
+def test_bus_stops_waiting_when_caller_gives_up():
+    from backend.agent_communication import AgentCommunicationBus, AgentResponse
+    from backend.deadline import Deadline, deadline_scope
+
+    print("\n=== Testing Bus Deadlines ===")
+    bus = AgentCommunicationBus()
+
+    with deadline_scope(0.2):
+        started = time.perf_counter()
+        response = bus.send_sync_request("requisition_agent", "approval_agent", "status", {}, timeout_seconds=30)
+    elapsed = time.perf_counter() - started
+    print(f"Gave up after {elapsed * 1000:.0f}ms with {response.error_code}")
+    assert response.status == "timeout" and elapsed < 1.0
+    assert response.error_code == "DEADLINE_EXCEEDED"
+    assert bus.message_queue == {}
+
+    deadline = Deadline(30)
+    threading.Timer(0.1, deadline.cancel).start()
+    with deadline_scope(deadline=deadline):
+        started = time.perf_counter()
+        response = bus.send_sync_request("requisition_agent", "approval_agent", "status", {})
+    assert response.error_code == "DEADLINE_EXCEEDED"
+    assert time.perf_counter() - started < 1.0
+
+    # Responses wake the waiter immediately
+    def reply():
+        time.sleep(0.05)
+        request = next(iter(bus.message_queue.values()))
+        bus.handle_response(AgentResponse(
+            in_reply_to=request.request_id, from_agent="approval_agent",
+            to_agent="requisition_agent", status="success", result={"ok": True}
+        ))
+
+    threading.Thread(target=reply).start()
+    response = bus.send_sync_request("requisition_agent", "approval_agent", "status", {}, timeout_seconds=5)
+    assert response.status == "success"
+
+
+def test_watsonx_client_and_orchestrator_respect_deadline():
+    from backend.watsonx_orchestrate_client import WatsonxOrchestrationClient
+    from backend.orchestrator import Orchestrator
+    from backend.deadline import Deadline, DeadlineExceeded, deadline_scope
+
+    client = WatsonxOrchestrationClient()
+    client.use_mock = False
+    client.headers = {}
+    client.base_url = "http://127.0.0.1:9"
+    with deadline_scope(deadline=Deadline(0)):
+        try:
+            client.get_agent_status("vendor_agent")
+            assert False, "expired deadline should stop the request"
+        except DeadlineExceeded:
+            pass
+
+    orchestrator = Orchestrator()
+    cancelled = Deadline(30)
+    cancelled.cancel()
+    try:
+        orchestrator.route_message("Check status of REQ-9", deadline=cancelled)
+        assert False, "cancelled request should not run"
+    except DeadlineExceeded:
+        pass
+    result = orchestrator.route_message("Check status of REQ-9", deadline_seconds=5)
+    assert result["agent"] == "approval_agent"
+    assert orchestrator.wait_for_background(timeout=10)
+
+
+if __name__ == "__main__":
+    test_nested_deadlines_and_cancellation()
+    test_skill_honors_timeout_seconds()
+    test_bus_stops_waiting_when_caller_gives_up()
+    test_watsonx_client_and_orchestrator_respect_deadline()
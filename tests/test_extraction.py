@@ -0,0 +1,55 @@
+import sys
+import os
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+
+from backend.extraction import extract
+
+
+def test_requisition_extraction():
+    print("\n=== Testing Requisition Extraction ===")
+    priced = extract("Order a $12,000 espresso machine for the office")
+    print(priced.to_dict())
+    assert priced.get("price") == 12000
+    assert priced.get("item") == "espresso machine"
+    assert priced.get("department") == "office"
+
+    counted = extract("I need to buy 5 chairs for Marketing.")
+    assert counted.get("quantity") == 5
+    assert counted.get("item") == "chairs"
+    assert counted.get("department") == "Marketing"
+
+    no_department = extract("buy 10 laptops")
+    assert no_department.get("item") == "laptops"
+    assert no_department.get("department") is None
+
+    # A vendor clause ends at "for"/"in" and stays out of the item
+    sourced = extract("Order 5 laptops from vendor Dell for IT")
+    assert sourced.get("vendor_name") == "Dell"
+    assert sourced.get("item") == "laptops"
+    assert sourced.get("department") == "IT"
+    reordered = extract("Order 5 laptops for IT from vendor Dell")
+    assert (reordered.get("item"), reordered.get("department"), reordered.get("vendor_name")) == \
+        ("laptops", "IT", "Dell")
+
+    # Spans point back into the source text
+    span = next(s for s in counted.spans if s.field == "item")
+    assert counted.text[span.start:span.end] == "chairs"
+
+
+def test_vendor_and_reference_extraction():
+    print("\n=== Testing Vendor Extraction ===")
+    vendor = extract("Add vendor: Quantum Systems Inc, Tax ID: 99-8877665, Industry: Technology")
+    print(vendor.to_dict())
+    assert vendor.get("vendor_name") == "Quantum Systems Inc"
+    assert vendor.get("tax_id") == "99-8877665"
+    assert vendor.get("industry") == "Technology"
+
+    # Vendor name stops at the next labelled field even without a comma
+    assert extract("add supplier Acme Tax ID: 12-3456789").get("vendor_name") == "Acme"
+    assert extract("I want to add a new vendor").get("vendor_name") is None
+    assert extract("Check status of req-001").get("request_ref") == "REQ-001"
+
+
+if __name__ == "__main__":
+    test_requisition_extraction()
+    test_vendor_and_reference_extraction()
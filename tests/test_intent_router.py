@@ -0,0 +1,56 @@
+import sys
+import os
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+
+from backend.intent_router import IntentRouter, KeywordAutomaton
+
+
+def test_routing_from_agent_configs():
+    print("\n=== Testing Intent Router ===")
+    router = IntentRouter.from_agent_configs()
+
+    cases = {
+        "I want to add a new vendor": "vendor_agent",
+        "Add vendor: Quantum Systems Inc, Tax ID: 99-8877665, Industry: Technology": "vendor_agent",
+        "Order a $12,000 espresso machine for the office": "requisition_agent",
+        "I need to buy 5 chairs for office": "requisition_agent",
+        "Check status of REQ-001": "approval_agent",
+        "check vendor order status": "approval_agent",
+        "The weather is nice": "communication_agent",
+        "I need a new laptop": "requisition_agent",
+        "what is the news": "communication_agent",
+        "Onboarding two new suppliers this week": "vendor_agent",
+        # Mixed signals: purchase verbs beat a bare "vendor", status phrases
+        # beat purchase verbs
+        "Order 5 laptops from vendor Dell for IT": "requisition_agent",
+        "Buy 3 monitors from supplier Acme": "requisition_agent",
+        "Where is my order REQ-9": "approval_agent",
+        "track my purchase": "approval_agent",
+        "Register vendor Acme Corp": "vendor_agent",
+    }
+    for text, expected in cases.items():
+        intent = router.route(text)
+        print(f"{text!r} -> {intent}")
+        assert intent.agent_id == expected
+
+    ranked = router.rank("check vendor order status")
+    assert [m.agent_id for m in ranked][:1] == ["approval_agent"]
+    assert abs(sum(m.confidence for m in ranked) - 1.0) < 1e-9
+    assert router.route("hello").confidence == 0.0
+    # These used to be two-point ties settled by priority
+    assert router.route("Where is my order REQ-9").confidence > 0.5
+    assert router.route("Order 5 laptops from vendor Dell for IT").confidence > 0.5
+
+
+def test_automaton_word_boundaries():
+    automaton = KeywordAutomaton(["order*", "tax id", "new"])
+    hits = {automaton.keywords[i] for i, _ in automaton.scan("reorder orders, tax id: 1 renew news")}
+    assert hits == {"order*", "tax id"}
+    assert automaton.scan("what is new") == [(2, 8)]
+    # Without "*" a keyword must end on a word boundary too
+    assert KeywordAutomaton(["order"]).scan("orders") == []
+
+
+if __name__ == "__main__":
+    test_routing_from_agent_configs()
+    test_automaton_word_boundaries()
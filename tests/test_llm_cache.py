@@ -0,0 +1,77 @@
+import sys
+import os
+import time
+import tempfile
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+os.environ.setdefault("USE_MOCK_WATSONX", "true")
+
+
+def test_lru_and_disk_tiers():
+    from backend.cache import LRUCache, DiskCache, TieredCache, stable_hash
+
+    print("\n=== Testing Cache Tiers ===")
+    assert stable_hash({"a": 1, "b": [1, 2]}) == stable_hash({"b": [1, 2], "a": 1})
+
+    lru = LRUCache(max_entries=2, ttl_seconds=None)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    lru.get("a")
+    lru.set("c", 3)
+    assert lru.get("b") is None and lru.get("a") == 1 and lru.evictions == 1
+
+    short = LRUCache(ttl_seconds=0.05)
+    short.set("k", "v")
+    time.sleep(0.1)
+    assert short.get("k") is None
+
+    directory = tempfile.mkdtemp()
+    cache = TieredCache(LRUCache(), DiskCache(directory, max_entries=10))
+    cache.set("deadbeef", {"decision": "approve"})
+    restarted = TieredCache(LRUCache(), DiskCache(directory, max_entries=10))
+    assert restarted.get("deadbeef") == ({"decision": "approve"}, "disk")
+    assert restarted.get("deadbeef") == ({"decision": "approve"}, "memory")
+    assert restarted.get("missing") == (None, None)
+
+    disk = DiskCache(tempfile.mkdtemp(), max_entries=10)
+    for i in range(25):
+        disk.set(f"{i:04x}" * 4, i)
+    assert disk._count <= 10
+
+
+def test_llm_reasoning_reuses_decisions():
+    from backend.orchestrator import Orchestrator
+    from backend.cache import TieredCache, LRUCache
+    from backend.security.audit_logger import get_audit_logger
+
+    print("\n=== Testing LLM Reasoning Cache ===")
+    orchestrator = Orchestrator(llm_cache=TieredCache(LRUCache()))
+    calls = []
+    original = orchestrator.watsonx_client.invoke_skill
+
+    def counting_invoke(skill_name, skill_input):
+        calls.append(skill_input)
+        return original(skill_name, skill_input)
+
+    orchestrator.watsonx_client.invoke_skill = counting_invoke
+    audited = []
+    audit_logger = get_audit_logger()
+    original_log_event = audit_logger.log_event
+    audit_logger.log_event = lambda **kwargs: audited.append(kwargs["details"])
+    try:
+        first = orchestrator.perform_llm_reasoning("Assess  vendor risk", {"vendor": "Acme", "score": 0.9})
+        second = orchestrator.perform_llm_reasoning("Assess vendor risk", {"score": 0.9, "vendor": "Acme"})
+        third = orchestrator.perform_llm_reasoning("Assess vendor risk", {"vendor": "Other"})
+    finally:
+        audit_logger.log_event = original_log_event
+        orchestrator.watsonx_client.invoke_skill = original
+
+    assert len(calls) == 2
+    assert first["cache_hit"] is False and second["cache_hit"] is True and third["cache_hit"] is False
+    assert [event["cache_hit"] for event in audited] == [False, True, False]
+    assert audited[1]["cache_key"] == audited[0]["cache_key"]
+    print("Cache hit audited with tier:", audited[1]["cache_tier"])
+
+
+if __name__ == "__main__":
+    test_lru_and_disk_tiers()
+    test_llm_reasoning_reuses_decisions()
@@ -0,0 +1,83 @@
+import sys
+import os
+import json
+import tempfile
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+os.environ.setdefault("USE_MOCK_WATSONX", "true")
+
+MESSAGES = [
+    "I need to buy 5 chairs for office",
+    "Add vendor: Quantum Systems Inc, Tax ID: 99-8877665, Industry: Technology",
+    "Check status of REQ-001",
+    "hello there",
+]
+
+
+def test_seeded_orchestrators_agree():
+    from backend.orchestrator import Orchestrator
+    from backend.replay import FixedClock
+
+    print("\n=== Testing Seeded Orchestrator ===")
+    first = Orchestrator(seed=42, clock=FixedClock())
+    second = Orchestrator(seed=42, clock=FixedClock())
+    for message in MESSAGES:
+        a = first.route_message(message)
+        b = second.route_message(message)
+        assert a["session_id"] == b["session_id"]
+        assert a["response"] == b["response"]
+        print(a["agent"], a["session_id"][:8])
+    for orchestrator in (first, second):
+        orchestrator.wait_for_background(timeout=10)
+
+
+def test_record_and_replay():
+    from backend.orchestrator import Orchestrator
+    from backend.replay import TrafficRecorder, load_trace, replay_trace
+
+    print("\n=== Testing Record & Replay ===")
+    trace_path = os.path.join(tempfile.mkdtemp(), "traffic.jsonl")
+    recorder = TrafficRecorder(trace_path)
+    live = Orchestrator(recorder=recorder)
+    for message in MESSAGES * 5:
+        live.route_message(message)
+    live.wait_for_background(timeout=10)
+    recorder.close()
+
+    trace = load_trace(trace_path)
+    assert len(trace) == 20
+    assert trace[0]["message"] == MESSAGES[0]
+
+    report = replay_trace(trace, speed=0, seed=3).to_dict()
+    print(json.dumps(report["latency"]))
+    assert report["requests"] == 20
+    assert report["errors"] == 0
+    assert report["throughput_rps"] > 0
+    assert report["agents"]["requisition_agent"]["count"] == 5
+    assert report["latency"]["p50_ms"] <= report["latency"]["p99_ms"]
+
+    report = replay_trace(trace, speed=0, seed=3, concurrency=4).to_dict()
+    assert report["requests"] == 20 and report["errors"] == 0
+
+    # The default orchestrator uses the mock client even with mock mode off,
+    # and is closed when the replay ends
+    closed = []
+    original_close = Orchestrator.close
+
+    def recording_close(self, timeout=None):
+        closed.append(self.watsonx_client.use_mock)
+        original_close(self, timeout)
+
+    Orchestrator.close = recording_close
+    previous = os.environ.get("USE_MOCK_WATSONX")
+    os.environ["USE_MOCK_WATSONX"] = "false"
+    try:
+        assert replay_trace(trace[:4], speed=0, seed=3).to_dict()["errors"] == 0
+    finally:
+        Orchestrator.close = original_close
+        os.environ["USE_MOCK_WATSONX"] = previous
+    assert closed == [True]
+
+
+if __name__ == "__main__":
+    test_seeded_orchestrators_agree()
+    test_record_and_replay()
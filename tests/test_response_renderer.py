@@ -0,0 +1,73 @@
+import sys
+import os
+import json
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+os.environ.setdefault("USE_MOCK_WATSONX", "true")
+
+
+def test_template_blocks():
+    from backend.response_renderer import ResponseRenderer, AgentResponse, when, choose, each
+
+    print("\n=== Testing Response Templates ===")
+    renderer = ResponseRenderer({
+        "demo": [
+            "**Total**: ${total:,}\n",
+            when("note", "Note: *{note}*\n"),
+            each("items", "{index}. `{name}` x{quantity}\n"),
+            choose("state", {"ok": ["Done"]}, default=["State: {state}"])
+        ]
+    })
+    response = AgentResponse("demo", {
+        "total": 12500,
+        "note": None,
+        "items": [{"name": "chair", "quantity": 5}, {"name": "desk", "quantity": 2}],
+        "state": "ok"
+    })
+
+    markdown = renderer.render(response)
+    assert markdown == "**Total**: $12,500\n1. `chair` x5\n2. `desk` x2\nDone"
+    assert renderer.render(response, "text") == "Total: $12,500\n1. chair x5\n2. desk x2\nDone"
+    assert json.loads(renderer.render(response, "json"))["data"]["total"] == 12500
+
+    response.data.update(note="rush", state="held")
+    assert renderer.render(response, "text").endswith("Note: rush\n1. chair x5\n2. desk x2\nState: held")
+
+    renderer.register("sections", ["# {title}\n\n", each("items", "- {name}\n"), "\n", "Bye"])
+    sectioned = AgentResponse("sections", {"title": "Order", "items": [{"name": "chair"}, {"name": "desk"}]})
+    assert list(renderer.render_stream(sectioned)) == ["# Order\n\n", "- chair\n- desk\n\n", "Bye"]
+    assert "".join(renderer.render_stream(response, "text")) == renderer.render(response, "text")
+
+    for fmt, outcome in (("html", "demo"), ("markdown", "missing")):
+        try:
+            renderer.render(AgentResponse(outcome, response.data), fmt)
+        except ValueError as e:
+            print("Rejected:", e)
+        else:
+            raise AssertionError(f"Expected ValueError for {fmt}/{outcome}")
+
+
+def test_orchestrator_response_formats():
+    from backend.orchestrator import Orchestrator
+    from backend.replay import FixedClock
+
+    print("\n=== Testing Orchestrator Response Formats ===")
+    orchestrator = Orchestrator(seed=7, clock=FixedClock())
+    message = "Add vendor: Quantum Systems Inc, Tax ID: 99-8877665, Industry: Technology"
+
+    markdown = orchestrator.route_message(message, session_id="render-1")
+    text = orchestrator.route_message(message, session_id="render-1", response_format="text")
+    as_json = orchestrator.route_message(message, session_id="render-1", response_format="json")
+    orchestrator.wait_for_background(timeout=10)
+
+    assert markdown["outcome"]["outcome"] == "vendor.validated"
+    assert markdown["outcome"] == text["outcome"] == json.loads(as_json["response"])
+    assert "**Vendor Onboarding Complete**" in markdown["response"]
+    assert "- Vendor ID: `v-" in markdown["response"]
+    assert "Vendor Onboarding Complete" in text["response"] and "*" not in text["response"]
+    assert "- Industry: Technology" in text["response"]
+    print(text["response"])
+
+
+if __name__ == "__main__":
+    test_template_blocks()
+    test_orchestrator_response_formats()
@@ -0,0 +1,83 @@
+import sys
+import os
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+os.environ.setdefault("USE_MOCK_WATSONX", "true")
+
+
+def test_route_messages_batch():
+    from backend.orchestrator import Orchestrator
+
+    print("\n=== Testing Batch Routing ===")
+    orchestrator = Orchestrator()
+    messages = [
+        "I need to buy 5 chairs for office",
+        "Add vendor: Quantum Systems Inc, Tax ID: 99-8877665, Industry: Technology",
+        "Check status of REQ-001",
+        "Order a $300 monitor for IT",
+        "hello there",
+    ]
+    results = orchestrator.route_messages(messages, session_ids=["s-1", None, "s-3", None, None])
+
+    assert [r["agent"] for r in results] == [
+        "requisition_agent", "vendor_agent", "approval_agent",
+        "requisition_agent", "communication_agent"
+    ]
+    assert results[0]["session_id"] == "s-1"
+    assert "Quantum Systems Inc" in results[1]["response"]
+    assert "REQ-001" in results[2]["response"]
+    for result in results:
+        print(result["agent"], result["execution"]["status"])
+        assert result["execution"]["session_id"] == result["session_id"]
+        assert result["execution"]["status"] in ("executing", "mock_mode", "fallback")
+
+
+def test_batch_execution_status_per_item():
+    from backend.orchestrator import Orchestrator
+    from backend.watsonx_orchestrate_client import WatsonxOrchestrationClient
+
+    print("\n=== Testing Batch Execution Status ===")
+
+    class PartialClient:
+        def execute_agent_workflow_batch(self, agent_id, workflow_id, inputs, execution_mode):
+            # First accepted, second timed out, third missing from the response
+            return [
+                {"status": "success", "execution_id": "exec-1"},
+                {"status": "timeout", "error_message": "Workflow execution timed out"},
+            ]
+
+    orchestrator = Orchestrator()
+    orchestrator.watsonx_client = PartialClient()
+    results = orchestrator.route_messages([
+        "I need to buy 5 chairs for office",
+        "I need to buy 2 desks for office",
+        "I need to buy 3 monitors for IT",
+    ])
+    executions = [result["execution"] for result in results]
+    assert [e["status"] for e in executions] == ["executing", "fallback", "fallback"]
+    assert [e["watsonx_orchestrate_used"] for e in executions] == [True, False, False]
+    assert executions[0]["workflow_execution_id"] == "exec-1"
+    assert executions[1]["error"] == "Workflow execution timed out" and executions[2]["error"]
+
+    # Without the batch capability, batches fan out to the single-execution endpoint
+    client = WatsonxOrchestrationClient()
+    client.use_mock = False
+    client.batch_execute = False
+    submitted = []
+
+    def execute_agent_workflow(agent_id, workflow_id, input_data, execution_mode):
+        submitted.append(input_data["n"])
+        if input_data["n"] == 1:
+            return {"status": "error", "error_message": "HTTP 500"}
+        return {"status": "success", "execution_id": f"exec-{input_data['n']}"}
+
+    client.execute_agent_workflow = execute_agent_workflow
+    batch = client.execute_agent_workflow_batch("requisition_agent", "purchase_request_workflow",
+                                                [{"n": n} for n in range(4)])
+    assert sorted(submitted) == [0, 1, 2, 3]
+    assert [r["status"] for r in batch] == ["success", "error", "success", "success"]
+    assert batch[3]["execution_id"] == "exec-3"
+
+
+if __name__ == "__main__":
+    test_route_messages_batch()
+    test_batch_execution_status_per_item()
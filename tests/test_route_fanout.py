@@ -0,0 +1,81 @@
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+os.environ.setdefault("USE_MOCK_WATSONX", "true")
+
+
+def test_background_steps_complete():
+    from backend.orchestrator import Orchestrator
+
+    print("\n=== Testing Concurrent Turn Steps ===")
+    orchestrator = Orchestrator()
+    result = orchestrator.route_message("I need to buy 5 chairs for office", session_id="fanout-1")
+
+    assert result["agent"] == "requisition_agent"
+    assert "chairs" in result["response"]
+    assert result["execution"]["status"] in ("queued", "executing", "mock_mode", "fallback")
+
+    snapshot = {**result, "execution": dict(result["execution"])}
+
+    completed = orchestrator.turn_completion(result["turn_id"]).result(timeout=10)
+    print("Execution:", completed["execution"]["status"], "Sentiment:", completed["sentiment"])
+    assert completed["execution"]["status"] in ("executing", "mock_mode", "fallback")
+    assert completed["execution"]["session_id"] == "fanout-1"
+    assert completed["sentiment"] != "pending"
+    assert completed["response"] == result["response"]
+
+    # The returned result is a snapshot: background work never modifies it
+    assert orchestrator.wait_for_background(timeout=10)
+    assert result == snapshot and result["execution"]["status"] == "queued"
+    try:
+        orchestrator.turn_completion("turn-unknown")
+        assert False, "unknown turns have no completion"
+    except KeyError:
+        pass
+
+
+def test_close_shuts_down_the_pool():
+    from backend.orchestrator import Orchestrator
+
+    with Orchestrator() as orchestrator:
+        result = orchestrator.route_message("Check status of REQ-7", session_id="close-1")
+    # Background work finished before the pool was shut down
+    assert orchestrator.turn_completion(result["turn_id"]).done()
+    try:
+        orchestrator.route_message("Check status of REQ-8")
+        assert False, "a closed orchestrator accepts no work"
+    except RuntimeError:
+        pass
+
+
+def test_slow_nlu_respects_deadline():
+    from backend import orchestrator as orchestrator_module
+    from backend.orchestrator import Orchestrator
+
+    print("\n=== Testing NLU Deadline ===")
+    original = orchestrator_module.ai_service.analyze_text
+
+    def slow_analysis(text):
+        time.sleep(0.5)
+        return original(text)
+
+    orchestrator_module.ai_service.analyze_text = slow_analysis
+    try:
+        orchestrator = Orchestrator()
+        started = time.perf_counter()
+        result = orchestrator.route_message("hello there", deadline_seconds=0.05)
+        elapsed = time.perf_counter() - started
+        print(f"General inquiry answered in {elapsed * 1000:.0f}ms with sentiment {result['sentiment']}")
+        assert result["agent"] == "communication_agent"
+        assert result["sentiment"] == "neutral"
+        assert elapsed < 0.4
+        assert orchestrator.wait_for_background(timeout=10)
+    finally:
+        orchestrator_module.ai_service.analyze_text = original
+
+
+if __name__ == "__main__":
+    test_background_steps_complete()
+    test_close_shuts_down_the_pool()
+    test_slow_nlu_respects_deadline()
@@ -0,0 +1,208 @@
+import sys
+import os
+import time
+import threading
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+os.environ.setdefault("USE_MOCK_WATSONX", "true")
+
+
+def test_concurrent_calls_share_one_execution():
+    from backend.singleflight import SingleFlight
+
+    print("\n=== Testing Single-Flight ===")
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def slow_lookup(value):
+        calls.append(value)
+        release.wait(5)
+        return {"value": value}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("k", slow_lookup, 1)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    while flight.stats()["shared"] < 7:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    print("Stats:", flight.stats())
+    assert calls == [1]
+    assert sorted(shared for _, shared in results) == [False] + [True] * 7
+    assert flight.in_flight() == 0
+
+    # Completed keys are released, so a later call runs again
+    flight.do("k", lambda: calls.append(2))
+    assert calls == [1, 2]
+
+
+def test_errors_fan_out_to_waiters():
+    from backend.singleflight import SingleFlight
+
+    flight = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("upstream down")
+
+    def call():
+        try:
+            flight.do("k", failing)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=call)
+    follower.start()
+    leader.join()
+    follower.join()
+    assert errors == ["upstream down", "upstream down"]
+
+
+def test_waiters_respect_their_deadline():
+    from backend.singleflight import SingleFlight
+    from backend.deadline import DeadlineExceeded, deadline_scope
+
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    leader_results = []
+
+    def slow():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    leader = threading.Thread(target=lambda: leader_results.append(flight.do("k", slow)))
+    leader.start()
+    started.wait()
+
+    began = time.monotonic()
+    try:
+        with deadline_scope(0.1):
+            flight.do("k", slow)
+        assert False, "the waiter should give up at its deadline"
+    except DeadlineExceeded:
+        pass
+    assert time.monotonic() - began < 1
+
+    # Cancelling the waiter's request releases it as well
+    with deadline_scope() as deadline:
+        threading.Timer(0.05, deadline.cancel).start()
+        try:
+            flight.do("k", slow)
+            assert False, "a cancelled waiter should give up"
+        except DeadlineExceeded:
+            pass
+
+    # The leader is unaffected
+    release.set()
+    leader.join()
+    assert leader_results == [("done", False)]
+
+
+def test_orchestrator_coalesces_status_checks():
+    from backend.orchestrator import Orchestrator
+
+    print("\n=== Testing Coalesced Status Checks ===")
+    orchestrator = Orchestrator()
+    original = orchestrator._execute_approval_agent
+    gate = threading.Event()
+    executions = []
+
+    def slow_approval(user_input, session_id, extracted=None):
+        executions.append(session_id)
+        gate.wait(5)
+        return original(user_input, session_id, extracted)
+
+    orchestrator._execute_approval_agent = slow_approval
+    results = {}
+
+    def check(session_id, text):
+        results[session_id] = orchestrator.route_message(text, session_id=session_id)
+
+    threads = [
+        threading.Thread(target=check, args=(f"dash-{i}", "Check status of REQ-123" if i % 2 else "where is req-123"))
+        for i in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    while orchestrator.inflight.stats()["shared"] < 5:
+        time.sleep(0.001)
+    gate.set()
+    for thread in threads:
+        thread.join()
+    orchestrator.wait_for_background(timeout=10)
+
+    assert len(executions) == 1
+    assert {r["session_id"] for r in results.values()} == {f"dash-{i}" for i in range(6)}
+    assert sum(1 for r in results.values() if r.get("coalesced")) == 5
+    # One decision, but every caller gets its own reply, turn and execution
+    assert len({r["outcome"]["data"]["current_status"] for r in results.values()}) == 1
+    assert len({r["turn_id"] for r in results.values()}) == 6
+    for session_id, result in results.items():
+        assert f"Session: {session_id[:8]}*" in result["response"]
+        assert result["outcome"]["data"]["session"] == session_id[:8]
+        assert result["execution"]["session_id"] == session_id
+        completed = orchestrator.turn_completion(result["turn_id"]).result(timeout=10)
+        assert completed["execution"]["session_id"] == session_id
+
+    # Requisitions are only coalesced within a session
+    orchestrator._execute_approval_agent = original
+    a = orchestrator.route_message("I need to buy 5 chairs for office", session_id="user-a")
+    b = orchestrator.route_message("I need to buy 5 chairs for office", session_id="user-b")
+    assert not a.get("coalesced") and not b.get("coalesced")
+    orchestrator.wait_for_background(timeout=10)
+
+
+def test_client_coalesces_identical_calls():
+    from backend.watsonx_orchestrate_client import WatsonxOrchestrationClient
+
+    client = WatsonxOrchestrationClient()
+    gate = threading.Event()
+    original = client._mock_invoke_skill
+    calls = []
+
+    def slow_mock(skill_name, skill_input):
+        calls.append(skill_name)
+        gate.wait(5)
+        return original(skill_name, skill_input)
+
+    client._mock_invoke_skill = slow_mock
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(
+            client.invoke_skill("llm_reasoning", {"prompt": "risk?", "context": {"v": 1}})
+        ))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    while client.inflight.stats()["shared"] < 3:
+        time.sleep(0.001)
+    gate.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["llm_reasoning"]
+    assert len(results) == 4
+    assert results[0] == results[1] and results[0] is not results[1]
+
+
+if __name__ == "__main__":
+    test_concurrent_calls_share_one_execution()
+    test_errors_fan_out_to_waiters()
+    test_waiters_respect_their_deadline()
+    test_orchestrator_coalesces_status_checks()
+    test_client_coalesces_identical_calls()
@@ -0,0 +1,75 @@
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+sys.path.append(os.path.join(os.getcwd(), 'orchestrate', 'skills'))
+
+from backend.skill_base import BaseSkill, SkillRegistry, SkillStatus
+
+
+class SlowEchoSkill(BaseSkill):
+    """Per-item skill without a batch implementation"""
+
+    def __init__(self):
+        super().__init__("slow_echo")
+
+    def validate_input(self, input_data):
+        return "value" in input_data
+
+    def _execute_logic(self, input_data):
+        time.sleep(0.1)
+        return {"value": input_data["value"]}
+
+
+def test_batch_skill_single_audit_flush():
+    from validate_vendor import ValidateVendorSkill
+    from backend.security.audit_logger import get_audit_logger
+
+    print("\n=== Testing Batched Vendor Validation ===")
+    audit_logger = get_audit_logger()
+    flushes = []
+    original = audit_logger.flush_events
+    audit_logger.flush_events = lambda events: flushes.append(len(events))
+    try:
+        outputs = ValidateVendorSkill().execute_many([
+            {"vendor_name": "Acme Corp", "tax_id": "98-7654321", "request_id": "v-1"},
+            {"vendor_name": "Acme Corp", "tax_id": "12"},
+            {"vendor_name": "Blocked Supplies", "tax_id": "11-2223334"},
+            {"vendor_name": "Globex", "tax_id": "55-6667778"}
+        ])
+    finally:
+        audit_logger.flush_events = original
+
+    assert [o.status for o in outputs] == [
+        SkillStatus.SUCCESS, SkillStatus.FAILURE, SkillStatus.SUCCESS, SkillStatus.SUCCESS
+    ]
+    assert outputs[0].request_id == "v-1" and outputs[1].error_code == "INVALID_INPUT"
+    assert outputs[2].result["validation_status"] == "rejected"
+    assert outputs[3].result["vendor_name"] == "Globex"
+    assert outputs[0].metadata["batch_size"] == 4
+    assert flushes == [3]
+    print("Audit events flushed in one batch:", flushes)
+
+
+def test_per_item_skills_run_in_parallel():
+    from backend.skill_executor import SkillExecutor
+
+    print("\n=== Testing Parallel execute_many ===")
+    registry = SkillRegistry(executor=SkillExecutor(thread_workers=8))
+    registry.register(SlowEchoSkill())
+
+    started = time.monotonic()
+    outputs = registry.execute_many("slow_echo", [{"value": i} for i in range(8)] + [{}])
+    elapsed = time.monotonic() - started
+    assert [o.result["value"] for o in outputs[:8]] == list(range(8))
+    assert outputs[8].status == SkillStatus.FAILURE
+    assert elapsed < 0.5
+    print(f"8 items in {elapsed * 1000:.0f}ms")
+
+    missing = registry.execute_many("missing", [{}, {}])
+    assert [o.error_code for o in missing] == ["SKILL_NOT_FOUND", "SKILL_NOT_FOUND"]
+
+
+if __name__ == "__main__":
+    test_batch_skill_single_audit_flush()
+    test_per_item_skills_run_in_parallel()
@@ -0,0 +1,108 @@
+import sys
+import os
+import time
+import threading
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+
+from backend.skill_base import BaseSkill, SkillRegistry, SkillStatus
+from backend.deadline import check_deadline
+
+
+class SleepSkill(BaseSkill):
+    """Sleeps in small steps, checking its deadline between them"""
+
+    def __init__(self):
+        super().__init__("sleep")
+        self.stopped = threading.Event()
+
+    def validate_input(self, input_data):
+        return True
+
+    def _execute_logic(self, input_data):
+        end = time.monotonic() + input_data.get("sleep", 0)
+        try:
+            while time.monotonic() < end:
+                check_deadline("sleep")
+                time.sleep(0.01)
+        except TimeoutError:
+            self.stopped.set()
+            raise
+        return {"slept": input_data.get("sleep", 0)}
+
+
+class PidSkill(BaseSkill):
+    """CPU-profile skill reporting the process it ran in"""
+
+    execution_profile = "cpu"
+
+    def __init__(self):
+        super().__init__("pid")
+
+    def validate_input(self, input_data):
+        return True
+
+    def _execute_logic(self, input_data):
+        return {"pid": os.getpid(), "total": sum(range(input_data.get("n", 1000)))}
+
+
+def test_timeouts_are_enforced():
+    from backend.skill_executor import SkillExecutor
+
+    print("\n=== Testing Skill Timeouts ===")
+    executor = SkillExecutor(thread_workers=2)
+    registry = SkillRegistry(executor=executor)
+    skill = SleepSkill()
+    registry.register(skill)
+
+    started = time.monotonic()
+    output = registry.execute_skill("sleep", {"sleep": 5, "timeout_seconds": 0.2})
+    elapsed = time.monotonic() - started
+    assert output.status == SkillStatus.TIMEOUT and output.error_code == "TIMEOUT"
+    assert elapsed < 1.0
+    assert output.metadata["executor"] == "thread" and output.metadata["started"] is True
+    # The skill's deadline was cancelled, so it stopped instead of sleeping on
+    assert skill.stopped.wait(1.0)
+    print(f"Timed out after {elapsed * 1000:.0f}ms")
+
+    ok = registry.execute_skill("sleep", {"sleep": 0.01})
+    assert ok.status == SkillStatus.SUCCESS
+    assert ok.metadata["run_time_ms"] > 0 and ok.metadata["queue_wait_ms"] >= 0
+    executor.shutdown()
+
+
+def test_queue_wait_reported_separately():
+    from backend.skill_executor import SkillExecutor
+
+    print("\n=== Testing Queue Wait Reporting ===")
+    executor = SkillExecutor(thread_workers=1)
+    skill = SleepSkill()
+    blocker = threading.Thread(target=executor.execute, args=(skill, {"sleep": 0.3}))
+    blocker.start()
+    time.sleep(0.05)
+    starved = executor.execute(skill, {"sleep": 0.01, "timeout_seconds": 0.05})
+    output = executor.execute(skill, {"sleep": 0.01})
+    blocker.join()
+    assert starved.status == SkillStatus.TIMEOUT and starved.metadata["started"] is False
+    assert output.status == SkillStatus.SUCCESS
+    assert output.metadata["queue_wait_ms"] > 100
+    assert output.metadata["run_time_ms"] < output.metadata["queue_wait_ms"]
+    print(f"Queued {output.metadata['queue_wait_ms']:.0f}ms, ran {output.metadata['run_time_ms']:.0f}ms")
+    executor.shutdown()
+
+
+def test_cpu_skills_run_in_processes():
+    from backend.skill_executor import SkillExecutor
+
+    print("\n=== Testing Process Pool Skills ===")
+    executor = SkillExecutor(thread_workers=1, process_workers=1)
+    output = executor.execute(PidSkill(), {"n": 10000})
+    assert output.status == SkillStatus.SUCCESS, output.error_message
+    assert output.metadata["executor"] == "process"
+    assert output.result["pid"] != os.getpid() and output.result["total"] == sum(range(10000))
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    test_timeouts_are_enforced()
+    test_queue_wait_reported_separately()
+    test_cpu_skills_run_in_processes()
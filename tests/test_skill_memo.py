@@ -0,0 +1,96 @@
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+sys.path.append(os.path.join(os.getcwd(), 'orchestrate', 'skills'))
+
+from backend.skill_base import BaseSkill, SkillStatus
+
+
+class CountingSkill(BaseSkill):
+    memoize = True
+    memo_max_entries = 2
+    memo_ttl_seconds = 0.2
+
+    def __init__(self):
+        super().__init__("counting")
+        self.calls = 0
+
+    def validate_input(self, input_data):
+        return "x" in input_data
+
+    def _execute_logic(self, input_data):
+        self.calls += 1
+        return {"double": input_data["x"] * 2}
+
+
+def test_memoized_catalog_search():
+    from search_catalog import SearchCatalogSkill
+
+    print("\n=== Testing Memoized Catalog Search ===")
+    skill = SearchCatalogSkill()
+    first = skill.execute({"query": "laptop", "request_id": "r-1"})
+    second = skill.execute({"query": "laptop", "request_id": "r-2"})
+    assert first.metadata["cache_hit"] is False and second.metadata["cache_hit"] is True
+    assert second.request_id == "r-2" and second.result == first.result
+
+    # Callers get copies: mutating a result does not poison the cache
+    second.result["results"].clear()
+    assert skill.execute({"query": "laptop"}).result["results_count"] == 1
+
+    skill.set_catalog(skill.catalog + [{"id": "8", "name": "Laptop Stand", "price": 40, "category": "Accessories"}])
+    refreshed = skill.execute({"query": "laptop"})
+    assert refreshed.metadata["cache_hit"] is False and refreshed.result["results_count"] == 2
+    assert refreshed.metadata["data_version"] != first.metadata["data_version"]
+
+
+def test_memo_hits_are_audited():
+    from search_catalog import SearchCatalogSkill
+
+    class RecordingAuditLogger:
+        def __init__(self):
+            self.events = []
+
+        def log_event(self, **event):
+            self.events.append(event)
+
+    skill = SearchCatalogSkill()
+    skill.audit_logger = RecordingAuditLogger()
+    skill.execute({"query": "desk"})
+    skill.execute({"query": "desk"})
+    assert [event["details"]["cache_hit"] for event in skill.audit_logger.events] == [False, True]
+    assert skill.audit_logger.events[0]["details"]["results"] == skill.audit_logger.events[1]["details"]["results"]
+
+
+def test_lru_ttl_and_batches():
+    from validate_vendor import ValidateVendorSkill
+
+    print("\n=== Testing Memo Eviction and Batches ===")
+    skill = CountingSkill()
+    for x in (1, 2, 1, 3, 1):
+        assert skill.execute({"x": x}).result == {"double": x * 2}
+    # 1 stays hot; 2 was evicted when 3 arrived
+    assert skill.calls == 3
+    skill.execute({"x": 2})
+    assert skill.calls == 4
+    time.sleep(0.25)
+    assert skill.execute({"x": 2}).metadata["cache_hit"] is False
+
+    invalid = skill.execute({})
+    assert invalid.status == SkillStatus.FAILURE
+
+    vendors = [{"vendor_name": f"Vendor {i}", "tax_id": "12-3456789"} for i in range(3)]
+    validator = ValidateVendorSkill()
+    cold = validator.execute_many(vendors)
+    warm = validator.execute_many(vendors)
+    assert [o.metadata["cache_hit"] for o in cold] == [False] * 3
+    assert [o.metadata["cache_hit"] for o in warm] == [True] * 3
+    assert [o.result["vendor_id"] for o in cold] == [o.result["vendor_id"] for o in warm]
+    assert validator.execute(vendors[0]).metadata["cache_hit"] is True
+    print("Vendor ids:", [o.result["vendor_id"] for o in warm])
+
+
+if __name__ == "__main__":
+    test_memoized_catalog_search()
+    test_memo_hits_are_audited()
+    test_lru_ttl_and_batches()
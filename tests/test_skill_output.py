@@ -0,0 +1,61 @@
+import sys
+import os
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+
+from backend.skill_base import BaseSkill, SkillOutput, SkillStatus
+
+
+class EchoSkill(BaseSkill):
+    def __init__(self):
+        super().__init__("echo")
+
+    def validate_input(self, input_data):
+        return "value" in input_data
+
+    def _execute_logic(self, input_data):
+        return {"value": input_data["value"]}
+
+
+def test_trusted_output_matches_validated():
+    print("\n=== Testing Trusted SkillOutput ===")
+    fields = {
+        "skill_name": "echo",
+        "status": SkillStatus.SUCCESS,
+        "request_id": "r-1",
+        "result": {"value": 1},
+        "execution_time_ms": 0.5
+    }
+    validated = SkillOutput(**fields)
+    trusted = SkillOutput.trusted(**fields, timestamp=validated.timestamp)
+    assert trusted.model_dump() == validated.model_dump()
+    assert trusted.model_dump_json() == validated.model_dump_json()
+    assert trusted.status == SkillStatus.SUCCESS and trusted.metadata is None
+    assert SkillOutput.trusted(**fields).timestamp is not None
+
+    # A plain object until it crosses an API boundary
+    assert not isinstance(trusted, SkillOutput)
+    assert isinstance(trusted.to_output(), SkillOutput) and trusted.to_output() == validated
+    assert trusted == validated
+    trusted.metadata = {"executor": "thread"}
+    assert trusted.to_output().metadata == {"executor": "thread"}
+
+
+def test_skill_outputs_skip_validation_by_default():
+    print("\n=== Testing validate_outputs ===")
+    skill = EchoSkill()
+    fast = skill.execute({"value": 2, "request_id": "r-2"})
+    assert fast.status == SkillStatus.SUCCESS and fast.result == {"value": 2}
+    assert fast.request_id == "r-2"
+
+    skill.validate_outputs = True
+    checked = skill.execute({"value": 2, "request_id": "r-2"})
+    assert checked.model_dump(exclude={"timestamp", "execution_time_ms"}) == \
+        fast.model_dump(exclude={"timestamp", "execution_time_ms"})
+
+    # Failures keep the validated path
+    assert skill.execute({}).error_code == "INVALID_INPUT"
+
+
+if __name__ == "__main__":
+    test_trusted_output_matches_validated()
+    test_skill_outputs_skip_validation_by_default()
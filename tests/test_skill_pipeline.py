@@ -0,0 +1,110 @@
+import sys
+import os
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+sys.path.append(os.path.join(os.getcwd(), 'orchestrate', 'skills'))
+
+from backend.skill_base import BaseSkill, SkillPipeline, SkillRegistry, SkillStatus
+
+CONTRACT = "Vendor Name: {name}\nTax ID: 12-3456789\nContract Value: $4,500"
+
+
+def build_pipeline():
+    from extract_contract_data import ExtractContractDataSkill
+    from validate_vendor import ValidateVendorSkill
+    from send_notification import SendNotificationSkill
+
+    registry = SkillRegistry()
+    registry.register(ValidateVendorSkill())
+    return (
+        SkillPipeline("vendor_intake", registry=registry)
+        .stage(ExtractContractDataSkill())
+        .stage(
+            "validate_vendor",
+            inputs={"vendor_name": "extracted_data.vendor_name", "tax_id": "extracted_data.tax_id"},
+            output="validation",
+            stop_if=lambda ctx: ctx["validation"]["validation_status"] == "rejected"
+        )
+        .stage(
+            SendNotificationSkill(),
+            inputs=lambda ctx: {
+                "recipient": "procurement@example.com",
+                "message": f"Vendor {ctx['validation']['vendor_id']} approved"
+            },
+            output="notification",
+            when=lambda ctx: ctx.get("notify", True)
+        )
+    )
+
+
+def test_pipeline_runs_and_short_circuits():
+    print("\n=== Testing Skill Pipeline ===")
+    pipeline = build_pipeline()
+
+    initial = {"contract_text": CONTRACT.format(name="Acme Corp")}
+    output = pipeline.run(initial)
+    assert output.status == SkillStatus.SUCCESS, output.error_message
+    assert output.skill_name == "vendor_intake"
+    assert output.result["validation"]["validation_status"] == "approved"
+    assert output.result["notification"]["status"] == "sent"
+    assert initial == {"contract_text": CONTRACT.format(name="Acme Corp")}
+    trace = output.metadata["trace"]
+    assert [entry["stage"] for entry in trace] == ["extract_contract_data", "validate_vendor", "send_notification"]
+    assert all(entry["status"] == "success" and entry["time_ms"] >= 0 for entry in trace)
+    print("Trace:", [(entry["stage"], entry["time_ms"]) for entry in trace])
+
+    blocked = pipeline.run({"contract_text": CONTRACT.format(name="Blocked Trading")})
+    assert blocked.status == SkillStatus.SUCCESS
+    assert blocked.metadata["stopped_at"] == "validate_vendor"
+    assert "notification" not in blocked.result and len(blocked.metadata["trace"]) == 2
+
+    quiet = pipeline.run({"contract_text": CONTRACT.format(name="Acme Corp"), "notify": False})
+    assert quiet.metadata["trace"][-1]["status"] == "skipped"
+
+
+def test_pipeline_edges_and_errors():
+    print("\n=== Testing Pipeline Validation and Errors ===")
+    pipeline = build_pipeline()
+
+    failed = pipeline.run({"contract_text": "   "})
+    assert failed.status == SkillStatus.ERROR and failed.metadata["trace"][0]["status"] == "error"
+
+    # Nothing extracted: the middle stage fails and the pipeline reports where
+    broken = pipeline.run({"contract_text": "no recognizable fields"})
+    assert broken.status == SkillStatus.ERROR
+    assert broken.metadata["trace"][-1]["stage"] == "validate_vendor"
+
+    # A skill that writes to its input does not change the shared context
+    class ScribblingSkill(BaseSkill):
+        def __init__(self):
+            super().__init__("scribble")
+
+        def validate_input(self, input_data):
+            return True
+
+        def _execute_logic(self, input_data):
+            seen = input_data["contract_text"]
+            input_data["contract_text"] = "overwritten"
+            input_data["scratch"] = True
+            return {"seen": seen}
+
+    scribbled = (
+        SkillPipeline("scribble", registry=SkillRegistry())
+        .stage(ScribblingSkill(), output="first")
+        .stage(ScribblingSkill(), output="second")
+        .run({"contract_text": "original"})
+    )
+    assert scribbled.status == SkillStatus.SUCCESS
+    assert scribbled.result["contract_text"] == "original" and "scratch" not in scribbled.result
+    assert scribbled.result["second"] == {"seen": "original"}
+
+    try:
+        SkillPipeline("missing", registry=SkillRegistry()).stage("nope")
+    except ValueError as e:
+        print("Rejected:", e)
+    else:
+        raise AssertionError("Expected unknown skill to be rejected")
+
+
+if __name__ == "__main__":
+    test_pipeline_runs_and_short_circuits()
+    test_pipeline_edges_and_errors()
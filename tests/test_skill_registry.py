@@ -0,0 +1,75 @@
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+sys.path.append(os.path.join(os.getcwd(), 'orchestrate', 'skills'))
+
+from backend.skill_base import SkillRegistry, SkillStatus
+
+PLUGIN = '''
+from backend.skill_base import BaseSkill
+
+CREATED = []
+
+
+class {cls}(BaseSkill):
+    def __init__(self):
+        super().__init__("{name}")
+        CREATED.append(self)
+
+    def validate_input(self, input_data):
+        return True
+
+    def _execute_logic(self, input_data):
+        return {{"instances": len(CREATED)}}
+'''
+
+
+def test_lazy_plugin_discovery():
+    print("\n=== Testing Lazy Skill Discovery ===")
+    skills_dir = tempfile.mkdtemp()
+    with open(os.path.join(skills_dir, "lazy_alpha.py"), "w") as f:
+        f.write(PLUGIN.format(cls="AlphaSkill", name="lazy_alpha"))
+    with open(os.path.join(skills_dir, "lazy_beta.py"), "w") as f:
+        f.write(PLUGIN.format(cls="BetaSkill", name="lazy_beta"))
+    with open(os.path.join(skills_dir, "lazy_broken.py"), "w") as f:
+        f.write("raise RuntimeError('broken plugin')\n")
+
+    registry = SkillRegistry(skills_dir=skills_dir)
+    assert registry.skills == {}
+
+    alpha = registry.get_skill("lazy_alpha")
+    assert alpha is not None and registry.get_skill("lazy_alpha") is alpha
+    assert "orchestrate.skills.lazy_beta" not in sys.modules
+    assert registry.get_skill("missing") is None
+
+    first = registry.execute_skill("lazy_alpha", {})
+    second = registry.execute_skill("lazy_alpha", {})
+    assert first.status == SkillStatus.SUCCESS and second.result == {"instances": 1}
+
+    assert set(registry.list_skills()) == {"lazy_alpha", "lazy_beta"}
+    print("Discovered:", sorted(registry.list_skills()))
+
+
+def test_legacy_wrappers_share_warm_instances():
+    from backend.skill_base import get_skill_registry
+    from send_notification import send_notification
+    from check_budget import check_budget
+
+    print("\n=== Testing Warm Legacy Wrappers ===")
+    first = send_notification("manager@example.com", "Approval needed for REQ-1")
+    second = send_notification("manager@example.com", "Approval needed for REQ-2")
+    assert first["status"] == "success" and second["status"] == "success"
+    assert first["result"]["notification_id"] != second["result"]["notification_id"]
+
+    registry = get_skill_registry()
+    budget_skill = registry.get_skill("check_budget")
+    assert check_budget("IT", 1000)["result"]["approved"] is True
+    assert registry.get_skill("check_budget") is budget_skill
+    assert {"check_budget", "validate_vendor", "search_catalog"} <= set(registry.list_skills())
+    print("Notification ids:", first["result"]["notification_id"], second["result"]["notification_id"])
+
+
+if __name__ == "__main__":
+    test_lazy_plugin_discovery()
+    test_legacy_wrappers_share_warm_instances()
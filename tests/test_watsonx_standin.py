@@ -0,0 +1,66 @@
+import sys
+import os
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+
+from backend.watsonx_standin import create_standin_app, StandinConfig, LatencyModel
+
+
+def test_standin_endpoints():
+    print("\n=== Testing watsonx Stand-in Endpoints ===")
+    app = create_standin_app(StandinConfig(seed=1))
+    client = app.test_client()
+
+    executed = client.post(
+        "/v2/agents/requisition_agent/workflows/purchase_request_workflow/execute",
+        json={"input": {"user_input": "buy 5 chairs"}, "executionMode": "async"}
+    )
+    assert executed.status_code == 200
+    execution_id = executed.get_json()["executionId"]
+    print(f"Execution: {execution_id}")
+
+    status = client.get(f"/v2/agents/requisition_agent/executions/{execution_id}").get_json()
+    assert status["status"] == "success"
+    assert status["progress"] == 100
+
+    reasoning = client.post("/v2/skills/llm_reasoning/invoke", json={"input": {"prompt": "x"}}).get_json()
+    assert reasoning["decision"] == "approve"
+
+    assert client.post("/v2/agents/approval_agent/route", json={}).get_json()["target_agent"] == "approval_agent"
+    assert len(client.get("/v2/agents").get_json()["agents"]) == 5
+    assert client.get("/v2/agents/vendor_agent/status").get_json()["status"] == "active"
+    assert client.get("/v2/agents/vendor_agent/executions/missing").status_code == 404
+
+
+def test_standin_fault_injection():
+    print("\n=== Testing watsonx Stand-in Faults ===")
+    failing = create_standin_app(StandinConfig(error_rate=1.0, seed=1)).test_client()
+    assert failing.get("/v2/agents").status_code == 503
+
+    throttled = create_standin_app(StandinConfig(rate_limit=0.001, burst=1)).test_client()
+    assert throttled.get("/v2/agents").status_code == 200
+    limited = throttled.get("/v2/agents")
+    assert limited.status_code == 429
+    assert "Retry-After" in limited.headers
+
+    stats = throttled.get("/_standin/stats").get_json()
+    print(f"Stats: {stats}")
+    assert stats["throttled"] == 1
+
+
+def test_latency_models():
+    import random
+    rng = random.Random(3)
+    assert LatencyModel("fixed:12").sample_ms(rng) == 12
+    assert 20 <= LatencyModel("uniform:20,80").sample_ms(rng) <= 80
+    assert LatencyModel("lognormal:40,0.5").sample_ms(rng) > 0
+    try:
+        LatencyModel("pareto:1")
+        assert False, "unknown distribution should be rejected"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    test_standin_endpoints()
+    test_standin_fault_injection()
+    test_latency_models()
@@ -0,0 +1,234 @@
+import sys
+import os
+import json
+import time
+import tempfile
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+
+
+def test_purchase_request_branches():
+    from backend.skill_base import SkillRegistry
+    from backend.workflow_engine import WorkflowEngine
+
+    print("\n=== Testing Purchase Request Workflow ===")
+    engine = WorkflowEngine(registry=SkillRegistry())
+    engine.register_action("check_budget", lambda ctx: {"budget_available": ctx["amount"] <= 1000})
+    engine.register_action("validate_policy", lambda ctx: {"policy_passed": True})
+
+    approved = engine.run("purchase_request_workflow", {"amount": 500})
+    print("Approved path:", [s.step_id for s in approved.steps], "skipped:", approved.skipped)
+    assert approved.status == "completed"
+    assert [s.step_id for s in approved.steps] == ["req_1", "req_2", "req_3", "req_4", "req_5"]
+    assert set(approved.skipped) == {"req_budget_fail", "req_policy_fail"}
+
+    rejected = engine.run("purchase_request_workflow", {"amount": 5000})
+    print("Rejected path:", [s.step_id for s in rejected.steps])
+    assert [s.step_id for s in rejected.steps] == ["req_1", "req_2", "req_budget_fail"]
+    assert all(s.duration_ms >= 0 for s in rejected.steps)
+
+
+def test_purchase_request_with_budget_skill():
+    sys.path.append(os.path.join(os.getcwd(), 'orchestrate', 'skills'))
+    from backend.skill_base import SkillRegistry
+    from backend.budget_ledger import BudgetLedger
+    from backend.workflow_engine import WorkflowEngine, WorkflowDefinitionError
+    from check_budget import CheckBudgetSkill
+
+    print("\n=== Testing Purchase Request Workflow with check_budget ===")
+    registry = SkillRegistry()
+    registry.register(CheckBudgetSkill(ledger=BudgetLedger({"IT": 1000})))
+    engine = WorkflowEngine(registry=registry)
+    engine.register_action("validate_policy", lambda ctx: {"policy_passed": ctx["amount"] <= 800})
+
+    # The skill answers "approved"; the workflow maps it to budget_available
+    approved = engine.run("purchase_request_workflow", {"department_id": "IT", "amount": 500})
+    assert approved.context["budget_available"] is True
+    assert [s.step_id for s in approved.steps] == ["req_1", "req_2", "req_3", "req_4", "req_5"]
+    over = engine.run("purchase_request_workflow", {"department_id": "IT", "amount": 5000})
+    assert [s.step_id for s in over.steps] == ["req_1", "req_2", "req_budget_fail"]
+
+    # Actions with no handler or skill are reported, not silently passed over
+    assert engine.load("purchase_request_workflow").unbound == [
+        "intake_request", "route_for_approval", "notify_approvers",
+        "suggest_budget_adjustment", "notify_policy_violation"
+    ]
+    assert approved.to_dict()["unbound_actions"] == engine.load("purchase_request_workflow").unbound
+
+    strict = WorkflowEngine(registry=registry, strict=True)
+    try:
+        strict.load("purchase_request_workflow")
+        assert False, "unbound actions should fail a strict engine"
+    except WorkflowDefinitionError as e:
+        assert "intake_request" in str(e)
+
+
+def test_compiled_workflow_is_cached():
+    from backend.skill_base import SkillRegistry
+    from backend.workflow_engine import WorkflowEngine
+
+    engine = WorkflowEngine(registry=SkillRegistry())
+    first = engine.load("supplier_onboarding_workflow")
+    assert engine.load("supplier_onboarding_workflow") is first
+    assert "procurement_workflow" in engine.list_workflows()
+    linear = engine.run("procurement_workflow")
+    assert [s.step_id for s in linear.steps] == [
+        "vendor_onboarding", "requisition_creation", "compliance_check", "approval"
+    ]
+
+
+def test_parallel_branches_and_validation():
+    from backend.skill_base import SkillRegistry
+    from backend.workflow_engine import WorkflowEngine, WorkflowDefinitionError
+
+    print("\n=== Testing Parallel Branches ===")
+    workflows_dir = tempfile.mkdtemp()
+    with open(os.path.join(workflows_dir, "fan-out.json"), "w") as f:
+        json.dump({"workflow_name": "Fan Out", "steps": [
+            {"id": "start", "action": "noop", "next": ["a", "b"]},
+            {"id": "a", "action": "slow_a", "next": "join"},
+            {"id": "b", "action": "slow_b", "next": "join"},
+            {"id": "join", "action": "noop", "next": "end"}
+        ]}, f)
+    with open(os.path.join(workflows_dir, "cyclic.json"), "w") as f:
+        json.dump({"steps": [
+            {"id": "x", "action": "noop", "next": "y"},
+            {"id": "y", "action": "noop", "next": "x"}
+        ]}, f)
+
+    engine = WorkflowEngine(registry=SkillRegistry(), workflows_dir=workflows_dir)
+    engine.register_action("slow_a", lambda ctx: time.sleep(0.2) or {"a": True})
+    engine.register_action("slow_b", lambda ctx: time.sleep(0.2) or {"b": True})
+
+    run = engine.run("fan_out")
+    print(f"Fan-out finished in {run.duration_ms:.0f}ms")
+    assert run.status == "completed"
+    assert run.context["a"] and run.context["b"]
+    assert run.steps[-1].step_id == "join"
+    assert run.duration_ms < 380
+
+    try:
+        engine.load("cyclic")
+        assert False, "cycle should be rejected"
+    except WorkflowDefinitionError as e:
+        print("Rejected:", e)
+
+
+def test_error_handler_runs():
+    from backend.skill_base import SkillRegistry
+    from backend.workflow_engine import WorkflowEngine
+
+    engine = WorkflowEngine(registry=SkillRegistry())
+    notified = []
+
+    def fail(ctx):
+        raise ValueError("missing tax id")
+
+    engine.register_action("validate_data", fail)
+    engine.register_action("notify_user_retry", lambda ctx: notified.append(ctx["error"]) or {"retry": True})
+
+    run = engine.run("supplier_onboarding_workflow")
+    assert run.status == "failed"
+    assert run.context["failed_step"] == "step_2"
+    assert run.context["retry"] is True
+    assert notified[0]["message"] == "missing tax id"
+    assert "step_3" in run.skipped
+
+
+class SimulatedCrash(BaseException):
+    """Escapes step error handling, like the process dying mid-run"""
+
+
+def test_checkpoint_suspend_and_resume():
+    from backend.skill_base import SkillRegistry
+    from backend.checkpoint_store import CheckpointStore
+    from backend.workflow_engine import WorkflowEngine, WorkflowSuspended
+
+    print("\n=== Testing Checkpoint Suspend/Resume ===")
+    checkpoint_dir = tempfile.mkdtemp()
+
+    def route_for_approval(ctx):
+        if "manager_decision" not in ctx:
+            raise WorkflowSuspended("awaiting manager approval")
+        return {"approved": ctx["manager_decision"] == "approve"}
+
+    def build_engine(store):
+        engine = WorkflowEngine(registry=SkillRegistry(), checkpoint_store=store)
+        engine.register_action("check_budget", lambda ctx: {"budget_available": True})
+        engine.register_action("validate_policy", lambda ctx: {"policy_passed": True})
+        engine.register_action("route_for_approval", route_for_approval)
+        return engine
+
+    store = CheckpointStore(checkpoint_dir, fsync=False)
+    run = build_engine(store).run("purchase_request_workflow", {"amount": 500}, execution_id="exec-1")
+    assert run.status == "suspended"
+    assert run.steps[-1].status == "waiting"
+    store.close()
+
+    # New process: the suspended execution is recovered but not auto-resumed
+    store = CheckpointStore(checkpoint_dir, fsync=False)
+    engine = build_engine(store)
+    assert engine.resume_incomplete() == []
+    resumed = engine.resume("exec-1", {"manager_decision": "approve"})
+    print("Resumed steps:", [s.step_id for s in resumed.steps])
+    assert resumed.status == "completed"
+    assert resumed.context["approved"] is True
+    assert [s.step_id for s in resumed.steps if s.status == "success"] == [
+        "req_1", "req_2", "req_3", "req_4", "req_5"
+    ]
+    store.close()
+
+    store = CheckpointStore(checkpoint_dir, fsync=False)
+    assert store.get("exec-1")["status"] == "completed"
+    assert store.incomplete() == []
+    store.close()
+
+
+def test_resume_after_crash_skips_finished_work():
+    from backend.skill_base import SkillRegistry
+    from backend.checkpoint_store import CheckpointStore
+    from backend.workflow_engine import WorkflowEngine
+
+    print("\n=== Testing Crash Recovery ===")
+    checkpoint_dir = tempfile.mkdtemp()
+    calls = []
+
+    def crash(ctx):
+        if ctx.get("crash"):
+            raise SimulatedCrash()
+        return {}
+
+    store = CheckpointStore(checkpoint_dir, fsync=False)
+    engine = WorkflowEngine(registry=SkillRegistry(), checkpoint_store=store)
+    engine.register_action("collect_vendor_data", lambda ctx: calls.append("collect") or {"collected": True})
+    engine.register_action("validate_data", crash)
+    engine.run("supplier_onboarding_workflow", execution_id="done-1")
+    try:
+        engine.run("supplier_onboarding_workflow", {"crash": True}, execution_id="crashed-1")
+    except SimulatedCrash:
+        pass
+    store.close()
+    assert calls == ["collect", "collect"]
+
+    store = CheckpointStore(checkpoint_dir, fsync=False)
+    engine = WorkflowEngine(registry=SkillRegistry(), checkpoint_store=store)
+    engine.register_action("collect_vendor_data", lambda ctx: calls.append("collect") or {"collected": True})
+    engine.register_action("check_sanctions_and_policy", lambda ctx: {"compliance_passed": True})
+
+    # Only the interrupted execution is resumed, from the step that crashed
+    resumed = engine.resume_incomplete()
+    print("Resumed:", [(r.execution_id, r.status) for r in resumed])
+    assert [r.execution_id for r in resumed] == ["crashed-1"]
+    assert resumed[0].status == "completed"
+    assert resumed[0].context["collected"] is True
+    assert calls == ["collect", "collect"]
+    store.close()
+
+
+if __name__ == "__main__":
+    test_purchase_request_branches()
+    test_purchase_request_with_budget_skill()
+    test_compiled_workflow_is_cached()
+    test_parallel_branches_and_validation()
+    test_error_handler_runs()
+    test_checkpoint_suspend_and_resume()
+    test_resume_after_crash_skips_finished_work()